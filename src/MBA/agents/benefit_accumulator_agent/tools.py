@@ -14,6 +14,7 @@ The tool supports:
 - Comprehensive error handling
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -180,12 +181,16 @@ async def get_benefit_accumulator(params: Dict[str, Any]) -> Dict[str, Any]:
             sql_params = {"member_id": member_id}
             logger.debug(f"Executing benefit lookup for member {member_id}, all services")
 
-        # Execute query
-        try:
+        def _fetch_rows():
             with connect() as conn:
                 logger.debug("Connected to database, executing query")
-                results = conn.execute(text(query_sql), sql_params).fetchall()
-                logger.debug(f"Database query executed successfully, got {len(results)} rows")
+                return conn.execute(text(query_sql), sql_params).fetchall()
+
+        # Execute query in a worker thread so the blocking driver call
+        # does not stall other coroutines on the event loop
+        try:
+            results = await asyncio.to_thread(_fetch_rows)
+            logger.debug(f"Database query executed successfully, got {len(results)} rows")
         except Exception as conn_error:
             logger.error(f"Database connection failed: {str(conn_error)}")
             raise
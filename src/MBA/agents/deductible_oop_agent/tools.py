@@ -15,6 +15,7 @@ The tool supports:
 - Comprehensive error handling
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -181,12 +182,16 @@ async def get_deductible_oop(params: Dict[str, Any]) -> Dict[str, Any]:
 
         logger.debug(f"Executing deductible/OOP query for member {member_id}")
 
-        # Execute query
-        try:
+        def _fetch_rows():
             with connect() as conn:
                 logger.debug("Connected to database, executing query")
-                results = conn.execute(text(query_sql)).fetchall()
-                logger.debug(f"Database query executed successfully, got {len(results)} rows")
+                return conn.execute(text(query_sql)).fetchall()
+
+        # Execute query in a worker thread so the blocking driver call
+        # does not stall other coroutines on the event loop
+        try:
+            results = await asyncio.to_thread(_fetch_rows)
+            logger.debug(f"Database query executed successfully, got {len(results)} rows")
         except Exception as conn_error:
             logger.error(f"Database connection failed: {str(conn_error)}")
             raise
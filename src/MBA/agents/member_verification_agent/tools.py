@@ -13,6 +13,7 @@ The tool supports:
 - Comprehensive error handling
 """
 
+import asyncio
 from typing import Dict, Any, Optional
 from datetime import date
 from sqlalchemy import text
@@ -163,13 +164,17 @@ async def verify_member(params: Dict[str, Any]) -> Dict[str, Any]:
         logger.debug(f"Executing verification query with {len(sql_params)} parameters")
         logger.debug(f"Query: {query_sql[:100]}...")
 
-        # Execute query
-        logger.debug("Establishing database connection for verification")
-        try:
+        def _fetch_member():
             with connect() as conn:
                 logger.debug(f"Connected to database, executing query")
-                result = conn.execute(text(query_sql), sql_params).fetchone()
-                logger.debug("Database query executed successfully")
+                return conn.execute(text(query_sql), sql_params).fetchone()
+
+        # Execute query in a worker thread: the driver blocks, and batch
+        # verification runs many of these concurrently on one event loop
+        logger.debug("Establishing database connection for verification")
+        try:
+            result = await asyncio.to_thread(_fetch_member)
+            logger.debug("Database query executed successfully")
         except Exception as conn_error:
             logger.error(f"Database connection failed: {str(conn_error)}")
             raise
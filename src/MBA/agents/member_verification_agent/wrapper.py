@@ -17,10 +17,13 @@ Usage:
     result = await agent.verify_member(member_id="M12345", dob="1990-01-01")
 """
 
+import asyncio
+from collections import Counter
 from typing import Dict, Any, Optional
 from datetime import date
 
 from ...core.logging_config import get_logger
+from ...core.settings import settings
 from ...core.exceptions import ConfigError, DatabaseError, AgentError, ValidationError
 
 logger = get_logger(__name__)
@@ -295,7 +298,8 @@ class MemberVerificationAgent:
     
     async def verify_member_batch(
         self,
-        members: list[Dict[str, Any]]
+        members: list[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> list[Dict[str, Any]]:
         """
         Verify multiple members in batch operation.
@@ -304,9 +308,16 @@ class MemberVerificationAgent:
         collecting results for all members. Continues processing on
         individual failures to maximize throughput.
         
+        Verifications run concurrently with asyncio.gather, bounded by a
+        semaphore so the batch never needs more database connections than
+        the pool can hand out. Members with identical parameters are
+        verified once and each gets its own copy of the result.
+        
         Args:
             members: List of parameter dictionaries, each containing
                 member_id, dob, and/or name
+            max_concurrency: Verifications in flight at once (default:
+                rds_pool_size + rds_pool_max_overflow)
                 
         Returns:
             List of verification result dictionaries in same order as input
@@ -321,31 +332,63 @@ class MemberVerificationAgent:
             - Executes multiple SQL queries
             - Logs batch processing progress
         """
-        logger.info(f"Batch verification requested: {len(members)} members")
+        # Collapse repeated parameter sets (common when member lists are
+        # merged from several sources) so each is queried only once
+        unique_index: Dict[Any, int] = {}
+        unique_members: list[Dict[str, Any]] = []
+        positions: list[int] = []
+        for member_params in members:
+            try:
+                key = frozenset(member_params.items())
+            except TypeError:
+                # Unhashable values: verify this entry on its own
+                key = object()
+            if key not in unique_index:
+                unique_index[key] = len(unique_members)
+                unique_members.append(member_params)
+            positions.append(unique_index[key])
         
-        results = []
+        logger.info(
+            f"Batch verification requested: {len(members)} members "
+            f"({len(unique_members)} unique)"
+        )
         
-        for idx, member_params in enumerate(members, 1):
-            logger.debug(f"Processing member {idx}/{len(members)}")
-            
-            try:
-                result = await self.verify_member(**member_params)
-                results.append(result)
+        if max_concurrency is None:
+            max_concurrency = settings.rds_pool_size + settings.rds_pool_max_overflow
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def _verify_one(idx: int, member_params: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                logger.debug(f"Processing member {idx}/{len(unique_members)}")
                 
-            except ValidationError as e:
-                logger.warning(f"Invalid parameters for member {idx}: {str(e)}")
-                results.append({"error": f"Invalid parameters: {str(e)}"})
-            
-            except Exception as e:
-                logger.error(f"Failed to verify member {idx}: {str(e)}")
-                results.append({"error": f"Verification failed: {str(e)}"})
+                try:
+                    return await self.verify_member(**member_params)
+                    
+                except ValidationError as e:
+                    logger.warning(f"Invalid parameters for member {idx}: {str(e)}")
+                    return {"error": f"Invalid parameters: {str(e)}"}
+                
+                except Exception as e:
+                    logger.error(f"Failed to verify member {idx}: {str(e)}")
+                    return {"error": f"Verification failed: {str(e)}"}
+        
+        # gather preserves input order
+        unique_results = await asyncio.gather(*(
+            _verify_one(idx, member_params)
+            for idx, member_params in enumerate(unique_members, 1)
+        ))
+        results = [dict(unique_results[position]) for position in positions]
         
+        outcomes = Counter(
+            "successful" if r.get("valid") else "errors" if "error" in r else "failed"
+            for r in results
+        )
         logger.info(
             f"Batch verification complete: {len(results)} processed",
             extra={
-                "successful": sum(1 for r in results if r.get("valid")),
-                "failed": sum(1 for r in results if not r.get("valid") and "error" not in r),
-                "errors": sum(1 for r in results if "error" in r)
+                "successful": outcomes["successful"],
+                "failed": outcomes["failed"],
+                "errors": outcomes["errors"]
             }
         )
         
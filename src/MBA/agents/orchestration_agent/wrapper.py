@@ -513,17 +513,21 @@ class OrchestrationAgent:
 
         logger.info(f"Batch orchestration requested for {len(queries)} queries")
 
+        # Sequential on purpose: process_query reads and clears the
+        # module-level tool results cache, so concurrent queries would
+        # pick up each other's results
         results = []
         for idx, query in enumerate(queries, 1):
             logger.info(f"Processing query {idx}/{len(queries)}")
             result = await self.process_query(query, context, preserve_history=False)
             results.append(result)
 
+        successful = sum(1 for r in results if r.get("success"))
         logger.info(
             f"Batch orchestration completed: {len(results)} results",
             extra={
-                "successful": sum(1 for r in results if r.get("success")),
-                "failed": sum(1 for r in results if not r.get("success"))
+                "successful": successful,
+                "failed": len(results) - successful
             }
         )
 
@@ -65,6 +65,8 @@ class Settings(BaseSettings):
             csv_data_dir (Path): Local CSV directory (default: "data/csv")
             csv_chunk_size (int): Rows per batch insert (default: 1000)
             csv_encoding (str): Default CSV encoding (default: "utf-8")
+            csv_use_local_infile (bool): Bulk-load CSVs with LOAD DATA LOCAL
+                INFILE; the server must allow local_infile (default: False)
             
         Logging Configuration:
             log_level (str): Minimum log level (default: "INFO")
@@ -115,6 +117,7 @@ class Settings(BaseSettings):
     csv_data_dir: Path = Path("data/csv")
     csv_chunk_size: int = 1000
     csv_encoding: str = "utf-8"
+    csv_use_local_infile: bool = False
 
     # ---------------- Logging ----------------
     log_level: str = "INFO"
@@ -25,12 +25,16 @@ Endpoints:
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, status, BackgroundTasks
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 import tempfile
 import shutil
 import uuid
+import time
+import io
+import os
 from datetime import datetime
 
 from MBA.core.logging_config import get_logger, setup_root_logger
@@ -83,6 +87,14 @@ orchestration_agent: Optional[OrchestrationAgent] = None
 # Job tracking (in-memory for simplicity)
 ingestion_jobs: Dict[str, Dict[str, Any]] = {}
 
+# Uploads up to this size are read into memory once and hashed/uploaded
+# from that buffer; larger ones stream from the request's spooled file
+API_IN_MEMORY_UPLOAD_LIMIT = 20 * 1024 * 1024
+
+# Database ping result reused by /health for this many seconds
+DB_HEALTH_TTL_SECONDS = 10.0
+_db_health: Dict[str, Any] = {"checked_at": 0.0, "connected": False}
+
 
 # ============== Request/Response Models ==============
 
@@ -106,6 +118,22 @@ class MultiUploadResponse(BaseModel):
     errors: List[Dict[str, Any]]
 
 
+class PresignUploadRequest(BaseModel):
+    """Request model for a direct-to-S3 upload URL."""
+    file_name: str
+    size_bytes: int
+    content_hash: Optional[str] = None
+
+
+class PresignUploadResponse(BaseModel):
+    """Response model with the pre-signed PUT URL and required headers."""
+    url: str
+    headers: Dict[str, str]
+    s3_uri: str
+    document_type: str
+    expires_in: int
+
+
 class IngestFileRequest(BaseModel):
     """Request model for single file ingestion."""
     file_path: str
@@ -302,14 +330,15 @@ async def health_check():
         "orchestration_agent": "initialized" if orchestration_agent else "not_initialized"
     }
     
-    # Test database connectivity
+    # Test database connectivity (cached briefly: probes can be frequent)
     db_connected = False
     if rds_client:
-        try:
-            rds_client.execute_query("SELECT 1", fetch=True)
-            db_connected = True
-        except:
-            pass
+        now = time.monotonic()
+        if now - _db_health["checked_at"] >= DB_HEALTH_TTL_SECONDS:
+            # Blocking driver call: keep it off the event loop
+            _db_health["connected"] = await run_in_threadpool(rds_client.ping)
+            _db_health["checked_at"] = now
+        db_connected = _db_health["connected"]
     
     all_healthy = (
         all(status == "initialized" for status in services_status.values())
@@ -325,6 +354,73 @@ async def health_check():
 
 # ============== Upload Endpoints (Existing) ==============
 
+def _process_upload(file: UploadFile) -> Optional[UploadResponse]:
+    """
+    Validate, duplicate-check and upload one request file.
+    
+    Blocking (hashing and S3 I/O): async endpoints run it through
+    run_in_threadpool so the event loop stays free. Works on the
+    request's own spooled file instead of copying it to a
+    temporary file first. Files up to API_IN_MEMORY_UPLOAD_LIMIT are read
+    into memory once, then hashed and uploaded from that buffer with no
+    further disk I/O; larger ones are hashed and uploaded straight from
+    the spooled file.
+    
+    Args:
+        file (UploadFile): Uploaded file from the request
+        
+    Returns:
+        Optional[UploadResponse]: Upload result, or None if the file fails
+            extension/size validation
+            
+    Raises:
+        UploadError: If the S3 upload fails
+        FileDiscoveryError: If the content cannot be read for hashing
+    """
+    source = file.file
+    size = source.seek(0, os.SEEK_END)
+    source.seek(0)
+    
+    if not file_processor.validate_upload(file.filename, size):
+        return None
+    
+    if size <= API_IN_MEMORY_UPLOAD_LIMIT:
+        source = io.BytesIO(source.read())
+    
+    # Check for duplicates
+    is_dup, content_hash, duplicate_paths = duplicate_detector.is_duplicate(
+        source,
+        compute_if_missing=True,
+        name=file.filename
+    )
+    
+    # Generate S3 key with document-type routing
+    doc_type = file_processor.get_document_type(file.filename)
+    s3_key = f"{doc_type.value}/{file.filename}"
+    
+    # Upload to S3 (multipart above 8 MiB)
+    s3_uri = s3_client.upload_fileobj(
+        source,
+        s3_key,
+        metadata={
+            "original_filename": file.filename,
+            "document_type": doc_type.value,
+            "content_hash": content_hash,
+            "is_duplicate": str(is_dup)
+        }
+    )
+    
+    return UploadResponse(
+        success=True,
+        s3_uri=s3_uri,
+        file_name=file.filename,
+        document_type=doc_type.value,
+        is_duplicate=is_dup,
+        duplicate_of=duplicate_paths,
+        content_hash=content_hash
+    )
+
+
 @app.post("/upload/single", response_model=UploadResponse, tags=["Upload"])
 async def upload_single_file(file: UploadFile = File(...)):
     """Upload a single file to S3 with duplicate detection and routing."""
@@ -334,59 +430,19 @@ async def upload_single_file(file: UploadFile = File(...)):
             detail="Services not initialized"
         )
     
-    temp_file = None
     try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(
-            delete=False, 
-            suffix=Path(file.filename).suffix
-        ) as tmp:
-            shutil.copyfileobj(file.file, tmp)
-            temp_file = Path(tmp.name)
-        
         logger.info(f"Processing upload: {file.filename}")
         
-        # Validate file
-        if not file_processor.validate_file(temp_file):
+        upload = await run_in_threadpool(_process_upload, file)
+        if upload is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"File validation failed: {file.filename}"
             )
         
-        # Check for duplicates
-        is_dup, content_hash, duplicate_paths = duplicate_detector.is_duplicate(
-            temp_file,
-            compute_if_missing=True
-        )
-        
-        # Generate S3 key with document-type routing
-        original_path = Path(file.filename)
-        doc_type = file_processor.get_document_type(original_path)
-        s3_key = f"{doc_type.value}/{file.filename}"
-        
-        # Upload to S3
-        s3_uri = s3_client.upload_file(
-            temp_file,
-            s3_key=s3_key,
-            metadata={
-                "original_filename": file.filename,
-                "document_type": doc_type.value,
-                "content_hash": content_hash,
-                "is_duplicate": str(is_dup)
-            }
-        )
-        
-        logger.info(f"Successfully uploaded {file.filename} to {s3_uri}")
+        logger.info(f"Successfully uploaded {file.filename} to {upload.s3_uri}")
         
-        return UploadResponse(
-            success=True,
-            s3_uri=s3_uri,
-            file_name=file.filename,
-            document_type=doc_type.value,
-            is_duplicate=is_dup,
-            duplicate_of=duplicate_paths,
-            content_hash=content_hash
-        )
+        return upload
         
     except UploadError as e:
         logger.error(f"Upload error: {e.message}", extra={"details": e.details})
@@ -408,9 +464,6 @@ async def upload_single_file(file: UploadFile = File(...)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error: {str(e)}"
         )
-    finally:
-        if temp_file and temp_file.exists():
-            temp_file.unlink()
 
 
 @app.post("/upload/multi", response_model=MultiUploadResponse, tags=["Upload"])
@@ -432,83 +485,87 @@ async def upload_multiple_files(files: List[UploadFile] = File(...)):
     
     uploads = []
     errors = []
-    temp_files = []
     
-    try:
-        for file in files:
-            temp_file = None
-            try:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False,
-                    suffix=Path(file.filename).suffix
-                ) as tmp:
-                    shutil.copyfileobj(file.file, tmp)
-                    temp_file = Path(tmp.name)
-                    temp_files.append(temp_file)
-                
-                # Validate and process file
-                if not file_processor.validate_file(temp_file):
-                    errors.append({
-                        "file_name": file.filename,
-                        "error": "File validation failed"
-                    })
-                    continue
-                
-                is_dup, content_hash, duplicate_paths = duplicate_detector.is_duplicate(
-                    temp_file,
-                    compute_if_missing=True
-                )
-                
-                original_path = Path(file.filename)
-                doc_type = file_processor.get_document_type(original_path)
-                s3_key = f"{doc_type.value}/{file.filename}"
-                
-                s3_uri = s3_client.upload_file(
-                    temp_file,
-                    s3_key=s3_key,
-                    metadata={
-                        "original_filename": file.filename,
-                        "document_type": doc_type.value,
-                        "content_hash": content_hash,
-                        "is_duplicate": str(is_dup)
-                    }
-                )
-                
-                uploads.append(UploadResponse(
-                    success=True,
-                    s3_uri=s3_uri,
-                    file_name=file.filename,
-                    document_type=doc_type.value,
-                    is_duplicate=is_dup,
-                    duplicate_of=duplicate_paths,
-                    content_hash=content_hash
-                ))
-                
-            except (UploadError, FileDiscoveryError) as e:
-                errors.append({
-                    "file_name": file.filename,
-                    "error": e.message,
-                    "details": e.details
-                })
-            except Exception as e:
+    for file in files:
+        try:
+            upload = await run_in_threadpool(_process_upload, file)
+            if upload is None:
                 errors.append({
                     "file_name": file.filename,
-                    "error": str(e)
+                    "error": "File validation failed"
                 })
-        
-        return MultiUploadResponse(
-            total=len(files),
-            successful=len(uploads),
-            failed=len(errors),
-            uploads=uploads,
-            errors=errors
+                continue
+            
+            uploads.append(upload)
+            
+        except (UploadError, FileDiscoveryError) as e:
+            errors.append({
+                "file_name": file.filename,
+                "error": e.message,
+                "details": e.details
+            })
+        except Exception as e:
+            errors.append({
+                "file_name": file.filename,
+                "error": str(e)
+            })
+    
+    return MultiUploadResponse(
+        total=len(files),
+        successful=len(uploads),
+        failed=len(errors),
+        uploads=uploads,
+        errors=errors
+    )
+
+
+@app.post("/upload/presign", response_model=PresignUploadResponse, tags=["Upload"])
+async def presign_upload(request: PresignUploadRequest):
+    """
+    Issue a pre-signed URL so the client uploads straight to S3.
+    
+    The file bytes bypass this service entirely; the client PUTs them to
+    the returned URL with the returned headers. The same extension/size
+    validation and document-type routing as /upload/single apply; the
+    declared size is signed into the URL, so S3 rejects a body of any
+    other length.
+    Duplicate detection is not performed, since the service never sees
+    the content; a client-computed content_hash is stored as metadata.
+    """
+    if not all([s3_client, file_processor]):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Services not initialized"
         )
-        
-    finally:
-        for temp_file in temp_files:
-            if temp_file.exists():
-                temp_file.unlink()
+    
+    if not file_processor.validate_upload(request.file_name, request.size_bytes):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File validation failed: {request.file_name}"
+        )
+    
+    doc_type = file_processor.get_document_type(request.file_name)
+    metadata = {
+        "original_filename": request.file_name,
+        "document_type": doc_type.value
+    }
+    if request.content_hash:
+        metadata["content_hash"] = request.content_hash
+    
+    try:
+        upload = s3_client.generate_presigned_put(
+            f"{doc_type.value}/{request.file_name}",
+            metadata=metadata,
+            content_length=request.size_bytes
+        )
+    except UploadError as e:
+        logger.error(f"Presign error: {e.message}", extra={"details": e.details})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=e.message
+        )
+    
+    return PresignUploadResponse(document_type=doc_type.value, **upload)
 
 
 # ============== CSV Ingestion Endpoints ==============
@@ -61,7 +61,8 @@ class RDSClient:
         database: Optional[str] = None,
         user: Optional[str] = None,
         password: Optional[str] = None,
-        pool_size: Optional[int] = None
+        pool_size: Optional[int] = None,
+        local_infile: Optional[bool] = None
     ):
         """
         Initialize RDS client with connection parameters.
@@ -76,6 +77,8 @@ class RDSClient:
             user (Optional[str]): Database user (default: from settings)
             password (Optional[str]): Database password (default: from settings)
             pool_size (Optional[int]): Connection pool size (default: from settings)
+            local_infile (Optional[bool]): Allow LOAD DATA LOCAL INFILE on
+                connections (default: settings.csv_use_local_infile)
             
         Raises:
             ConfigError: If required connection parameters are missing
@@ -83,7 +86,7 @@ class RDSClient:
             
         Side Effects:
             - Creates connection pool
-            - Tests database connectivity
+            - Tests database connectivity and pools the test connection
             - Logs initialization status
         """
         # Load configuration from settings or parameters
@@ -93,6 +96,9 @@ class RDSClient:
         self.user = user or settings.rds_username
         self._password = password or settings.rds_password
         self._pool_size = pool_size or settings.rds_pool_size
+        self.local_infile = (
+            settings.csv_use_local_infile if local_infile is None else local_infile
+        )
         
         # Validate required parameters
         if not all([self.host, self.database, self.user, self._password]):
@@ -110,10 +116,13 @@ class RDSClient:
         self._pool: List[pymysql.connections.Connection] = []
         self._pool_lock = Lock()
         
-        # Test connection
+        # SQLAlchemy engine for pandas reads, created on first use
+        self._engine = None
+        
+        # Test connection; keep it pooled so the first query skips a handshake
         try:
             conn = self._create_connection()
-            conn.close()
+            self._pool.append(conn)
             logger.info(
                 f"RDS client initialized: {self.user}@{self.host}:{self.port}/{self.database}"
             )
@@ -147,6 +156,7 @@ class RDSClient:
                 charset='utf8mb4',
                 cursorclass=DictCursor,
                 autocommit=False,
+                local_infile=self.local_infile,
                 connect_timeout=10,
                 read_timeout=30,  # Add read timeout
                 write_timeout=30  # Add write timeout
@@ -354,6 +364,124 @@ class RDSClient:
                 }
             )
     
+    def get_engine(self):
+        """
+        Get a SQLAlchemy engine for this database (created lazily).
+        
+        Used where pandas reads query results straight into a DataFrame
+        (pd.read_sql), skipping the list-of-dicts intermediate that
+        execute_query() builds. The engine keeps its own small pool.
+        
+        Returns:
+            sqlalchemy.engine.Engine: Engine bound to this client's database
+            
+        Example:
+            >>> df = pd.read_sql("SELECT * FROM users LIMIT 10", client.get_engine())
+        """
+        if self._engine is None:
+            from sqlalchemy import create_engine
+            from sqlalchemy.engine import URL
+            
+            url = URL.create(
+                "mysql+pymysql",
+                username=self.user,
+                password=self._password,
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                query={"charset": "utf8mb4"}
+            )
+            with self._pool_lock:
+                if self._engine is None:
+                    self._engine = create_engine(
+                        url,
+                        pool_size=self._pool_size,
+                        max_overflow=settings.rds_pool_max_overflow,
+                        pool_pre_ping=True,
+                        connect_args={"connect_timeout": 10}
+                    )
+        return self._engine
+    
+    def ping(self) -> bool:
+        """
+        Check database liveness with a protocol-level ping.
+        
+        Uses a pooled connection and COM_PING instead of running a query,
+        so no statement is parsed or executed on the server. A dead pooled
+        connection is reconnected once.
+        
+        Returns:
+            bool: True if the server answered
+            
+        Example:
+            >>> if not client.ping():
+            ...     print("database unreachable")
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.ping(reconnect=True)
+                return True
+        except Exception as e:
+            logger.warning(f"Database ping failed: {str(e)}")
+            return False
+    
+    def load_local_infile(
+        self,
+        query: str,
+        params: Optional[Tuple] = None
+    ) -> Tuple[int, List[Tuple]]:
+        """
+        Execute a LOAD DATA LOCAL INFILE statement and commit.
+        
+        The client streams the file to the server, which parses and
+        inserts it in bulk, avoiding per-row INSERT overhead.
+        
+        Args:
+            query (str): LOAD DATA LOCAL INFILE statement
+            params (Optional[Tuple]): Query parameters for safe substitution
+            
+        Returns:
+            Tuple[int, List[Tuple]]:
+                - Number of rows loaded
+                - Server warnings as (level, code, message) tuples
+                
+        Raises:
+            DatabaseError: If local infile is disabled or the load fails
+            
+        Example:
+            >>> loaded, warnings = client.load_local_infile(
+            ...     "LOAD DATA LOCAL INFILE %s INTO TABLE `users` "
+            ...     "FIELDS TERMINATED BY ',' IGNORE 1 LINES",
+            ...     params=("/data/users.csv",)
+            ... )
+        """
+        if not self.local_infile:
+            raise DatabaseError(
+                "LOAD DATA LOCAL INFILE is disabled for this client",
+                details={"query": query[:200]}
+            )
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params or ())
+                    affected_rows = cursor.rowcount
+                    warnings = list(conn.show_warnings() or ())
+                    conn.commit()
+                    
+                    logger.info(
+                        f"Bulk load affected {affected_rows} rows "
+                        f"({len(warnings)} warnings)"
+                    )
+                    
+                    return affected_rows, warnings
+                    
+        except Exception as e:
+            raise DatabaseError(
+                f"Bulk load failed: {str(e)}",
+                details={"query": query[:200], "params": str(params)}
+            )
+    
     def table_exists(self, table_name: str) -> bool:
         """
         Check if table exists in database.
@@ -590,4 +718,9 @@ class RDSClient:
                     logger.warning(f"Error closing connection: {e}")
             
             self._pool.clear()
+            
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+            
             logger.info("Closed all database connections")
\ No newline at end of file
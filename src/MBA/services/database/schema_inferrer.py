@@ -209,28 +209,9 @@ class SchemaInferrer:
         
         # Check for integers
         if pd.api.types.is_integer_dtype(series):
-            max_val = non_null.max()
-            min_val = non_null.min()
-            
-            # Choose appropriate integer type
-            if min_val >= 0 and max_val < 256:
-                col_type = "TINYINT UNSIGNED"
-            elif min_val >= -128 and max_val < 128:
-                col_type = "TINYINT"
-            elif min_val >= 0 and max_val < 65536:
-                col_type = "SMALLINT UNSIGNED"
-            elif min_val >= -32768 and max_val < 32768:
-                col_type = "SMALLINT"
-            elif min_val >= 0 and max_val < 4294967296:
-                col_type = "INT UNSIGNED"
-            elif min_val >= -2147483648 and max_val < 2147483648:
-                col_type = "INT"
-            else:
-                col_type = "BIGINT"
-            
             return {
                 "name": normalized_name,
-                "type": col_type,
+                "type": self._integer_type(non_null.min(), non_null.max()),
                 "nullable": series.isna().any(),
                 "original_name": column_name
             }
@@ -255,9 +236,9 @@ class SchemaInferrer:
         
         # Try to parse as datetime
         try:
-            pd.to_datetime(non_null.head(100), errors='coerce')
-            parsed_count = pd.to_datetime(non_null.head(100), errors='coerce').notna().sum()
-            if parsed_count > 50:  # More than 50% are valid dates
+            head = non_null.head(100)
+            parsed_count = pd.to_datetime(head, errors='coerce').notna().sum()
+            if parsed_count > len(head) / 2:  # More than 50% are valid dates
                 return {
                     "name": normalized_name,
                     "type": "DATETIME",
@@ -295,6 +276,134 @@ class SchemaInferrer:
             "original_name": column_name
         }
     
+    @staticmethod
+    def _integer_type(min_val: int, max_val: int) -> str:
+        """
+        Pick the smallest MySQL integer type that holds a value range.
+        
+        Args:
+            min_val (int): Smallest value in the column
+            max_val (int): Largest value in the column
+            
+        Returns:
+            str: MySQL integer type, e.g. ``"SMALLINT UNSIGNED"``
+        """
+        if min_val >= 0 and max_val < 256:
+            return "TINYINT UNSIGNED"
+        elif min_val >= -128 and max_val < 128:
+            return "TINYINT"
+        elif min_val >= 0 and max_val < 65536:
+            return "SMALLINT UNSIGNED"
+        elif min_val >= -32768 and max_val < 32768:
+            return "SMALLINT"
+        elif min_val >= 0 and max_val < 4294967296:
+            return "INT UNSIGNED"
+        elif min_val >= -2147483648 and max_val < 2147483648:
+            return "INT"
+        return "BIGINT"
+    
+    def _read_sample_arrow(self, csv_path: Path):
+        """
+        Read the first ``sample_rows`` rows of a CSV into a pyarrow Table.
+        
+        Streams the file with pyarrow's multithreaded CSV reader and stops
+        once enough rows have been parsed, so column types come straight
+        from Arrow's native type inference instead of a pandas round trip.
+        
+        Args:
+            csv_path (Path): CSV file to sample
+            
+        Returns:
+            Optional[pyarrow.Table]: Sampled rows, or None when pyarrow is
+            not installed or cannot parse the file (the caller then falls
+            back to pandas)
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            return None
+        
+        try:
+            reader = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(encoding=settings.csv_encoding),
+                # Empty cells are NULL in every column, as with pandas
+                convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+            )
+            batches = []
+            rows = 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= self.sample_rows:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+        except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+            logger.debug(f"Arrow CSV read failed for {csv_path.name}, using pandas: {e}")
+            return None
+        
+        # pandas de-duplicates repeated headers ("id", "id.1"); Arrow does not
+        if len(set(table.column_names)) != len(table.column_names):
+            return None
+        
+        return table.slice(0, self.sample_rows)
+    
+    def infer_arrow_column_type(self, column, column_name: str) -> Dict[str, Any]:
+        """
+        Infer MySQL column type from a pyarrow column.
+        
+        Maps the Arrow type chosen at parse time directly onto MySQL types
+        (integers → sized INT family, floating → DOUBLE, timestamp/date →
+        DATETIME, bool → BOOLEAN) using Arrow compute kernels for min/max.
+        String columns are handed to infer_column_type() so date detection
+        and VARCHAR sizing stay identical to the pandas path.
+        
+        Args:
+            column (pyarrow.ChunkedArray): Column data for analysis
+            column_name (str): Original column name
+            
+        Returns:
+            Dict[str, Any]: Column definition with the same keys as
+            infer_column_type()
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        col_type_arrow = column.type
+        nullable = column.null_count > 0
+        
+        def definition(col_type: str, is_nullable: bool = nullable) -> Dict[str, Any]:
+            return {
+                "name": self.normalize_column_name(column_name),
+                "type": col_type,
+                "nullable": is_nullable,
+                "original_name": column_name
+            }
+        
+        if column.null_count == len(column):
+            return definition("TEXT", True)
+        
+        if pa.types.is_boolean(col_type_arrow):
+            return definition("BOOLEAN")
+        
+        if pa.types.is_integer(col_type_arrow) or pa.types.is_floating(col_type_arrow):
+            # 0/1 flag columns become BOOLEAN, matching the pandas path
+            flags = pa.array([0, 1], type=col_type_arrow)
+            if pc.all(pc.is_in(column.drop_null(), value_set=flags)).as_py():
+                return definition("BOOLEAN")
+            if pa.types.is_floating(col_type_arrow):
+                return definition("DOUBLE")
+            bounds = pc.min_max(column)
+            return definition(
+                self._integer_type(bounds["min"].as_py(), bounds["max"].as_py())
+            )
+        
+        if pa.types.is_timestamp(col_type_arrow) or pa.types.is_date(col_type_arrow):
+            return definition("DATETIME")
+        
+        return self.infer_column_type(column.to_pandas(), column_name)
+    
     def infer_schema(
         self,
         csv_path: Path,
@@ -340,14 +449,29 @@ class SchemaInferrer:
         logger.info(f"Inferring schema from: {csv_path.name}")
         
         try:
-            # Read CSV with pandas
-            df = pd.read_csv(
-                csv_path,
-                encoding=settings.csv_encoding,
-                nrows=self.sample_rows
-            )
+            # Prefer Arrow's native type inference; fall back to pandas
+            table = self._read_sample_arrow(csv_path)
+            
+            if table is not None:
+                row_count = table.num_rows
+                samples = [
+                    (name, table.column(i), self.infer_arrow_column_type)
+                    for i, name in enumerate(table.column_names)
+                ]
+            else:
+                # Nullable dtypes keep integer columns with gaps as integers
+                df = pd.read_csv(
+                    csv_path,
+                    encoding=settings.csv_encoding,
+                    nrows=self.sample_rows,
+                    dtype_backend="numpy_nullable"
+                )
+                row_count = len(df)
+                samples = [
+                    (col, df[col], self.infer_column_type) for col in df.columns
+                ]
             
-            if df.empty:
+            if row_count == 0:
                 raise SchemaInferenceError(
                     f"CSV file is empty: {csv_path}",
                     details={"path": str(csv_path)}
@@ -358,8 +482,8 @@ class SchemaInferrer:
             
             # Infer column types
             columns = []
-            for col in df.columns:
-                col_def = self.infer_column_type(df[col], col)
+            for col, data, infer in samples:
+                col_def = infer(data, col)
                 columns.append(col_def)
                 logger.debug(
                     f"Column '{col}' -> {col_def['name']}: {col_def['type']}"
@@ -382,9 +506,6 @@ class SchemaInferrer:
                     }
                 ])
             
-            # Get actual row count
-            row_count = len(df)
-            
             schema = {
                 "table_name": table_name,
                 "columns": columns,
@@ -2,10 +2,14 @@
 Batch processing for multiple CSV files.
 
 Handles directory-level ingestion with error handling and reporting.
+Files load into independent tables, so they are ingested concurrently,
+each worker drawing its own connection from the RDSClient pool.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any
+from threading import Event
+from typing import Any, Callable, Dict, List, Optional
 
 from MBA.core.exceptions import FileDiscoveryError
 from MBA.core.logging_config import get_logger
@@ -21,7 +25,13 @@ class BatchProcessor:
         self.ingestor = ingestor
 
     def ingest_directory(
-        self, directory: Path, file_pattern: str = "*.csv", continue_on_error: bool = True
+        self,
+        directory: Path,
+        file_pattern: str = "*.csv",
+        continue_on_error: bool = True,
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_event: Optional[Event] = None,
     ) -> Dict[str, Any]:
         """
         Ingest all CSV files under a directory.
@@ -29,10 +39,16 @@ class BatchProcessor:
         Args:
             directory: Directory path
             file_pattern: Glob pattern for CSV selection
-            continue_on_error: Continue upon individual file failures
+            continue_on_error: Continue upon individual file failures; when
+                False, files not yet started are cancelled after a failure
+            max_workers: Files ingested concurrently (keep <= RDS pool size)
+            progress_callback: Called as callback(done, total, file_name)
+                from the calling thread after each file finishes
+            cancel_event: When set, files not yet started are cancelled;
+                files already loading run to completion
             
         Returns:
-            Batch summary with per-file results and errors
+            Batch summary with per-file results and errors (in file order)
         """
         if not directory.exists():
             raise FileDiscoveryError(
@@ -52,35 +68,66 @@ class BatchProcessor:
                 "failed": 0,
                 "results": [],
                 "errors": [],
+                "cancelled": 0,
             }
 
         logger.info("Starting batch ingestion: %d files from %s", len(csv_files), directory)
 
         successful = failed = 0
-        results: List[Dict[str, Any]] = []
-        errors: List[Dict[str, Any]] = []
-
-        for idx, csv_file in enumerate(csv_files, 1):
-            logger.info("Processing file %d/%d: %s", idx, len(csv_files), csv_file.name)
-            try:
-                result = self.ingestor.ingest_csv(csv_file)
-                results.append(result)
-                if result["success"]:
-                    successful += 1
-                else:
+        total = len(csv_files)
+        # Slots keep per-file outcomes in directory order despite completion order
+        result_slots: List[Optional[Dict[str, Any]]] = [None] * total
+        error_slots: List[Optional[Dict[str, Any]]] = [None] * total
+
+        halted = False
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+            futures = {
+                executor.submit(self.ingestor.ingest_csv, csv_file): idx
+                for idx, csv_file in enumerate(csv_files)
+            }
+
+            for future in as_completed(futures):
+                # Files cancelled after a halting failure are never started
+                if future.cancelled():
+                    continue
+                done += 1
+                idx = futures[future]
+                csv_file = csv_files[idx]
+                try:
+                    result = future.result()
+                    result_slots[idx] = result
+                    if result["success"]:
+                        successful += 1
+                    else:
+                        failed += 1
+                    logger.info("Finished file %d/%d: %s", done, total, csv_file.name)
+                except Exception as e:
                     failed += 1
-            except Exception as e:
-                failed += 1
-                error_info = {
-                    "file": csv_file.name,
-                    "error": str(e),
-                    "type": type(e).__name__,
-                }
-                errors.append(error_info)
-                logger.error("Failed to ingest %s: %s", csv_file.name, str(e))
-                if not continue_on_error:
-                    logger.error("Halting batch ingestion due to error")
-                    break
+                    error_slots[idx] = {
+                        "file": csv_file.name,
+                        "error": str(e),
+                        "type": type(e).__name__,
+                    }
+                    logger.error("Failed to ingest %s: %s", csv_file.name, str(e))
+                    if not continue_on_error and not halted:
+                        logger.error("Halting batch ingestion due to error")
+                        halted = True
+                        for pending in futures:
+                            pending.cancel()
+
+                if progress_callback is not None:
+                    progress_callback(done, total, csv_file.name)
+
+                if cancel_event is not None and cancel_event.is_set() and not halted:
+                    logger.warning("Batch ingestion cancelled after %d/%d files", done, total)
+                    halted = True
+                    for pending in futures:
+                        pending.cancel()
+
+        results = [r for r in result_slots if r is not None]
+        errors = [e for e in error_slots if e is not None]
 
         batch_results = {
             "total_files": len(csv_files),
@@ -88,6 +135,7 @@ class BatchProcessor:
             "failed": failed,
             "results": results,
             "errors": errors,
+            "cancelled": total - done,
         }
 
         logger.info(
@@ -7,7 +7,8 @@ batch processing, and comprehensive error handling.
 """
 
 from pathlib import Path
-from typing import Dict, Optional, Any
+from threading import Event
+from typing import Any, Callable, Dict, Optional
 from datetime import datetime
 import traceback
 
@@ -143,7 +144,20 @@ class CSVIngestor:
             )
 
     def ingest_directory(
-        self, directory: Path, file_pattern: str = "*.csv", continue_on_error: bool = True
+        self,
+        directory: Path,
+        file_pattern: str = "*.csv",
+        continue_on_error: bool = True,
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_event: Optional[Event] = None,
     ) -> Dict[str, Any]:
-        """Ingest all CSV files under a directory."""
-        return self.batch_processor.ingest_directory(directory, file_pattern, continue_on_error)
\ No newline at end of file
+        """Ingest all CSV files under a directory, several files at a time."""
+        return self.batch_processor.ingest_directory(
+            directory,
+            file_pattern,
+            continue_on_error,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+        )
\ No newline at end of file
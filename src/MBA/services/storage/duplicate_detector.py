@@ -11,22 +11,49 @@ Module Input:
     - Cache persistence/loading operations
 
 Module Output:
-    - SHA-256 content hashes
+    - SHA-256 (or BLAKE3, if installed) content hashes
     - Duplicate detection results
     - Cache statistics and contents
 """
 
 import hashlib
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, Set, Optional, List, Tuple
-from collections import defaultdict
-from threading import Lock
+from typing import BinaryIO, Dict, Set, Optional, List, Tuple, Union
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import partial
+from threading import Event, Lock
 
 from MBA.core.exceptions import FileDiscoveryError, ValidationError
 from MBA.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Slice of a memory-mapped file fed to hashlib per update() call
+_MMAP_SLICE_SIZE = 1 << 22
+
+# Content-defined chunk sizes for near-duplicate fingerprints; small enough
+# that a one-row edit in a CSV only changes a few chunks
+_CDC_MIN_SIZE = 256
+_CDC_AVG_SIZE = 1024
+_CDC_MAX_SIZE = 8192
+
+# Short chunk digests: fingerprints only need to be distinct, not secure
+_chunk_digest = partial(hashlib.blake2b, digest_size=8)
+
+# Same-size files at least this large are compared by a sample of their
+# first, middle and last _SAMPLE_SIZE bytes before being hashed in full
+_SAMPLE_MIN_SIZE = 1 << 20
+_SAMPLE_SIZE = 64 * 1024
+
+# Hashed via the optional ``blake3`` package rather than hashlib
+BLAKE3 = "blake3"
+
+# Content that can be hashed: a file on disk, raw bytes or a binary stream
+HashSource = Union[Path, bytes, bytearray, memoryview, BinaryIO]
+
 
 class DuplicateDetector:
     """
@@ -39,14 +66,36 @@ class DuplicateDetector:
     The cache maps content hashes to lists of file paths that share that
     hash, enabling identification of all duplicates of a given file.
     
+    Callers that pass allow_deferred=True to is_duplicate() let files on
+    disk be bucketed by size first: a file whose size matches no tracked
+    file cannot be a duplicate, so it is recorded without being read. Its
+    hash is computed only once another file of the same size shows up.
+    Files of 1 MiB or more are then compared by a sampled fingerprint
+    (first, middle and last 64 KiB), and only files whose samples also
+    match are hashed in full.
+    
     Attributes:
         algorithm (str): Hash algorithm name (default: "sha256")
-        chunk_size (int): File read chunk size in bytes
+        chunk_size (int): Read chunk size in bytes for non-file streams
         _cache (Dict[str, List[str]]): Hash to file paths mapping
+        _size_index (Dict[int, List[str]]): Size to tracked paths mapping
+        _unhashed (Dict[int, Dict[Optional[str], str]]): Size to
+            not-yet-hashed paths, keyed by sample fingerprint (None if the
+            file was deferred by size alone)
+        _sample_counts (Counter): Tracked entries per (size, sample) for
+            files of at least 1 MiB; sample is None when unknown
+        _stats (Counter): Running totals behind get_cache_stats()
+        _sizes_complete (bool): False once entries of unknown size (from
+            import_cache) are present, which disables the size shortcut
+        _resolving (Dict[int, List[Event]]): Size to in-flight sampling or
+            hashing of deferred files, set when each finishes
         _lock (Lock): Thread synchronization lock
         
     Thread Safety:
-        Thread-safe for all operations via internal locking.
+        Thread-safe for all operations via internal locking. Files are
+        only read outside the lock: deferred entries are claimed under it,
+        hashed or sampled without it, then merged back, so one large file
+        does not stall concurrent checks of other files.
     """
     
     def __init__(
@@ -59,8 +108,10 @@ class DuplicateDetector:
         
         Args:
             algorithm (str): Hash algorithm (default: "sha256")
-                Supported: "md5", "sha1", "sha256", "sha512"
-            chunk_size (int): Bytes to read per chunk (default: 8192)
+                Supported: "md5", "sha1", "sha256", "sha512", and "blake3"
+                when the ``blake3`` package is installed (multithreaded,
+                SIMD-accelerated, several times faster than SHA-256)
+            chunk_size (int): Bytes to read per chunk from streams (default: 8192)
                 
         Raises:
             ValidationError: If algorithm is not supported
@@ -70,8 +121,20 @@ class DuplicateDetector:
             - Initializes empty cache
             - Logs detector initialization
         """
+        self._blake3 = None
+        
         # Validate algorithm
-        if algorithm not in hashlib.algorithms_available:
+        if algorithm == BLAKE3:
+            try:
+                import blake3
+            except ImportError:
+                raise ValidationError(
+                    "Hash algorithm 'blake3' requires the blake3 package. "
+                    "Install with: pip install blake3",
+                    details={"requested_algorithm": algorithm}
+                )
+            self._blake3 = blake3
+        elif algorithm not in hashlib.algorithms_available:
             raise ValidationError(
                 f"Hash algorithm '{algorithm}' not available. "
                 f"Supported: {sorted(hashlib.algorithms_available)}",
@@ -86,6 +149,28 @@ class DuplicateDetector:
         
         # Hash -> List of file paths with that hash
         self._cache: Dict[str, List[str]] = defaultdict(list)
+        
+        # Size -> paths of that size; sizes seen once are left unhashed
+        self._size_index: Dict[int, List[str]] = defaultdict(list)
+        self._unhashed: Dict[int, Dict[Optional[str], str]] = {}
+        self._sample_counts: Counter = Counter()
+        self._sizes_complete = True
+        
+        # Kept up to date on every change so get_cache_stats() is O(1)
+        self._stats: Counter = Counter()
+        
+        # Bumped whenever the cache is cleared or replaced wholesale
+        self._generation = 0
+        
+        # Deferred files being sampled/hashed outside the lock, by size;
+        # results claimed before the last reset are discarded
+        self._resolving: Dict[int, List[Event]] = defaultdict(list)
+        self._resets = 0
+        
+        # Near-duplicate fingerprints: path -> chunk set, chunk -> paths
+        self._chunk_sets: Dict[str, Set[str]] = {}
+        self._chunk_index: Dict[str, Set[str]] = defaultdict(set)
+        
         self._lock = Lock()
         
         logger.info(
@@ -93,15 +178,18 @@ class DuplicateDetector:
             f"algorithm={algorithm}, chunk_size={chunk_size}"
         )
     
-    def compute_hash(self, file_path: Path) -> str:
+    def compute_hash(self, file_path: HashSource) -> str:
         """
         Compute cryptographic hash of file contents.
         
-        Reads file in chunks to handle large files efficiently, computing
-        hash incrementally to minimize memory usage.
+        Memory-maps the file and hashes it in 4 MiB slices, so large files
+        are hashed from the page cache without per-chunk read() copies. Bytes-like objects and
+        binary streams (e.g. uploaded files held in memory) are hashed
+        directly without touching disk; streams are rewound to their
+        original position afterwards.
         
         Args:
-            file_path (Path): Path to file for hashing
+            file_path (HashSource): Path to file, bytes, or binary stream
             
         Returns:
             str: Hexadecimal hash digest
@@ -119,6 +207,9 @@ class DuplicateDetector:
             >>> print(hash_val)
             '2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae'
         """
+        if not isinstance(file_path, Path):
+            return self._hash_in_memory(file_path)
+        
         if not file_path.exists():
             raise FileDiscoveryError(
                 f"Cannot hash non-existent file: {file_path}",
@@ -132,12 +223,32 @@ class DuplicateDetector:
             )
         
         try:
+            if self._blake3 is not None:
+                # Memory-mapped, multithreaded tree hash; no Python read loop
+                hash_value = (
+                    self._new_hasher()
+                    .update_mmap(str(file_path))
+                    .hexdigest()
+                )
+                logger.debug(
+                    f"Computed {self.algorithm} hash for {file_path.name}: "
+                    f"{hash_value[:16]}..."
+                )
+                return hash_value
+            
             hasher = hashlib.new(self.algorithm)
             
             with open(file_path, "rb") as f:
-                # Read file in chunks to handle large files
-                while chunk := f.read(self.chunk_size):
-                    hasher.update(chunk)
+                # Hash from the page cache via mmap; slices of the mapping
+                # are fed without copying into Python bytes objects
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            for offset in range(0, len(view), _MMAP_SLICE_SIZE):
+                                hasher.update(view[offset:offset + _MMAP_SLICE_SIZE])
+                        finally:
+                            view.release()
             
             hash_value = hasher.hexdigest()
             
@@ -161,8 +272,11 @@ class DuplicateDetector:
     
     def is_duplicate(
         self,
-        file_path: Path,
-        compute_if_missing: bool = True
+        file_path: HashSource,
+        compute_if_missing: bool = True,
+        name: Optional[str] = None,
+        file_hash: Optional[str] = None,
+        allow_deferred: bool = False
     ) -> Tuple[bool, Optional[str], Optional[List[str]]]:
         """
         Check if file is a duplicate of previously seen file.
@@ -170,19 +284,45 @@ class DuplicateDetector:
         Computes hash for file and checks cache for existing entries.
         Optionally adds file to cache if not found.
         
+        In-memory content (bytes or a stream) has no on-disk identity, so
+        every check counts as a new sighting and is cached under ``name``.
+        
+        With ``allow_deferred=True``, a file on disk whose size matches no
+        tracked file is unique without reading it: the result is
+        ``(False, None, None)`` and the hash is deferred until a same-size
+        file is checked. In-memory content is always hashed since it cannot
+        be re-read later.
+        
+        Content of 1 MiB or more that shares its size with tracked files is
+        sampled first: if no tracked file of that size has the same sample,
+        an on-disk file checked with ``allow_deferred=True`` is recorded as
+        unique and its full hash is deferred in the same way.
+        
+        Callers that already hashed the content while streaming it (with the
+        same algorithm) can pass ``file_hash`` to skip reading it again.
+        
         Args:
-            file_path (Path): File to check for duplication
+            file_path (HashSource): File, bytes, or binary stream to check
             compute_if_missing (bool): Add to cache if not duplicate
                 (default: True)
+            name (Optional[str]): Name recorded in the cache for in-memory
+                content (default: "<memory>"; ignored for paths)
+            file_hash (Optional[str]): Precomputed content hash; when given
+                the content is not read and the size shortcut is skipped
+            allow_deferred (bool): For paths, skip hashing when the size or
+                sampled fingerprint proves the file unique, returning None
+                as its hash (default: False, always hash)
                 
         Returns:
             Tuple[bool, Optional[str], Optional[List[str]]]:
                 - bool: True if file is a duplicate
-                - str: Content hash of the file
+                - str: Content hash of the file (None only when
+                  allow_deferred is set and hashing was skipped)
                 - List[str]: Paths of duplicate files (if any)
                 
         Side Effects:
-            - Computes file hash
+            - Computes file hash (unless deferred by size or sample)
+            - May sample or hash a previously deferred file of the same size
             - May add file to cache
             - Logs duplicate detection results
             
@@ -199,19 +339,56 @@ class DuplicateDetector:
             >>> print(is_dup, dups)
             True ['doc1.pdf']
         """
-        # Compute hash for file
-        file_hash = self.compute_hash(file_path)
-        file_path_str = str(file_path)
+        on_disk = isinstance(file_path, Path)
+        file_path_str = str(file_path) if on_disk else (name or "<memory>")
+        display_name = Path(file_path_str).name
+        size = self._content_size(file_path)
+        sample = None
         
         with self._lock:
-            # Check if hash exists in cache
-            if file_hash in self._cache:
-                existing_paths = self._cache[file_hash]
+            defer = allow_deferred and on_disk and file_hash is None and self._sizes_complete
+            if defer and size not in self._size_index:
+                # No tracked file has this size: cannot be a duplicate
+                if compute_if_missing:
+                    self._track(size, file_path_str)
+                    self._defer(size, None, file_path_str)
+                logger.debug(f"Unique size, skipped hashing: {display_name}")
+                return False, None, None
+            
+            use_sample = file_hash is None and self._sizes_complete and size >= _SAMPLE_MIN_SIZE
+        
+        if use_sample:
+            # Sampling reads content, so it happens outside the lock
+            sample = self._sample_fingerprint(file_path, size)
+            self._sample_deferred(size)
+            if defer:
+                with self._lock:
+                    if not (
+                        self._sample_counts[(size, None)]
+                        or self._sample_counts[(size, sample)]
+                    ):
+                        # Same size as tracked files, but the sampled bytes differ
+                        if compute_if_missing:
+                            self._track(size, file_path_str, sample)
+                            self._defer(size, sample, file_path_str)
+                        logger.debug(f"Unique sample, skipped hashing: {display_name}")
+                        return False, None, None
+        
+        # Compute hash for file unless the caller already did
+        if file_hash is None:
+            file_hash = self.compute_hash(file_path)
+        
+        # Same-size deferred files are hashed (outside the lock) before the
+        # lookup, including any that arrived while this file was hashed
+        with self._settled(size, sample):
+            # Check if hash exists in cache (single dict probe)
+            existing_paths = self._cache.get(file_hash)
+            if existing_paths:
                 
                 # Check if this exact path already in cache
-                if file_path_str in existing_paths:
+                if on_disk and file_path_str in existing_paths:
                     logger.debug(
-                        f"File already in cache: {file_path.name} "
+                        f"File already in cache: {display_name} "
                         f"(hash: {file_hash[:16]}...)"
                     )
                     # It's the same entry, not a new duplicate
@@ -219,27 +396,343 @@ class DuplicateDetector:
                 
                 # Found duplicate(s)
                 logger.info(
-                    f"Duplicate detected: {file_path.name} matches "
+                    f"Duplicate detected: {display_name} matches "
                     f"{len(existing_paths)} existing file(s) "
                     f"(hash: {file_hash[:16]}...)"
                 )
                 
+                duplicate_paths = existing_paths.copy()
+                
                 # Optionally add this duplicate to cache
                 if compute_if_missing:
-                    self._cache[file_hash].append(file_path_str)
+                    self._cache_path(file_hash, file_path_str)
+                    self._track(size, file_path_str, sample)
                 
-                return True, file_hash, existing_paths.copy()
+                return True, file_hash, duplicate_paths
             
             # Not a duplicate - add to cache if requested
             if compute_if_missing:
-                self._cache[file_hash].append(file_path_str)
+                self._cache_path(file_hash, file_path_str)
+                self._track(size, file_path_str, sample)
                 logger.debug(
-                    f"Added to cache: {file_path.name} "
+                    f"Added to cache: {display_name} "
                     f"(hash: {file_hash[:16]}...)"
                 )
             
             return False, file_hash, None
     
+    @staticmethod
+    def _content_size(source) -> int:
+        """
+        Return the size in bytes of a file, bytes-like object or stream.
+        
+        Raises:
+            FileDiscoveryError: If a file cannot be stat'ed
+        """
+        if isinstance(source, Path):
+            try:
+                return source.stat().st_size
+            except OSError as e:
+                raise FileDiscoveryError(
+                    f"Cannot hash non-existent file: {source}",
+                    details={"file_path": str(source), "error": str(e)}
+                )
+        if isinstance(source, (bytes, bytearray)):
+            return len(source)
+        if isinstance(source, memoryview):
+            return source.nbytes
+        
+        start = source.tell()
+        size = source.seek(0, 2)
+        source.seek(start)
+        return size
+    
+    def _cache_path(self, file_hash: str, path_str: str):
+        """Add a path under its hash, keeping the running stats current."""
+        paths = self._cache[file_hash]
+        paths.append(path_str)
+        self._stats["total_files"] += 1
+        if len(paths) == 2:
+            self._stats["duplicate_groups"] += 1
+            self._stats["duplicate_files"] += 2
+        elif len(paths) > 2:
+            self._stats["duplicate_files"] += 1
+    
+    def _recount(self):
+        """Rebuild the running stats from the cache (after bulk imports)."""
+        unhashed = self._stats["unhashed_files"]
+        self._stats.clear()
+        self._stats["unhashed_files"] = unhashed
+        for paths in self._cache.values():
+            self._stats["total_files"] += len(paths)
+            if len(paths) > 1:
+                self._stats["duplicate_groups"] += 1
+                self._stats["duplicate_files"] += len(paths)
+    
+    def _defer(self, size: int, sample: Optional[str], path_str: str):
+        """Record a path whose hash is deferred."""
+        self._unhashed.setdefault(size, {})[sample] = path_str
+        self._stats["unhashed_files"] += 1
+    
+    def _track(self, size: int, path_str: str, sample: Optional[str] = None):
+        """Record a path under its size (and sample, for large files)."""
+        self._size_index[size].append(path_str)
+        if size >= _SAMPLE_MIN_SIZE:
+            self._sample_counts[(size, sample)] += 1
+    
+    def _untrack(self, size: int, path_str: str, sample: Optional[str] = None):
+        """Forget a deferred path that can no longer be read."""
+        self._size_index[size].remove(path_str)
+        if not self._size_index[size]:
+            del self._size_index[size]
+        if size >= _SAMPLE_MIN_SIZE:
+            self._sample_counts[(size, sample)] -= 1
+    
+    def _sample_fingerprint(self, source: HashSource, size: int) -> str:
+        """
+        Digest the first, middle and last 64 KiB of content.
+        
+        Differing samples prove the content differs; matching samples only
+        mean a full hash is needed.
+        
+        Args:
+            source (HashSource): File, bytes, or binary stream
+            size (int): Content size in bytes (at least _SAMPLE_MIN_SIZE)
+            
+        Returns:
+            str: Hex digest of the sampled bytes
+            
+        Raises:
+            FileDiscoveryError: If the content cannot be read
+        """
+        offsets = (0, (size - _SAMPLE_SIZE) // 2, size - _SAMPLE_SIZE)
+        digest = _chunk_digest()
+        
+        try:
+            if isinstance(source, Path):
+                with open(source, "rb") as f:
+                    for offset in offsets:
+                        f.seek(offset)
+                        digest.update(f.read(_SAMPLE_SIZE))
+            elif isinstance(source, (bytes, bytearray, memoryview)):
+                view = memoryview(source)
+                for offset in offsets:
+                    digest.update(view[offset:offset + _SAMPLE_SIZE])
+            elif hasattr(source, "getbuffer"):
+                with source.getbuffer() as view:
+                    for offset in offsets:
+                        digest.update(view[offset:offset + _SAMPLE_SIZE])
+            else:
+                start = source.tell()
+                try:
+                    for offset in offsets:
+                        source.seek(offset)
+                        digest.update(source.read(_SAMPLE_SIZE))
+                finally:
+                    source.seek(start)
+        except (OSError, ValueError) as e:
+            raise FileDiscoveryError(
+                f"Failed to sample content: {str(e)}",
+                details={"source": str(source)[:200], "error": str(e)}
+            )
+        
+        return digest.hexdigest()
+    
+    def _begin_resolving(self, size: int) -> Tuple[Event, int]:
+        """
+        Register in-flight work on deferred files of ``size``.
+        
+        Called with the lock held.
+        
+        Returns:
+            Tuple[Event, int]: Event set when the work finishes, and the
+            reset count to compare against before merging results
+        """
+        done = Event()
+        self._resolving[size].append(done)
+        return done, self._resets
+    
+    def _end_resolving(self, size: int, done: Event):
+        """Unregister in-flight work and wake threads waiting on it."""
+        with self._lock:
+            waiting = self._resolving[size]
+            waiting.remove(done)
+            if not waiting:
+                del self._resolving[size]
+        done.set()
+    
+    def _sample_deferred(self, size: int):
+        """
+        Sample the file deferred by size alone, if any, so it can be
+        compared by sample instead of being hashed in full.
+        
+        Called without the lock: the entry is claimed under the lock,
+        sampled without it and merged back. Its size-only sample count is
+        kept until then, so concurrent checks treat it conservatively.
+        
+        Args:
+            size (int): File size bucket (at least _SAMPLE_MIN_SIZE)
+        """
+        with self._lock:
+            pending = self._unhashed.get(size)
+            path_str = pending.pop(None, None) if pending else None
+            if path_str is None:
+                return
+            if not pending:
+                del self._unhashed[size]
+            done, resets = self._begin_resolving(size)
+        
+        try:
+            try:
+                sample = self._sample_fingerprint(Path(path_str), size)
+                error = None
+            except FileDiscoveryError as e:
+                sample, error = None, e
+            
+            with self._lock:
+                if resets != self._resets:
+                    return
+                if error is not None:
+                    logger.warning(f"Dropping deferred cache entry {path_str}: {error.message}")
+                    self._untrack(size, path_str)
+                    self._stats["unhashed_files"] -= 1
+                    return
+                self._sample_counts[(size, None)] -= 1
+                self._sample_counts[(size, sample)] += 1
+                self._unhashed.setdefault(size, {})[sample] = path_str
+        finally:
+            self._end_resolving(size, done)
+    
+    def _resolve_unhashed(self, size: int, sample: Optional[str] = None):
+        """
+        Hash deferred files of the given size into the cache.
+        
+        Called without the lock: entries are claimed under the lock, hashed
+        without it and merged back. Use _settled() to also wait for work
+        claimed by other threads. A deferred file that has since
+        disappeared is dropped.
+        
+        Args:
+            size (int): File size bucket to resolve
+            sample (Optional[str]): Only resolve the file deferred with this
+                sample (files with other samples cannot match); a file
+                deferred by size alone is sampled first. None resolves all
+                deferred files of this size.
+        """
+        if sample is not None:
+            self._sample_deferred(size)
+        
+        with self._lock:
+            pending = self._unhashed.get(size)
+            if not pending:
+                return
+            keys = [sample] if sample is not None else list(pending)
+            claimed = [(key, pending.pop(key)) for key in keys if key in pending]
+            if not pending:
+                del self._unhashed[size]
+            if not claimed:
+                return
+            done, resets = self._begin_resolving(size)
+        
+        try:
+            hashed = []
+            for key, path_str in claimed:
+                try:
+                    file_hash = self.compute_hash(Path(path_str))
+                except FileDiscoveryError as e:
+                    logger.warning(f"Dropping deferred cache entry {path_str}: {e.message}")
+                    file_hash = None
+                hashed.append((key, path_str, file_hash))
+            
+            with self._lock:
+                if resets != self._resets:
+                    return
+                for key, path_str, file_hash in hashed:
+                    self._stats["unhashed_files"] -= 1
+                    if file_hash is None:
+                        self._untrack(size, path_str, key)
+                    else:
+                        self._cache_path(file_hash, path_str)
+        finally:
+            self._end_resolving(size, done)
+    
+    @contextmanager
+    def _settled(self, size: int, sample: Optional[str] = None):
+        """
+        Hold the lock once no deferred file that could match is unhashed.
+        
+        Resolves deferred files of ``size`` (only those with ``sample``,
+        if given), waits for other threads' in-flight work on that size,
+        and repeats until a lookup under the lock sees every candidate.
+        
+        Args:
+            size (int): File size bucket
+            sample (Optional[str]): Sample fingerprint of the file being
+                checked, if it has one
+        """
+        while True:
+            self._resolve_unhashed(size, sample)
+            self._lock.acquire()
+            pending = self._unhashed.get(size) or {}
+            waiting = list(self._resolving.get(size, ()))
+            if not waiting and not (
+                pending if sample is None else (sample in pending or None in pending)
+            ):
+                break
+            self._lock.release()
+            for done in waiting:
+                done.wait()
+        try:
+            yield
+        finally:
+            self._lock.release()
+    
+    def _new_hasher(self):
+        """Create a fresh hash object for the configured algorithm."""
+        if self._blake3 is not None:
+            return self._blake3.blake3(max_threads=self._blake3.blake3.AUTO)
+        return hashlib.new(self.algorithm)
+    
+    def _hash_in_memory(self, source) -> str:
+        """
+        Hash bytes-like content or a binary stream without touching disk.
+        
+        Buffers exposing getbuffer() (BytesIO, Streamlit UploadedFile) are
+        hashed through a zero-copy view; other streams are read in chunks
+        and rewound to their starting position.
+        
+        Args:
+            source: Bytes-like object or binary stream
+            
+        Returns:
+            str: Hexadecimal hash digest
+            
+        Raises:
+            FileDiscoveryError: If the stream cannot be read
+        """
+        hasher = self._new_hasher()
+        
+        try:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                hasher.update(source)
+            elif hasattr(source, "getbuffer"):
+                with source.getbuffer() as view:
+                    hasher.update(view)
+            else:
+                start = source.tell()
+                try:
+                    while chunk := source.read(self.chunk_size):
+                        hasher.update(chunk)
+                finally:
+                    source.seek(start)
+        except (OSError, ValueError) as e:
+            raise FileDiscoveryError(
+                f"Failed to read in-memory content for hashing: {str(e)}",
+                details={"error": str(e)}
+            )
+        
+        return hasher.hexdigest()
+    
     def add_to_cache(self, file_path: Path, file_hash: Optional[str] = None) -> str:
         """
         Explicitly add file to duplicate detection cache.
@@ -276,11 +769,19 @@ class DuplicateDetector:
             file_hash = self.compute_hash(file_path)
         
         file_path_str = str(file_path)
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = None
         
         with self._lock:
             # Only add if not already present
-            if file_path_str not in self._cache[file_hash]:
-                self._cache[file_hash].append(file_path_str)
+            if file_path_str not in self._cache.get(file_hash, ()):
+                self._cache_path(file_hash, file_path_str)
+                if size is None:
+                    self._sizes_complete = False
+                else:
+                    self._track(size, file_path_str)
                 logger.debug(
                     f"Added to cache: {file_path.name} "
                     f"(hash: {file_hash[:16]}...)"
@@ -312,8 +813,9 @@ class DuplicateDetector:
         """
         file_hash = self.compute_hash(file_path)
         file_path_str = str(file_path)
+        size = self._content_size(file_path)
         
-        with self._lock:
+        with self._settled(size):
             if file_hash in self._cache:
                 # Return all paths except the query file
                 duplicates = [
@@ -324,6 +826,133 @@ class DuplicateDetector:
             
             return None
     
+    def near_duplicates(
+        self,
+        file_path: HashSource,
+        name: Optional[str] = None,
+        threshold: float = 0.8,
+        record: bool = True
+    ) -> List[Tuple[str, float]]:
+        """
+        Find previously seen files with mostly the same content.
+        
+        Splits content into content-defined chunks and compares chunk sets
+        by Jaccard similarity, so files that differ by an inserted or
+        deleted row still match. Uses FastCDC when the ``fastcdc`` package
+        is installed; otherwise chunks at newlines, which suits CSV and
+        text files. Costs roughly one extra pass over the content.
+        
+        Args:
+            file_path (HashSource): File, bytes, or binary stream to check
+            name (Optional[str]): Name recorded for in-memory content
+                (default: "<memory>"; ignored for paths)
+            threshold (float): Minimum Jaccard similarity (default: 0.8)
+            record (bool): Remember this content's fingerprints for later
+                checks (default: True)
+                
+        Returns:
+            List[Tuple[str, float]]: (path, similarity) pairs, most similar
+                first
+                
+        Example:
+            >>> detector.near_duplicates(Path("claims_v1.csv"))
+            []
+            >>> detector.near_duplicates(Path("claims_v2.csv"))
+            [('claims_v1.csv', 0.94)]
+        """
+        on_disk = isinstance(file_path, Path)
+        key = str(file_path) if on_disk else (name or "<memory>")
+        fingerprints = self._chunk_fingerprints(file_path)
+        
+        if not fingerprints:
+            return []
+        
+        with self._lock:
+            # Count shared chunks per candidate via the inverted index
+            shared = Counter()
+            for fingerprint in fingerprints:
+                shared.update(self._chunk_index.get(fingerprint, ()))
+            
+            matches = []
+            for other, common in shared.items():
+                if on_disk and other == key:
+                    continue
+                union = len(fingerprints) + len(self._chunk_sets[other]) - common
+                similarity = common / union
+                if similarity >= threshold:
+                    matches.append((other, round(similarity, 3)))
+            
+            if record:
+                previous = self._chunk_sets.pop(key, None)
+                if previous:
+                    for fingerprint in previous:
+                        self._chunk_index[fingerprint].discard(key)
+                self._chunk_sets[key] = fingerprints
+                for fingerprint in fingerprints:
+                    self._chunk_index[fingerprint].add(key)
+        
+        matches.sort(key=lambda match: match[1], reverse=True)
+        if matches:
+            logger.info(
+                f"Near-duplicate: {Path(key).name} resembles {len(matches)} file(s) "
+                f"(best {matches[0][1]:.0%})"
+            )
+        return matches
+    
+    def _chunk_fingerprints(self, source: HashSource) -> Set[str]:
+        """
+        Split content into content-defined chunks and digest each one.
+        
+        Args:
+            source (HashSource): File, bytes, or binary stream
+            
+        Returns:
+            Set[str]: Hex digests of distinct chunks
+            
+        Raises:
+            FileDiscoveryError: If the content cannot be read
+        """
+        try:
+            if isinstance(source, Path):
+                data = source.read_bytes()
+            elif isinstance(source, (bytes, bytearray, memoryview)):
+                data = bytes(source)
+            elif hasattr(source, "getvalue"):
+                data = source.getvalue()
+            else:
+                start = source.tell()
+                try:
+                    data = source.read()
+                finally:
+                    source.seek(start)
+        except (OSError, ValueError) as e:
+            raise FileDiscoveryError(
+                f"Failed to read content for chunking: {str(e)}",
+                details={"source": str(source)[:200], "error": str(e)}
+            )
+        
+        if not data:
+            return set()
+        
+        try:
+            from fastcdc import fastcdc
+        except ImportError:
+            return {
+                _chunk_digest(line).hexdigest()
+                for line in data.split(b"\n") if line.strip()
+            }
+        
+        return {
+            chunk.hash
+            for chunk in fastcdc(
+                data,
+                min_size=_CDC_MIN_SIZE,
+                avg_size=_CDC_AVG_SIZE,
+                max_size=_CDC_MAX_SIZE,
+                hf=_chunk_digest
+            )
+        }
+    
     def get_all_duplicates(self) -> Dict[str, List[str]]:
         """
         Get all duplicate file groups in cache.
@@ -348,6 +977,20 @@ class DuplicateDetector:
                 if len(paths) > 1
             }
     
+    @property
+    def generation(self) -> int:
+        """
+        Counter bumped by clear_cache() and import_cache().
+        
+        Incremental uploads only ever add paths, so together with the
+        duplicate counts from get_cache_stats() it identifies the current
+        set of duplicate groups (e.g. for caching a snapshot of them).
+        
+        Returns:
+            int: Number of clears/imports since the detector was created
+        """
+        return self._generation
+    
     def clear_cache(self):
         """
         Clear all entries from duplicate detection cache.
@@ -361,9 +1004,18 @@ class DuplicateDetector:
         """
         with self._lock:
             cache_size = len(self._cache)
-            total_files = sum(len(paths) for paths in self._cache.values())
+            total_files = self._stats["total_files"] + self._stats["unhashed_files"]
             
             self._cache.clear()
+            self._size_index.clear()
+            self._unhashed.clear()
+            self._sample_counts.clear()
+            self._stats.clear()
+            self._sizes_complete = True
+            self._chunk_sets.clear()
+            self._chunk_index.clear()
+            self._generation += 1
+            self._resets += 1
             
             logger.info(
                 f"Cleared cache: removed {cache_size} unique hashes "
@@ -377,7 +1029,9 @@ class DuplicateDetector:
         Returns:
             Dict[str, int]: Statistics dictionary with keys:
                 - unique_hashes: Number of unique content hashes
-                - total_files: Total number of cached files
+                - total_files: Total number of cached files, including
+                  files not yet hashed because their size is unique
+                - unhashed_files: Files tracked by size or sample only
                 - duplicate_groups: Number of hash groups with duplicates
                 - duplicate_files: Total files involved in duplication
                 
@@ -387,24 +1041,13 @@ class DuplicateDetector:
             >>> print(f"Found {stats['duplicate_groups']} duplicate groups")
         """
         with self._lock:
-            unique_hashes = len(self._cache)
-            total_files = sum(len(paths) for paths in self._cache.values())
-            
-            # Count groups with duplicates
-            duplicate_groups = sum(
-                1 for paths in self._cache.values() if len(paths) > 1
-            )
-            
-            # Count files involved in duplication
-            duplicate_files = sum(
-                len(paths) for paths in self._cache.values() if len(paths) > 1
-            )
-            
+            # Running totals: no walk over the cache on each call
             return {
-                "unique_hashes": unique_hashes,
-                "total_files": total_files,
-                "duplicate_groups": duplicate_groups,
-                "duplicate_files": duplicate_files
+                "unique_hashes": len(self._cache),
+                "total_files": self._stats["total_files"] + self._stats["unhashed_files"],
+                "unhashed_files": self._stats["unhashed_files"],
+                "duplicate_groups": self._stats["duplicate_groups"],
+                "duplicate_files": self._stats["duplicate_files"]
             }
     
     def export_cache(self) -> Dict[str, List[str]]:
@@ -412,7 +1055,8 @@ class DuplicateDetector:
         Export cache contents for persistence or analysis.
         
         Returns full cache mapping for serialization to JSON, database,
-        or other storage formats.
+        or other storage formats. Files deferred by the size shortcut are
+        hashed first so the export is complete.
         
         Returns:
             Dict[str, List[str]]: Complete hash -> paths mapping
@@ -426,7 +1070,19 @@ class DuplicateDetector:
             >>> with open("cache.json", "w") as f:
             ...     json.dump(cache_data, f)
         """
-        with self._lock:
+        while True:
+            self._lock.acquire()
+            sizes = list(self._unhashed)
+            waiting = [done for events in self._resolving.values() for done in events]
+            if not sizes and not waiting:
+                break
+            self._lock.release()
+            for size in sizes:
+                self._resolve_unhashed(size)
+            for done in waiting:
+                done.wait()
+        
+        try:
             cache_copy = {
                 hash_val: paths.copy()
                 for hash_val, paths in self._cache.items()
@@ -438,13 +1094,16 @@ class DuplicateDetector:
             )
             
             return cache_copy
+        finally:
+            self._lock.release()
     
     def import_cache(self, cache_data: Dict[str, List[str]], merge: bool = False):
         """
         Import cache contents from external source.
         
         Loads cache data from dictionary, either replacing or merging with
-        existing cache contents.
+        existing cache contents. Imported entries carry no file sizes, so
+        the size shortcut in is_duplicate() is disabled until clear_cache().
         
         Args:
             cache_data (Dict[str, List[str]]): Hash -> paths mapping to import
@@ -464,6 +1123,15 @@ class DuplicateDetector:
         with self._lock:
             if not merge:
                 self._cache.clear()
+                self._size_index.clear()
+                self._unhashed.clear()
+                self._sample_counts.clear()
+                self._stats.clear()
+                self._sizes_complete = True
+                self._resets += 1
+            
+            if cache_data:
+                self._sizes_complete = False
             
             for hash_val, paths in cache_data.items():
                 if merge and hash_val in self._cache:
@@ -475,8 +1143,10 @@ class DuplicateDetector:
                 else:
                     self._cache[hash_val] = list(paths)
             
+            self._recount()
+            self._generation += 1
             total_hashes = len(self._cache)
-            total_files = sum(len(paths) for paths in self._cache.values())
+            total_files = self._stats["total_files"]
             
             logger.info(
                 f"Imported cache ({'merged' if merge else 'replaced'}): "
@@ -18,8 +18,10 @@ Module Output:
 """
 
 import mimetypes
+import os
 from pathlib import Path
-from typing import List, Set, Optional, Dict
+import stat
+from typing import List, Set, FrozenSet, Optional, Dict, Union
 from enum import Enum
 
 from MBA.core.exceptions import FileDiscoveryError
@@ -89,7 +91,8 @@ class FileProcessor:
     keys based on file characteristics.
     
     Attributes:
-        allowed_extensions (Set[str]): Set of permitted file extensions
+        allowed_extensions (Optional[FrozenSet[str]]): Lowercased permitted
+            file extensions, or None to allow all types
         follow_symlinks (bool): Whether to follow symbolic links
         max_file_size_mb (int): Maximum allowed file size in megabytes
         
@@ -118,12 +121,13 @@ class FileProcessor:
             - Logs processor initialization
             - Initializes mimetypes database
         """
-        self.allowed_extensions = (
-            {ext.lower() for ext in allowed_extensions}
+        self.allowed_extensions: Optional[FrozenSet[str]] = (
+            frozenset(ext.lower() for ext in allowed_extensions)
             if allowed_extensions else None
         )
         self.follow_symlinks = follow_symlinks
         self.max_file_size_mb = max_file_size_mb
+        self._max_file_size_bytes = max_file_size_mb * 1024 * 1024
         
         # Initialize mimetypes database
         mimetypes.init()
@@ -215,10 +219,11 @@ class FileProcessor:
                 
                 # Check file size
                 try:
-                    size_mb = item.stat().st_size / (1024 * 1024)
-                    if size_mb > self.max_file_size_mb:
+                    size_bytes = item.stat().st_size
+                    if size_bytes > self._max_file_size_bytes:
                         logger.warning(
-                            f"Skipping oversized file ({size_mb:.1f}MB): {item}"
+                            f"Skipping oversized file "
+                            f"({size_bytes / (1024 * 1024):.1f}MB): {item}"
                         )
                         continue
                 except OSError as e:
@@ -318,15 +323,16 @@ class FileProcessor:
         
         return detected_type
     
-    def get_document_type(self, file_path: Path) -> DocumentType:
+    def get_document_type(self, file_path: Union[Path, str]) -> DocumentType:
         """
         Determine document type from file extension.
         
         Maps file extension to DocumentType enum for routing and
-        categorization purposes.
+        categorization purposes. Plain file names are accepted too, so
+        upload paths need not build a Path just to read the suffix.
         
         Args:
-            file_path (Path): File path for type detection
+            file_path (Union[Path, str]): File path or name for type detection
             
         Returns:
             DocumentType: Enum value representing document category
@@ -334,15 +340,13 @@ class FileProcessor:
         Example:
             >>> processor.get_document_type(Path("report.pdf"))
             <DocumentType.PDF: 'pdf'>
-            >>> processor.get_document_type(Path("data.xlsx"))
+            >>> processor.get_document_type("data.xlsx")
             <DocumentType.EXCEL: 'excel'>
         """
-        extension = file_path.suffix.lower()
+        extension = os.path.splitext(file_path)[1].lower()
         doc_type = EXTENSION_TO_TYPE.get(extension, DocumentType.UNKNOWN)
         
-        logger.debug(
-            f"Document type for {file_path.name}: {doc_type.value}"
-        )
+        logger.debug(f"Document type for {file_path}: {doc_type.value}")
         
         return doc_type
     
@@ -455,34 +459,76 @@ class FileProcessor:
             >>> processor.validate_file(Path("huge_file.pdf"))  # 50MB
             False
         """
-        # Check existence
-        if not file_path.exists():
+        # Check extension first - it is pure string work, so disallowed
+        # files are rejected without touching the filesystem
+        if self.allowed_extensions:
+            if file_path.suffix.lower() not in self.allowed_extensions:
+                logger.debug(
+                    f"Validation failed: extension not allowed - {file_path}"
+                )
+                return False
+        
+        # Existence, type and size all come from a single stat() call
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             logger.debug(f"Validation failed: file not found - {file_path}")
             return False
+        except OSError as e:
+            logger.debug(f"Validation failed: cannot stat file - {file_path}: {e}")
+            return False
         
         # Check it's a file
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.debug(f"Validation failed: not a file - {file_path}")
             return False
         
+        # Check file size
+        if st.st_size > self._max_file_size_bytes:
+            logger.debug(
+                f"Validation failed: file too large "
+                f"({st.st_size / (1024 * 1024):.1f}MB) - {file_path}"
+            )
+            return False
+        
+        return True
+    
+    def validate_upload(self, file_name: str, size_bytes: int) -> bool:
+        """
+        Validate in-memory upload by name and size without touching disk.
+        
+        Applies the same extension and size rules as validate_file() to
+        content that has not been written to the filesystem, such as a
+        file received from a web upload form.
+        
+        Args:
+            file_name (str): Original filename (used for extension check)
+            size_bytes (int): Content size in bytes
+            
+        Returns:
+            bool: True if upload is valid for processing
+            
+        Side Effects:
+            - Logs validation failures at DEBUG level
+            
+        Example:
+            >>> processor.validate_upload("report.pdf", 2_000_000)
+            True
+        """
         # Check extension
         if self.allowed_extensions:
-            if file_path.suffix.lower() not in self.allowed_extensions:
+            if os.path.splitext(file_name)[1].lower() not in self.allowed_extensions:
                 logger.debug(
-                    f"Validation failed: extension not allowed - {file_path}"
+                    f"Validation failed: extension not allowed - {file_name}"
                 )
                 return False
         
-        # Check file size
-        try:
-            size_mb = file_path.stat().st_size / (1024 * 1024)
-            if size_mb > self.max_file_size_mb:
-                logger.debug(
-                    f"Validation failed: file too large ({size_mb:.1f}MB) - {file_path}"
-                )
-                return False
-        except OSError as e:
-            logger.debug(f"Validation failed: cannot stat file - {file_path}: {e}")
+        # Check size
+        if size_bytes > self._max_file_size_bytes:
+            logger.debug(
+                f"Validation failed: file too large "
+                f"({size_bytes / (1024 * 1024):.1f}MB) - {file_name}"
+            )
             return False
         
         return True
\ No newline at end of file
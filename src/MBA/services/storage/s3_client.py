@@ -2,8 +2,9 @@
 S3 client for reliable file uploads with retry logic and metadata support.
 
 This module provides a robust S3Client class for uploading files to AWS S3
-with automatic MIME type detection, configurable metadata, and exponential
-backoff retry logic for transient failures.
+with automatic MIME type detection, configurable metadata, and botocore's
+adaptive retry mode (jittered backoff with client-side rate limiting) for
+transient failures.
 
 Module Input:
     - File paths from local filesystem
@@ -17,13 +18,31 @@ Module Output:
     - Upload status and error details via logging
 """
 
+import asyncio
+import base64
+import errno
+import gzip
+import hashlib
+import io
+import json
 import mimetypes
+import mmap
 import os
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Any, BinaryIO, Optional, Dict, Iterable, Iterator, List, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
 
 from MBA.core.exceptions import UploadError, ConfigError
@@ -32,14 +51,151 @@ from MBA.core.settings import settings
 
 logger = get_logger(__name__)
 
+# Files at or above this size go through multipart upload
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+# urllib3 pool size shared by concurrent uploads (botocore default is 10)
+_MAX_POOL_CONNECTIONS = 32
+
+# Read buffer for single-PUT bodies, so the socket sees large writes
+_STREAM_BUFFER_SIZE = 1 << 20
+
+# Slice size when feeding memory-mapped files to the MD5 hasher
+_MD5_SLICE_SIZE = 1 << 22
+
+# Server-side copies move data inside S3, so larger parts are cheap
+_COPY_TRANSFER_CONFIG = TransferConfig(
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16
+)
+
+# Content types worth gzip-compressing before upload
+_COMPRESSIBLE_TYPES = frozenset({"application/json", "application/xml"})
+
+# Buffer size for streaming compression (small buffers thrash syscalls)
+_COMPRESS_BUFFER_SIZE = 1 << 20
+
+# Worker count for the s5cmd bulk-upload path
+_S5CMD_NUM_WORKERS = 256
+
+# Characters the s5cmd command file cannot carry literally: quotes and
+# escapes break its argument parsing, and it expands glob characters in
+# source paths. Such files go through boto3 instead.
+_S5CMD_UNSAFE_CHARS = frozenset('"\\*?[]{}\n\r')
+
+# Extended attributes recording the last successful upload of a local file
+_XATTR_URI = "user.mba.s3_uri"
+_XATTR_STAT = "user.mba.s3_stat"
+_XATTR_ETAG = "user.mba.s3_etag"
+
+# Sidecar file suffix used where extended attributes are unavailable
+_SIDECAR_SUFFIX = ".s3meta"
+
+# Upload state rows buffered before one executemany/commit
+_STATE_COMMIT_BATCH = 100
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    path TEXT PRIMARY KEY,
+    stat TEXT,
+    s3_uri TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    ts REAL NOT NULL
+)
+"""
+
+# Load the platform MIME database once so the first lookup is not slow
+mimetypes.init()
+
+
+@lru_cache(maxsize=256)
+def _guess_by_suffix(extension: str) -> str:
+    """
+    Resolve MIME type for a lowercased file extension (cached).
+
+    Args:
+        extension (str): File extension including leading dot (e.g. ".pdf")
+
+    Returns:
+        str: MIME type, or "application/octet-stream" if unknown
+    """
+    return (
+        mimetypes.types_map.get(extension)
+        or mimetypes.guess_type("x" + extension)[0]
+        or "application/octet-stream"
+    )
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the JSON sidecar path used when xattrs are unsupported."""
+    return path.with_name(path.name + _SIDECAR_SUFFIX)
+
+
+def _xattr_get(path: Path, name: str) -> Optional[str]:
+    """
+    Read an upload-tracking attribute from a local file.
+    
+    Uses extended attributes where the OS and filesystem support them,
+    falling back to a JSON sidecar file otherwise.
+    
+    Args:
+        path (Path): Local file
+        name (str): Attribute name (e.g. "user.mba.s3_uri")
+        
+    Returns:
+        Optional[str]: Attribute value, or None if not recorded
+    """
+    if hasattr(os, "getxattr"):
+        try:
+            return os.getxattr(path, name).decode("utf-8")
+        except OSError as e:
+            if e.errno not in (errno.ENOTSUP, errno.EOPNOTSUPP):
+                return None
+    
+    try:
+        return json.loads(_sidecar_path(path).read_text()).get(name)
+    except (OSError, ValueError):
+        return None
+
+
+def _xattr_set(path: Path, name: str, value: str):
+    """
+    Write an upload-tracking attribute to a local file.
+    
+    Args:
+        path (Path): Local file
+        name (str): Attribute name
+        value (str): Attribute value
+        
+    Side Effects:
+        - Sets an extended attribute, or updates the JSON sidecar file
+    """
+    if hasattr(os, "setxattr"):
+        try:
+            os.setxattr(path, name, value.encode("utf-8"))
+            return
+        except OSError as e:
+            if e.errno not in (errno.ENOTSUP, errno.EOPNOTSUPP):
+                raise
+    
+    sidecar = _sidecar_path(path)
+    try:
+        data = json.loads(sidecar.read_text())
+    except (OSError, ValueError):
+        data = {}
+    data[name] = value
+    sidecar.write_text(json.dumps(data))
+
 
 class S3Client:
     """
     Robust S3 client with automatic retries and MIME detection.
     
     Provides reliable file upload operations to AWS S3 with intelligent
-    MIME type detection, optional metadata attachment, and exponential
-    backoff retry logic for handling transient network failures.
+    MIME type detection, optional metadata attachment, and botocore's
+    adaptive retry mode for handling transient network failures and
+    S3 throttling (503 SlowDown) without synchronized retry storms.
     
     The client uses AWS credentials from settings and supports both
     single-file and batch upload operations.
@@ -47,12 +203,21 @@ class S3Client:
     Attributes:
         bucket (str): Target S3 bucket name
         prefix (str): S3 key prefix for all uploads
-        max_retries (int): Maximum retry attempts for failed uploads
-        retry_delay (float): Initial delay in seconds between retries
+        max_retries (int): Maximum attempts per request (passed to botocore)
+        retry_delay (float): Retained for backward compatibility; backoff
+            timing is handled by botocore's adaptive retry mode
+        compress_text (bool): Gzip compressible payloads before upload
+        dedup (bool): Skip unchanged files already uploaded to the same URI
+        state_path (Optional[str]): SQLite upload log used to resume batches
+        max_concurrency (int): Parallel multipart part uploads
         _s3_client: Boto3 S3 client instance
+        _transfer_manager: Long-lived s3transfer manager shared by all
+            uploads so its thread pool and connections stay warm
         
     Thread Safety:
-        Not thread-safe. Create separate instances for concurrent use.
+        Upload methods are safe to call from multiple threads; the boto3
+        client and transfer manager are shared. The async client is bound
+        to a single event loop.
     """
     
     def __init__(
@@ -60,7 +225,11 @@ class S3Client:
         bucket: str,
         prefix: str = "",
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        compress_text: bool = False,
+        dedup: bool = False,
+        state_path: Optional[str] = None,
+        max_concurrency: int = 16
     ):
         """
         Initialize S3 client with bucket and upload configuration.
@@ -72,14 +241,27 @@ class S3Client:
         Args:
             bucket (str): Target S3 bucket name
             prefix (str): S3 key prefix (default: "")
-            max_retries (int): Maximum upload retry attempts (default: 3)
-            retry_delay (float): Initial retry delay in seconds (default: 1.0)
+            max_retries (int): Maximum attempts per request (default: 3)
+            retry_delay (float): Unused, kept for backward compatibility
+                (default: 1.0)
+            compress_text (bool): Gzip text/JSON/XML files before upload and
+                store them with ``ContentEncoding: gzip`` (default: False)
+            dedup (bool): Skip re-uploading local files whose size and mtime
+                match the upload recorded in their xattrs (default: False)
+            state_path (Optional[str]): Path of a SQLite file recording the
+                outcome of every batch upload; batches skip files already
+                logged as uploaded (default: None, no state log)
+            max_concurrency (int): Threads the shared transfer manager uses
+                for multipart parts across all uploads (default: 16)
             
         Raises:
-            ConfigError: If AWS credentials are invalid or bucket is empty
+            ConfigError: If AWS credentials are invalid, bucket is empty or
+                the state database cannot be opened
             
         Side Effects:
             - Creates boto3 S3 client with session credentials
+            - Creates a shared transfer manager (thread pool)
+            - Opens or creates the SQLite state log if state_path is given
             - Logs client initialization
         """
         if not bucket:
@@ -89,36 +271,78 @@ class S3Client:
         self.prefix = prefix.rstrip("/") + "/" if prefix else ""
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.compress_text = compress_text
+        self.dedup = dedup
+        self.state_path = state_path
+        self.max_concurrency = max_concurrency
+        
+        # Settings are read once here; pydantic attribute access is not free
+        # and these values are needed on every upload
+        self._sse = settings.s3_sse
+        self._uri_prefix = f"s3://{self.bucket}/"
+        
+        # Upload arguments shared by every PUT; per-file fields are layered on top
+        self._base_extra_args = {"ServerSideEncryption": self._sse}
+        
+        # Durable upload log: survives crashes so long batches can resume
+        self._state_db = None
+        self._state_lock = threading.Lock()
+        self._state_rows = []
+        if state_path:
+            self._state_db = self._open_state_db(state_path)
         
         try:
             # CRITICAL FIX: Detect if running in Lambda
             is_lambda = 'AWS_EXECUTION_ENV' in os.environ or 'AWS_LAMBDA_FUNCTION_NAME' in os.environ
             
+            # Session arguments are kept so the async client can reuse them
+            self._session_kwargs = {"region_name": settings.aws_default_region}
+            
             if is_lambda:
                 # In Lambda: Use execution role automatically (NO explicit credentials)
-                session = boto3.Session(region_name=settings.aws_default_region)
                 logger.info("Running in AWS Lambda - using execution role for S3")
             else:
                 # Running locally: Use credentials from settings if available
-                session_kwargs = {}
                 if settings.aws_profile:
-                    session_kwargs["profile_name"] = settings.aws_profile
+                    self._session_kwargs["profile_name"] = settings.aws_profile
                 elif settings.aws_access_key_id and settings.aws_secret_access_key:
-                    session_kwargs.update({
+                    self._session_kwargs.update({
                         "aws_access_key_id": settings.aws_access_key_id,
                         "aws_secret_access_key": settings.aws_secret_access_key
                     })
-                
-                session = boto3.Session(
-                    region_name=settings.aws_default_region,
-                    **session_kwargs
-                )
                 logger.info("Running locally - using credentials from settings")
             
-            self._s3_client = session.client("s3")
+            session = boto3.Session(**self._session_kwargs)
+            
+            # Adaptive mode adds full-jitter backoff and token-bucket client-side
+            # throttling; permanent errors (NoSuchBucket, AccessDenied) are not retried.
+            # The connection pool is sized for concurrent batch uploads plus
+            # multipart parts so urllib3 does not serialise them. SigV4 is
+            # pinned so pre-signed URLs sign Content-Length (botocore may
+            # otherwise presign with SigV2, which does not).
+            self._s3_client = session.client(
+                "s3",
+                config=Config(
+                    retries={"mode": "adaptive", "max_attempts": max_retries},
+                    max_pool_connections=_MAX_POOL_CONNECTIONS,
+                    signature_version="s3v4"
+                )
+            )
+            
+            # One transfer manager for the client lifetime: avoids per-upload
+            # thread-pool setup that s3transfer pays inside client.upload_file
+            self._transfer_manager = create_transfer_manager(
+                self._s3_client,
+                TransferConfig(
+                    multipart_threshold=_MULTIPART_THRESHOLD,
+                    multipart_chunksize=_MULTIPART_THRESHOLD,
+                    max_concurrency=max_concurrency,
+                    use_threads=True
+                )
+            )
             
             logger.info(
-                f"Initialized S3Client for bucket '{bucket}' with prefix '{self.prefix}'"
+                "Initialized S3Client for bucket '%s' with prefix '%s'", bucket, self.prefix
             )
             
         except Exception as e:
@@ -127,12 +351,158 @@ class S3Client:
                 details={"error": str(e), "bucket": bucket}
             )
     
+    def close(self):
+        """
+        Shut down the shared transfer manager and its worker threads.
+        
+        Safe to call multiple times.
+        
+        Side Effects:
+            - Waits for in-flight transfers and stops the thread pool
+            - Flushes and closes the upload state log
+        """
+        manager = getattr(self, "_transfer_manager", None)
+        if manager is not None:
+            self._transfer_manager = None
+            manager.shutdown()
+        
+        state_db = getattr(self, "_state_db", None)
+        if state_db is not None:
+            self._flush_state()
+            self._state_db = None
+            state_db.close()
+    
+    @staticmethod
+    def _open_state_db(state_path: str) -> sqlite3.Connection:
+        """
+        Open the SQLite upload log in WAL mode, creating it if needed.
+        
+        Args:
+            state_path (str): Database file path
+            
+        Returns:
+            sqlite3.Connection: Connection shared by upload threads
+            
+        Raises:
+            ConfigError: If the database cannot be opened or initialised
+        """
+        try:
+            conn = sqlite3.connect(state_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_STATE_SCHEMA)
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            raise ConfigError(
+                "Failed to open upload state database",
+                details={"state_path": state_path, "error": str(e)}
+            )
+    
+    def _log_state(
+        self,
+        file_path: Path,
+        s3_uri: Optional[str],
+        error: Optional[str] = None
+    ):
+        """
+        Buffer one upload outcome, writing a batch every 100 rows.
+        
+        Args:
+            file_path (Path): Local file the row refers to
+            s3_uri (Optional[str]): Destination URI on success
+            error (Optional[str]): Error message on failure
+        """
+        try:
+            file_stat = file_path.stat()
+            stat_sig = f"{file_stat.st_mtime_ns}:{file_stat.st_size}"
+        except OSError:
+            stat_sig = None
+        
+        row = (
+            str(file_path), stat_sig, s3_uri,
+            "FAILED" if error else "OK", error, time.time()
+        )
+        with self._state_lock:
+            self._state_rows.append(row)
+            if len(self._state_rows) >= _STATE_COMMIT_BATCH:
+                self._write_state_rows()
+    
+    def _flush_state(self):
+        """Write any buffered upload state rows."""
+        with self._state_lock:
+            self._write_state_rows()
+    
+    def _write_state_rows(self):
+        # Caller holds _state_lock
+        if not self._state_rows or self._state_db is None:
+            return
+        try:
+            with self._state_db:
+                self._state_db.executemany(
+                    "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?, ?, ?)",
+                    self._state_rows
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not write upload state: %s", e)
+        self._state_rows.clear()
+    
+    def resume(self, file_paths: Iterable[Path]) -> Iterator[Path]:
+        """
+        Filter out files the state log records as already uploaded.
+        
+        A file is skipped only if its last logged attempt succeeded and its
+        size and mtime are unchanged since then. Without a state log every
+        path is passed through.
+        
+        Args:
+            file_paths (Iterable[Path]): Candidate files
+            
+        Yields:
+            Path: Files that still need uploading
+            
+        Example:
+            >>> client = S3Client("my-bucket", state_path="s3_upload_log.sqlite")
+            >>> remaining = list(client.resume(Path("data").rglob("*.pdf")))
+        """
+        if self._state_db is None:
+            yield from file_paths
+            return
+        
+        skipped = 0
+        for file_path in file_paths:
+            with self._state_lock:
+                row = self._state_db.execute(
+                    "SELECT stat FROM uploads WHERE path = ? AND status = 'OK'",
+                    (str(file_path),)
+                ).fetchone()
+            if row is not None:
+                try:
+                    file_stat = file_path.stat()
+                    if row[0] == f"{file_stat.st_mtime_ns}:{file_stat.st_size}":
+                        skipped += 1
+                        continue
+                except OSError:
+                    pass
+            yield file_path
+        
+        if skipped:
+            logger.info("Resume skipped %d files already uploaded", skipped)
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _detect_content_type(self, file_path: Path) -> str:
         """
         Detect MIME type for file based on extension.
         
         Uses Python's mimetypes module to infer content type from file
-        extension. Falls back to binary octet-stream for unknown types.
+        extension. Lookups are cached per extension, so batches of
+        same-type files only hit the mimetypes database once. Falls back
+        to binary octet-stream for unknown types.
         
         Args:
             file_path (Path): Path to file for type detection
@@ -144,8 +514,137 @@ class S3Client:
             >>> client._detect_content_type(Path("doc.pdf"))
             'application/pdf'
         """
-        content_type, _ = mimetypes.guess_type(str(file_path))
-        return content_type or "application/octet-stream"
+        return _guess_by_suffix(file_path.suffix.lower())
+    
+    @staticmethod
+    def _record_upload(
+        file_path: Path,
+        s3_uri: str,
+        stat_sig: str,
+        etag: Optional[str]
+    ):
+        """
+        Record a successful upload on the local file for later dedup checks.
+        
+        Failures are logged and ignored; they only cost a re-upload later.
+        
+        Args:
+            file_path (Path): Uploaded local file
+            s3_uri (str): Destination URI
+            stat_sig (str): "mtime_ns:size" signature taken before upload
+            etag (Optional[str]): ETag returned by S3, if available
+        """
+        try:
+            _xattr_set(file_path, _XATTR_URI, s3_uri)
+            _xattr_set(file_path, _XATTR_STAT, stat_sig)
+            if etag:
+                _xattr_set(file_path, _XATTR_ETAG, etag)
+        except OSError as e:
+            logger.warning("Could not record upload metadata for %s: %s", file_path.name, e)
+    
+    @staticmethod
+    def _stream(file_path: Path) -> io.BufferedReader:
+        """
+        Open a file as a request body with a 1 MiB read buffer.
+        
+        The default 8 KiB buffer turns one upload into many small socket
+        writes; a larger buffer cuts syscalls and GIL hand-offs per PUT.
+        
+        Args:
+            file_path (Path): File to open
+            
+        Returns:
+            io.BufferedReader: Binary reader (caller must close it)
+        """
+        return io.BufferedReader(
+            io.FileIO(file_path, "rb"),
+            buffer_size=_STREAM_BUFFER_SIZE
+        )
+    
+    @staticmethod
+    def _md5_b64(file_path: Path) -> str:
+        """
+        Compute base64-encoded MD5 digest for the Content-MD5 header.
+        
+        Memory-maps the file and hashes it in 4 MiB slices, so the file is
+        read straight from the page cache without Python-level buffering.
+        
+        Args:
+            file_path (Path): File to hash
+            
+        Returns:
+            str: Base64-encoded MD5 digest
+        """
+        hasher = hashlib.md5()
+        with open(file_path, "rb") as f:
+            # mmap cannot map empty files
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        for offset in range(0, len(view), _MD5_SLICE_SIZE):
+                            hasher.update(view[offset:offset + _MD5_SLICE_SIZE])
+                    finally:
+                        view.release()
+        return base64.b64encode(hasher.digest()).decode("ascii")
+    
+    @staticmethod
+    def _md5_b64_fileobj(fileobj: BinaryIO) -> str:
+        """
+        Compute base64-encoded MD5 of a file object, rewinding it afterwards.
+        
+        In-memory buffers exposing getbuffer() are hashed without copying.
+        
+        Args:
+            fileobj (BinaryIO): Seekable binary file object
+            
+        Returns:
+            str: Base64-encoded MD5 digest
+        """
+        getbuffer = getattr(fileobj, "getbuffer", None)
+        if getbuffer is not None:
+            with getbuffer() as view:
+                digest = hashlib.md5(view).digest()
+        else:
+            hasher = hashlib.md5()
+            fileobj.seek(0)
+            while chunk := fileobj.read(_MD5_SLICE_SIZE):
+                hasher.update(chunk)
+            fileobj.seek(0)
+            digest = hasher.digest()
+        return base64.b64encode(digest).decode("ascii")
+    
+    @staticmethod
+    def _is_compressible(content_type: str) -> bool:
+        """Return True for text-like content types that gzip well."""
+        return content_type.startswith("text/") or content_type in _COMPRESSIBLE_TYPES
+    
+    @staticmethod
+    def _gzip_to_temp(file_path: Path) -> Path:
+        """
+        Stream-compress a file into a temporary gzip file.
+        
+        Args:
+            file_path (Path): Source file
+            
+        Returns:
+            Path: Temporary compressed file (caller must delete it)
+            
+        Raises:
+            UploadError: If compression fails
+        """
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".gz")
+        tmp_path = Path(tmp.name)
+        try:
+            with tmp, open(file_path, "rb") as src, gzip.GzipFile(fileobj=tmp, mode="wb") as gz:
+                shutil.copyfileobj(src, gz, length=_COMPRESS_BUFFER_SIZE)
+            return tmp_path
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise UploadError(
+                f"Failed to compress {file_path.name}",
+                details={"file_path": str(file_path), "error": str(e)}
+            )
     
     def _build_s3_key(self, file_path: Path, custom_key: Optional[str] = None) -> str:
         """
@@ -166,9 +665,7 @@ class S3Client:
             >>> client._build_s3_key(Path("report.pdf"))
             'mba/documents/report.pdf'
         """
-        if custom_key:
-            return f"{self.prefix}{custom_key.lstrip('/')}"
-        return f"{self.prefix}{file_path.name}"
+        return self.prefix + (custom_key.lstrip("/") if custom_key else file_path.name)
     
     def upload_file(
         self,
@@ -180,11 +677,13 @@ class S3Client:
         """
         Upload single file to S3 with retry logic.
         
-        Uploads a file to S3 with automatic MIME type detection, optional
-        metadata, and exponential backoff retry for transient failures.
+        Uploads a file to S3 with automatic MIME type detection and optional
+        metadata. Transient failures are retried inside botocore using the
+        adaptive retry mode configured on the client.
         
         Args:
-            file_path (Path): Local file to upload
+            file_path (Path): Local file to upload. An ``s3://`` URI string
+                is also accepted and dispatched to copy_object()
             s3_key (Optional[str]): Custom S3 key (default: uses filename)
             metadata (Optional[Dict[str, str]]): Custom metadata tags
             content_type (Optional[str]): Override MIME type detection
@@ -207,6 +706,10 @@ class S3Client:
             ... )
             's3://my-bucket/mba/contract.pdf'
         """
+        # Objects already in S3 are copied server-side instead of re-uploaded
+        if isinstance(file_path, str) and file_path.startswith("s3://"):
+            return self.copy_object(file_path, s3_key=s3_key, metadata=metadata)
+        
         # Validate file exists
         if not file_path.exists():
             raise UploadError(
@@ -222,65 +725,319 @@ class S3Client:
         
         # Build S3 key and detect content type
         key = self._build_s3_key(file_path, s3_key)
+        
+        # Fast path: file unchanged since its last upload to this exact URI
+        if self.dedup:
+            target_uri = self._uri_prefix + key
+            file_stat = file_path.stat()
+            stat_sig = f"{file_stat.st_mtime_ns}:{file_stat.st_size}"
+            if (
+                _xattr_get(file_path, _XATTR_URI) == target_uri
+                and _xattr_get(file_path, _XATTR_STAT) == stat_sig
+            ):
+                logger.info("Skipping unchanged file %s (already at %s)", file_path.name, target_uri)
+                return target_uri
+        
         detected_type = content_type or self._detect_content_type(file_path)
         
         # Prepare upload parameters
+        extra_args = {**self._base_extra_args, "ContentType": detected_type}
+        
+        if metadata:
+            extra_args["Metadata"] = metadata
+        
+        compressed_file = None
+        try:
+            source_path = file_path
+            if self.compress_text and self._is_compressible(detected_type):
+                compressed_file = self._gzip_to_temp(file_path)
+                source_path = compressed_file
+                extra_args["ContentEncoding"] = "gzip"
+            
+            logger.info("Uploading %s to %s%s", file_path.name, self._uri_prefix, key)
+            
+            if source_path.stat().st_size < _MULTIPART_THRESHOLD:
+                # Single PUT: S3 verifies the body against Content-MD5.
+                # s3transfer rejects ContentMD5 in extra_args, so call put_object.
+                with self._stream(source_path) as body:
+                    response = self._s3_client.put_object(
+                        Bucket=self.bucket,
+                        Key=key,
+                        Body=body,
+                        ContentMD5=self._md5_b64(source_path),
+                        **extra_args
+                    )
+            else:
+                # Multipart: S3 rejects Content-MD5, use per-part SHA-256 instead
+                extra_args["ChecksumAlgorithm"] = "SHA256"
+                self._transfer_manager.upload(
+                    str(source_path),
+                    self.bucket,
+                    key,
+                    extra_args=extra_args
+                ).result()
+                response = {}
+            
+            s3_uri = self._uri_prefix + key
+            logger.info("Successfully uploaded %s to %s", file_path.name, s3_uri)
+            
+            if self.dedup:
+                self._record_upload(file_path, s3_uri, stat_sig, response.get("ETag"))
+            
+            return s3_uri
+            
+        except (ClientError, BotoCoreError) as e:
+            error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "Unknown")
+            
+            raise UploadError(
+                f"Failed to upload {file_path.name} after {self.max_retries} attempts",
+                details={
+                    "file_path": str(file_path),
+                    "s3_key": key,
+                    "error_code": error_code,
+                    "last_error": str(e)
+                }
+            )
+        finally:
+            if compressed_file is not None:
+                compressed_file.unlink(missing_ok=True)
+    
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        s3_key: str,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        Upload an in-memory or already-open binary file object to S3.
+        
+        Avoids spilling data that is already in memory (e.g. a Streamlit
+        UploadedFile) to a temporary file first. The object is read from
+        the start; small bodies go out as a single PUT with Content-MD5,
+        larger ones through the shared multipart transfer manager.
+        compress_text and dedup do not apply on this path.
+        
+        Args:
+            fileobj (BinaryIO): Seekable binary file object
+            s3_key (str): S3 key relative to the client prefix
+            metadata (Optional[Dict[str, str]]): Custom metadata tags
+            content_type (Optional[str]): Override MIME type detection
+                (default: inferred from the key's extension)
+            
+        Returns:
+            str: S3 URI of uploaded object (s3://bucket/key)
+            
+        Raises:
+            UploadError: If the upload fails after retries
+            
+        Example:
+            >>> with open("contract.pdf", "rb") as f:
+            ...     client.upload_fileobj(f, "contracts/contract.pdf")
+            's3://my-bucket/mba/contracts/contract.pdf'
+        """
+        key = self._build_s3_key(Path(s3_key), s3_key)
         extra_args = {
-            "ContentType": detected_type,
-            "ServerSideEncryption": settings.s3_sse
+            **self._base_extra_args,
+            "ContentType": content_type or _guess_by_suffix(Path(s3_key).suffix.lower())
         }
-        
         if metadata:
             extra_args["Metadata"] = metadata
         
-        # Retry loop with exponential backoff
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(
-                    f"Uploading {file_path.name} to s3://{self.bucket}/{key} "
-                    f"(attempt {attempt + 1}/{self.max_retries})"
+        logger.info("Uploading %s to %s%s", s3_key, self._uri_prefix, key)
+        
+        try:
+            size = fileobj.seek(0, os.SEEK_END)
+            fileobj.seek(0)
+            
+            if size < _MULTIPART_THRESHOLD:
+                self._s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=fileobj,
+                    ContentMD5=self._md5_b64_fileobj(fileobj),
+                    **extra_args
                 )
-                
-                self._s3_client.upload_file(
-                    str(file_path),
+            else:
+                extra_args["ChecksumAlgorithm"] = "SHA256"
+                self._transfer_manager.upload(
+                    fileobj,
                     self.bucket,
                     key,
-                    ExtraArgs=extra_args
-                )
-                
-                s3_uri = f"s3://{self.bucket}/{key}"
-                logger.info(f"Successfully uploaded {file_path.name} to {s3_uri}")
-                return s3_uri
-                
-            except (ClientError, BotoCoreError) as e:
-                last_error = e
-                error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "Unknown")
-                
-                logger.warning(
-                    f"Upload attempt {attempt + 1} failed for {file_path.name}: "
-                    f"{error_code} - {str(e)}"
-                )
-                
-                # Don't retry on permanent errors
-                if error_code in ["NoSuchBucket", "AccessDenied", "InvalidAccessKeyId"]:
-                    break
+                    extra_args=extra_args
+                ).result()
+            
+            s3_uri = self._uri_prefix + key
+            logger.info("Successfully uploaded %s to %s", s3_key, s3_uri)
+            return s3_uri
+            
+        except (ClientError, BotoCoreError) as e:
+            error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "Unknown")
+            
+            raise UploadError(
+                f"Failed to upload {s3_key} after {self.max_retries} attempts",
+                details={
+                    "s3_key": key,
+                    "error_code": error_code,
+                    "last_error": str(e)
+                }
+            )
+    
+    def generate_presigned_put(
+        self,
+        s3_key: str,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = None,
+        expires_in: int = 900,
+        content_length: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a pre-signed URL for uploading one object directly to S3.
+        
+        Lets a browser or other client PUT the file straight to the bucket,
+        so the bytes never pass through this service. The client must send
+        the returned headers unchanged: content type, length, encryption
+        and metadata are part of the signature.
+        
+        Args:
+            s3_key (str): S3 key relative to the client prefix
+            metadata (Optional[Dict[str, str]]): Custom metadata tags
+            content_type (Optional[str]): Override MIME type detection
+                (default: inferred from the key's extension)
+            expires_in (int): URL lifetime in seconds (default: 900)
+            content_length (Optional[int]): Exact body size in bytes. When
+                given it is signed, so S3 rejects a PUT of any other size
+            
+        Returns:
+            Dict[str, Any]: Upload details with keys:
+                - url (str): Pre-signed PUT URL
+                - headers (Dict[str, str]): Headers the PUT must carry
+                - s3_uri (str): URI the object will have once uploaded
+                - expires_in (int): URL lifetime in seconds
                 
-                # Exponential backoff before retry
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.info(f"Retrying in {delay:.1f} seconds...")
-                    time.sleep(delay)
-        
-        # All retries exhausted
-        raise UploadError(
-            f"Failed to upload {file_path.name} after {self.max_retries} attempts",
-            details={
-                "file_path": str(file_path),
-                "s3_key": key,
-                "last_error": str(last_error)
-            }
-        )
+        Raises:
+            UploadError: If the URL cannot be signed
+            
+        Example:
+            >>> upload = client.generate_presigned_put("pdf/report.pdf")
+            >>> requests.put(upload["url"], data=f, headers=upload["headers"])
+        """
+        key = self._build_s3_key(Path(s3_key), s3_key)
+        content_type = content_type or _guess_by_suffix(Path(s3_key).suffix.lower())
+        
+        params = {
+            "Bucket": self.bucket,
+            "Key": key,
+            "ContentType": content_type,
+            **self._base_extra_args
+        }
+        headers = {
+            "Content-Type": content_type,
+            "x-amz-server-side-encryption": self._sse
+        }
+        if content_length is not None:
+            params["ContentLength"] = content_length
+            headers["Content-Length"] = str(content_length)
+        if metadata:
+            params["Metadata"] = metadata
+            headers.update({f"x-amz-meta-{name}": value for name, value in metadata.items()})
+        
+        try:
+            url = self._s3_client.generate_presigned_url(
+                "put_object",
+                Params=params,
+                ExpiresIn=expires_in
+            )
+        except (ClientError, BotoCoreError) as e:
+            raise UploadError(
+                f"Failed to pre-sign upload for {s3_key}",
+                details={"s3_key": key, "error": str(e)}
+            )
+        
+        logger.info("Pre-signed direct upload to %s%s (%ds)", self._uri_prefix, key, expires_in)
+        
+        return {
+            "url": url,
+            "headers": headers,
+            "s3_uri": self._uri_prefix + key,
+            "expires_in": expires_in
+        }
+    
+    def copy_object(
+        self,
+        source_uri: str,
+        s3_key: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Copy an existing S3 object into this client's bucket server-side.
+        
+        Uses boto3's managed copy (UploadPartCopy for large objects), so data
+        moves inside S3 and never passes through this process. Suitable for
+        promoting files from a staging bucket without re-downloading them.
+        
+        Args:
+            source_uri (str): Source object URI (s3://bucket/key)
+            s3_key (Optional[str]): Custom destination key (default: source
+                object's file name under the configured prefix)
+            metadata (Optional[Dict[str, str]]): Replacement metadata; when
+                omitted, the source object's metadata is kept
+            
+        Returns:
+            str: S3 URI of the copied object (s3://bucket/key)
+            
+        Raises:
+            UploadError: If the source URI is malformed or the copy fails
+            
+        Example:
+            >>> client.copy_object("s3://staging-bucket/incoming/report.pdf")
+            's3://my-bucket/mba/report.pdf'
+        """
+        source_bucket, _, source_key = source_uri[len("s3://"):].partition("/")
+        if not source_uri.startswith("s3://") or not source_bucket or not source_key:
+            raise UploadError(
+                f"Invalid S3 URI: {source_uri}",
+                details={"source_uri": source_uri}
+            )
+        
+        source_path = Path(source_key)
+        key = self._build_s3_key(source_path, s3_key)
+        
+        extra_args = dict(self._base_extra_args)
+        if metadata:
+            extra_args.update({
+                "Metadata": metadata,
+                "MetadataDirective": "REPLACE",
+                "ContentType": self._detect_content_type(source_path)
+            })
+        
+        try:
+            logger.info("Copying %s to %s%s", source_uri, self._uri_prefix, key)
+            
+            self._s3_client.copy(
+                {"Bucket": source_bucket, "Key": source_key},
+                self.bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=_COPY_TRANSFER_CONFIG
+            )
+            
+            s3_uri = self._uri_prefix + key
+            logger.info("Successfully copied %s to %s", source_uri, s3_uri)
+            return s3_uri
+            
+        except (ClientError, BotoCoreError) as e:
+            error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "Unknown")
+            
+            raise UploadError(
+                f"Failed to copy {source_uri}",
+                details={
+                    "source_uri": source_uri,
+                    "s3_key": key,
+                    "error_code": error_code,
+                    "last_error": str(e)
+                }
+            )
     
     def upload_files(
         self,
@@ -293,7 +1050,8 @@ class S3Client:
         
         Processes a list of files for upload with optional per-file metadata
         generation. Can continue processing after individual failures or
-        halt on first error.
+        halt on first error. Thin wrapper over upload_files_iter() that
+        collects its results.
         
         Args:
             file_paths (List[Path]): List of local files to upload
@@ -304,7 +1062,7 @@ class S3Client:
                 
         Returns:
             Tuple[List[str], List[Dict]]: 
-                - List of S3 URIs for successful uploads
+                - List of S3 URIs for successful uploads (completion order)
                 - List of error dicts with keys: file_path, error, details
                 
         Side Effects:
@@ -321,43 +1079,385 @@ class S3Client:
             ... )
             >>> print(f"Uploaded {len(uris)} files, {len(errors)} errors")
         """
-        logger.info(f"Starting batch upload of {len(file_paths)} files")
-        
         successful_uris = []
         errors = []
         
-        for idx, file_path in enumerate(file_paths, 1):
-            logger.info(f"Processing file {idx}/{len(file_paths)}: {file_path.name}")
+        for s3_uri, error_info in self.upload_files_iter(
+            file_paths,
+            metadata_fn=metadata_fn,
+            continue_on_error=continue_on_error
+        ):
+            if error_info is None:
+                successful_uris.append(s3_uri)
+            else:
+                errors.append(error_info)
+        
+        return successful_uris, errors
+    
+    def upload_files_iter(
+        self,
+        file_paths: Iterable[Path],
+        metadata_fn: Optional[callable] = None,
+        continue_on_error: bool = True,
+        max_workers: int = 8
+    ) -> Iterator[Tuple[Optional[str], Optional[Dict]]]:
+        """
+        Upload files concurrently, yielding each result as it completes.
+        
+        Paths are pulled lazily from the input iterable and at most
+        ``max_workers * 2`` uploads are pending at a time, so memory stays
+        bounded for very large directory scans. Callers can checkpoint or
+        stream results without waiting for the whole batch.
+        
+        When the client has a state log, files already recorded as uploaded
+        are skipped and every outcome is written to the log.
+        
+        Args:
+            file_paths (Iterable[Path]): Local files to upload (may be a
+                generator, e.g. ``Path.rglob``)
+            metadata_fn (Optional[callable]): Function returning metadata dict
+                for each file: metadata_fn(file_path: Path) -> Dict[str, str]
+            continue_on_error (bool): Keep submitting after a failure
+                (default: True). When False, no new uploads are started after
+                the first error; uploads already in flight still report.
+            max_workers (int): Concurrent upload threads (default: 8)
+                
+        Yields:
+            Tuple[Optional[str], Optional[Dict]]:
+                - (s3_uri, None) on success
+                - (None, error_dict) on failure, with keys: file_path,
+                  error, details
+                
+        Side Effects:
+            - Uploads files to S3
+            - Records each outcome in the state log, if configured
+            - Logs batch progress and summary
             
-            try:
-                # Generate metadata if function provided
-                metadata = metadata_fn(file_path) if metadata_fn else None
+        Example:
+            >>> for uri, error in client.upload_files_iter(Path("data").rglob("*.pdf")):
+            ...     if error:
+            ...         print("failed:", error["file_path"])
+        """
+        # Choose the worker once per batch rather than branching per file
+        if metadata_fn is None:
+            _upload_one = self.upload_file
+        else:
+            def _upload_one(file_path: Path) -> str:
+                return self.upload_file(file_path, metadata=metadata_fn(file_path))
+        
+        logger.info("Starting batch upload")
+        
+        paths = iter(self.resume(file_paths))
+        window = max_workers * 2
+        pending = {}
+        completed = succeeded = 0
+        halted = False
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            def _fill():
+                for file_path in islice(paths, window - len(pending)):
+                    pending[executor.submit(_upload_one, file_path)] = file_path
+            
+            _fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = pending.pop(future)
+                    completed += 1
+                    try:
+                        s3_uri = future.result()
+                        succeeded += 1
+                        if self._state_db is not None:
+                            self._log_state(file_path, s3_uri)
+                        yield s3_uri, None
+                    except UploadError as e:
+                        logger.error(
+                            "Failed to upload %s: %s", file_path.name, e.message,
+                            extra={"error_details": e.details}
+                        )
+                        if self._state_db is not None:
+                            self._log_state(file_path, None, e.message)
+                        
+                        if not continue_on_error and not halted:
+                            logger.error("Halting batch upload due to error")
+                            halted = True
+                        
+                        yield None, {
+                            "file_path": str(file_path),
+                            "error": e.message,
+                            "details": e.details
+                        }
+                    
+                    if completed % 100 == 0:
+                        logger.info("Batch upload progress: %d files completed", completed)
                 
-                # Upload file
-                s3_uri = self.upload_file(file_path, metadata=metadata)
-                successful_uris.append(s3_uri)
+                if not halted:
+                    _fill()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if self._state_db is not None:
+                self._flush_state()
+        
+        logger.info(
+            "Batch upload complete: %d successful, %d failed",
+            succeeded, completed - succeeded
+        )
+    
+    def upload_files_cli(
+        self,
+        file_paths: List[Path],
+        num_workers: int = _S5CMD_NUM_WORKERS
+    ) -> Tuple[List[str], List[Dict]]:
+        """
+        Upload many small files through the s5cmd CLI.
+        
+        For batches of tens of thousands of small files, per-request Python
+        overhead caps boto3 throughput. s5cmd is a native binary that runs
+        all copies with its own worker pool, so this path hands the whole
+        batch to one subprocess via an ``s5cmd run`` command file. Falls
+        back to upload_files() if s5cmd is not on PATH.
+        
+        Credentials and region from settings are passed through the
+        environment. Per-file metadata is not supported on this path.
+        Files whose path or key contains quotes, backslashes or glob
+        characters cannot be written safely to the command file and are
+        uploaded through upload_files() instead.
+        
+        Args:
+            file_paths (List[Path]): List of local files to upload
+            num_workers (int): s5cmd worker count (default: 256)
+                
+        Returns:
+            Tuple[List[str], List[Dict]]: 
+                - List of S3 URIs for successful uploads
+                - List of error dicts with keys: file_path, error, details
                 
-            except UploadError as e:
-                error_info = {
+        Side Effects:
+            - Writes a temporary s5cmd command file
+            - Spawns an s5cmd subprocess
+            - Uploads files to S3
+            
+        Example:
+            >>> uris, errors = client.upload_files_cli(sorted(Path("out").glob("*.json")))
+        """
+        s5cmd = shutil.which("s5cmd")
+        if s5cmd is None:
+            logger.warning("s5cmd not found on PATH, falling back to boto3 batch upload")
+            return self.upload_files(file_paths)
+        
+        logger.info("Starting s5cmd batch upload of %d files", len(file_paths))
+        
+        # Map destination URI -> source path for result collation
+        destinations = {}
+        commands = []
+        boto3_paths = []
+        for file_path in file_paths:
+            s3_uri = self._uri_prefix + self._build_s3_key(file_path)
+            if _S5CMD_UNSAFE_CHARS.intersection(str(file_path) + s3_uri):
+                boto3_paths.append(file_path)
+                continue
+            destinations[s3_uri] = file_path
+            commands.append(f'cp --sse {self._sse} "{file_path}" "{s3_uri}"')
+        
+        if boto3_paths:
+            logger.info(
+                "Uploading %d files with special characters via boto3", len(boto3_paths)
+            )
+            successful_uris, errors = self.upload_files(boto3_paths)
+        else:
+            successful_uris, errors = [], []
+        
+        if not commands:
+            return successful_uris, errors
+        
+        env = dict(os.environ)
+        env["AWS_REGION"] = self._session_kwargs["region_name"]
+        if "profile_name" in self._session_kwargs:
+            env["AWS_PROFILE"] = self._session_kwargs["profile_name"]
+        elif "aws_access_key_id" in self._session_kwargs:
+            env["AWS_ACCESS_KEY_ID"] = self._session_kwargs["aws_access_key_id"]
+            env["AWS_SECRET_ACCESS_KEY"] = self._session_kwargs["aws_secret_access_key"]
+        
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as cmd_file:
+            cmd_file.write("\n".join(commands))
+            cmd_path = Path(cmd_file.name)
+        
+        try:
+            proc = subprocess.run(
+                [s5cmd, "--json", "--numworkers", str(num_workers), "run", str(cmd_path)],
+                capture_output=True,
+                text=True,
+                env=env
+            )
+        finally:
+            cmd_path.unlink(missing_ok=True)
+        
+        reported = set()
+        for line in (proc.stdout + proc.stderr).splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            
+            if entry.get("success"):
+                successful_uris.append(entry.get("destination"))
+                reported.add(entry.get("destination"))
+            elif entry.get("error"):
+                command = entry.get("command", "")
+                # Commands end with the quoted destination URI
+                s3_uri = command.rstrip().rstrip('"').rpartition('"')[2]
+                reported.add(s3_uri)
+                errors.append({
+                    "file_path": str(destinations.get(s3_uri, command)),
+                    "error": entry["error"],
+                    "details": {"command": command}
+                })
+        
+        # Anything s5cmd did not report (e.g. it crashed) is a failure
+        for s3_uri, file_path in destinations.items():
+            if s3_uri not in reported:
+                errors.append({
                     "file_path": str(file_path),
-                    "error": e.message,
-                    "details": e.details
-                }
-                errors.append(error_info)
+                    "error": "No result reported by s5cmd",
+                    "details": {"returncode": proc.returncode}
+                })
+        
+        logger.info(
+            "s5cmd batch upload complete: %d successful, %d failed",
+            len(successful_uris), len(errors)
+        )
+        
+        return successful_uris, errors
+    
+    def _aio_client(self, max_connections: int):
+        """
+        Create an aiobotocore S3 client context for one async batch.
+        
+        The client is scoped to the batch (``async with``) so its aiohttp
+        session is always closed on the loop that opened it; caching it
+        across ``asyncio.run`` calls would strand the session of every
+        finished loop. The connection pool is sized to the batch's
+        concurrency, since aiobotocore otherwise caps in-flight requests
+        at 10.
+        
+        Args:
+            max_connections (int): Connection pool size
+            
+        Returns:
+            Async context manager yielding an aioboto3 S3 client
+            
+        Raises:
+            ConfigError: If aioboto3 is not installed
+        """
+        try:
+            import aioboto3
+        except ImportError as e:
+            raise ConfigError(
+                "aioboto3 is required for async uploads (pip install 'mba-ct[async]')",
+                details={"error": str(e)}
+            )
+        
+        session = aioboto3.Session(**self._session_kwargs)
+        return session.client(
+            "s3",
+            config=Config(
+                retries={"mode": "adaptive", "max_attempts": self.max_retries},
+                max_pool_connections=max_connections
+            )
+        )
+    
+    async def upload_files_async(
+        self,
+        file_paths: List[Path],
+        metadata_fn: Optional[callable] = None,
+        max_concurrency: int = 64
+    ) -> Tuple[List[str], List[Dict]]:
+        """
+        Upload multiple files to S3 concurrently on an asyncio event loop.
+        
+        Intended for batches of many small files, where a single event loop
+        with one connection pool (sized to max_concurrency and closed when
+        the batch finishes) outperforms a thread per upload.
+        In-flight requests are capped by a semaphore, keeping well below the
+        per-prefix S3 request rate limits.
+        
+        Args:
+            file_paths (List[Path]): List of local files to upload
+            metadata_fn (Optional[callable]): Function returning metadata dict
+                for each file: metadata_fn(file_path: Path) -> Dict[str, str]
+            max_concurrency (int): Maximum concurrent uploads (default: 64)
                 
-                logger.error(
-                    f"Failed to upload {file_path.name}: {e.message}",
-                    extra={"error_details": e.details}
-                )
+        Returns:
+            Tuple[List[str], List[Dict]]: 
+                - List of S3 URIs for successful uploads
+                - List of error dicts with keys: file_path, error, details
                 
-                if not continue_on_error:
-                    logger.error("Halting batch upload due to error")
-                    break
+        Raises:
+            ConfigError: If aioboto3 is not installed
+            
+        Side Effects:
+            - Uploads files to S3
+            - Logs batch progress and summary
+            
+        Example:
+            >>> uris, errors = asyncio.run(
+            ...     client.upload_files_async([Path("a.csv"), Path("b.csv")])
+            ... )
+        """
+        logger.info("Starting async batch upload of %d files", len(file_paths))
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _upload_one(file_path: Path) -> Tuple[Optional[str], Optional[Dict]]:
+            async with semaphore:
+                key = self._build_s3_key(file_path)
+                try:
+                    if not file_path.is_file():
+                        raise UploadError(
+                            f"File not found: {file_path}",
+                            details={"file_path": str(file_path)}
+                        )
+                    
+                    extra_args = {
+                        **self._base_extra_args,
+                        "ContentType": self._detect_content_type(file_path)
+                    }
+                    metadata = metadata_fn(file_path) if metadata_fn else None
+                    if metadata:
+                        extra_args["Metadata"] = metadata
+                    
+                    await client.upload_file(
+                        str(file_path),
+                        self.bucket,
+                        key,
+                        ExtraArgs=extra_args
+                    )
+                    return self._uri_prefix + key, None
+                    
+                except UploadError as e:
+                    return None, {
+                        "file_path": str(file_path),
+                        "error": e.message,
+                        "details": e.details
+                    }
+                except Exception as e:
+                    logger.error("Failed to upload %s: %s", file_path.name, e)
+                    return None, {
+                        "file_path": str(file_path),
+                        "error": f"Failed to upload {file_path.name}",
+                        "details": {"s3_key": key, "last_error": str(e)}
+                    }
+        
+        async with self._aio_client(max_concurrency) as client:
+            outcomes = await asyncio.gather(*(_upload_one(p) for p in file_paths))
+        
+        successful_uris = [uri for uri, _ in outcomes if uri is not None]
+        errors = [err for _, err in outcomes if err is not None]
         
-        # Log summary
         logger.info(
-            f"Batch upload complete: {len(successful_uris)} successful, "
-            f"{len(errors)} failed"
+            "Async batch upload complete: %d successful, %d failed",
+            len(successful_uris), len(errors)
         )
         
-        return successful_uris, errors
\ No newline at end of file
+        return successful_uris, errors
@@ -24,35 +24,84 @@ Pages:
 """
 
 import streamlit as st
+import asyncio
+import csv
+import importlib
+import io
+import json
+import os
+import re
+import threading
+import time
 from pathlib import Path
 import tempfile
 import shutil
-from typing import Dict, Any, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+import boto3
 import pandas as pd
 from datetime import datetime
 
 from MBA.core.logging_config import get_logger, setup_root_logger
 from MBA.core.exceptions import (
     UploadError, FileDiscoveryError,
-    DatabaseError, DataIngestionError
+    DatabaseError, DataIngestionError, ValidationError
 )
 from MBA.core.settings import settings
 from MBA.services.storage.s3_client import S3Client
 from MBA.services.storage.file_processor import FileProcessor
-from MBA.services.storage.duplicate_detector import DuplicateDetector
+from MBA.services.storage.duplicate_detector import BLAKE3, DuplicateDetector
 from MBA.services.database.client import RDSClient
 from MBA.services.ingestion.orchestrator import CSVIngestor
-from MBA.agents.member_verification_agent import MemberVerificationAgent
-from MBA.agents.deductible_oop_agent import DeductibleOOPAgent
-from MBA.agents.benefit_accumulator_agent import BenefitAccumulatorAgent
-from MBA.agents.benefit_coverage_rag_agent import BenefitCoverageRAGAgent
-from MBA.agents.local_rag_agent import LocalRAGAgent
-from MBA.agents.orchestration_agent import OrchestrationAgent
 
 # Setup logging
 setup_root_logger()
 logger = get_logger(__name__)
 
+# Bytes read for CSV previews, independent of file size; grown (x4 per
+# attempt) for very wide files up to the max
+CSV_PREVIEW_BLOCK_SIZE = 64 * 1024
+CSV_PREVIEW_MAX_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Duplicate groups rendered per page in the View Duplicates tab
+DUPLICATE_GROUPS_PER_PAGE = 50
+
+# Rows read from an uploaded batch verification CSV per chunk; each chunk
+# is verified before the next is parsed
+BATCH_VERIFY_CHUNK_ROWS = 500
+
+# Deductible/OOP table layout: network columns and (row label, field) rows
+DEDUCTIBLE_OOP_NETWORKS = ("ppo", "par", "oon")
+DEDUCTIBLE_OOP_FIELDS = (
+    ("Deductible", "deductible"),
+    ("Met", "deductible_met"),
+    ("Remaining", "deductible_remaining"),
+    ("OOP Limit", "oop"),
+    ("OOP Met", "oop_met"),
+    ("OOP Remaining", "oop_remaining"),
+)
+
+# Member IDs accepted by the lookup tabs (checked after trimming and
+# upper-casing); anything else is rejected before calling an agent
+MEMBER_ID_PATTERN = re.compile(r"[A-Z0-9-]{3,20}")
+
+# How long a successful deductible/OOP or benefit accumulator lookup is
+# reused for identical inputs before asking the agent again
+AGENT_LOOKUP_TTL_SECONDS = 60
+
+# Arrow-backed columns for SQL previews and whole-file CSV reads when
+# pyarrow is installed (the pyarrow CSV engine supports neither nrows nor
+# chunksize, so previews and chunked reads keep the default engine)
+try:
+    import pyarrow  # noqa: F401
+    SQL_DTYPE_BACKEND = "pyarrow"
+    CSV_READ_OPTIONS = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+except ImportError:
+    SQL_DTYPE_BACKEND = "numpy_nullable"
+    CSV_READ_OPTIONS = {}
+
 # Page configuration
 st.set_page_config(
     page_title="MBA Upload & Ingestion Service",
@@ -62,43 +111,277 @@ st.set_page_config(
 )
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner="Initializing services...")
 def initialize_services():
     """
     Initialize and cache service instances.
+    
+    Pure factory: it never calls Streamlit UI functions, and failures
+    propagate to the caller. Streamlit does not cache a call that raises,
+    so the next rerun retries initialization instead of replaying a stale
+    error. Connectivity is checked separately (see database_alive).
 
     Returns:
-        Tuple: (S3Client, FileProcessor, DuplicateDetector, RDSClient, CSVIngestor, MemberVerificationAgent)
+        Tuple: (S3Client, FileProcessor, DuplicateDetector, RDSClient, CSVIngestor)
+
+    Raises:
+        Exception: Any error raised while constructing a service
 
     Side Effects:
         - Creates service instances
-        - Tests connectivity
         - Logs initialization
     """
+    bucket = settings.get_bucket("mba")
+    prefix = settings.get_prefix("mba")
+
+    # 8 MB parts for the 100 MB upload cap: ~12 parts, 10 in flight
+    s3_client = S3Client(bucket=bucket, prefix=prefix, max_concurrency=10)
+    file_processor = FileProcessor(
+        allowed_extensions={
+            ".pdf", ".doc", ".docx",
+            ".xls", ".xlsx", ".xlsm",
+            ".txt", ".csv", ".json", ".md"
+        },
+        max_file_size_mb=100
+    )
+    # BLAKE3 hashes several times faster than SHA-256 when installed
     try:
-        bucket = settings.get_bucket("mba")
-        prefix = settings.get_prefix("mba")
-
-        s3_client = S3Client(bucket=bucket, prefix=prefix)
-        file_processor = FileProcessor(
-            allowed_extensions={
-                ".pdf", ".doc", ".docx",
-                ".xls", ".xlsx", ".xlsm",
-                ".txt", ".csv", ".json", ".md"
-            },
-            max_file_size_mb=100
-        )
+        duplicate_detector = DuplicateDetector(algorithm=BLAKE3)
+    except ValidationError:
         duplicate_detector = DuplicateDetector()
-        rds_client = RDSClient()
-        csv_ingestor = CSVIngestor(rds_client=rds_client)
+    rds_client = RDSClient()
+    csv_ingestor = CSVIngestor(rds_client=rds_client)
 
-        logger.info("Core services initialized successfully")
-        return s3_client, file_processor, duplicate_detector, rds_client, csv_ingestor
+    logger.info("Core services initialized successfully")
+    return s3_client, file_processor, duplicate_detector, rds_client, csv_ingestor
+
+
+# Agent packages pull in Strands and Bedrock clients, so they are imported
+# only when a tab first needs them: class name -> module
+_AGENT_MODULES = {
+    "MemberVerificationAgent": "MBA.agents.member_verification_agent",
+    "DeductibleOOPAgent": "MBA.agents.deductible_oop_agent",
+    "BenefitAccumulatorAgent": "MBA.agents.benefit_accumulator_agent",
+    "BenefitCoverageRAGAgent": "MBA.agents.benefit_coverage_rag_agent",
+    "LocalRAGAgent": "MBA.agents.local_rag_agent",
+    "OrchestrationAgent": "MBA.agents.orchestration_agent",
+}
 
-    except Exception as e:
-        logger.error(f"Failed to initialize services: {e}")
-        st.error(f"❌ Failed to initialize services: {str(e)}")
-        st.stop()
+
+def _create_agent(class_name: str):
+    """Import an agent's package and construct the agent."""
+    module = importlib.import_module(_AGENT_MODULES[class_name])
+    return getattr(module, class_name)()
+
+
+@st.cache_resource(show_spinner=False)
+def get_agent(class_name: str):
+    """
+    Import and construct a stateless agent on first use.
+    
+    The instance is shared across reruns and sessions, so the import and
+    client setup happen once per process instead of on every rerun.
+    
+    Args:
+        class_name (str): Agent class name, a key of ``_AGENT_MODULES``
+        
+    Returns:
+        Agent instance
+    """
+    return _create_agent(class_name)
+
+
+def get_orchestration_agent():
+    """
+    Get this session's orchestration agent, creating it on first use.
+    
+    Kept in session state rather than the shared resource cache because
+    the agent holds the session's conversation history.
+    
+    Returns:
+        OrchestrationAgent: Agent for the current browser session
+    """
+    if "orchestration_agent" not in st.session_state:
+        st.session_state["orchestration_agent"] = _create_agent("OrchestrationAgent")
+    return st.session_state["orchestration_agent"]
+
+
+def run_async(coro):
+    """
+    Run an agent coroutine to completion on this session's event loop.
+    
+    asyncio.run() builds and closes a new loop (and its default thread
+    pool) on every call. The loop is kept in session state instead: a
+    session's script runs are sequential, so its loop is never driven
+    from two threads at once, and sessions never wait on each other's
+    blocking agent calls.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Whatever the coroutine returns
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state["event_loop"] = loop
+    return loop.run_until_complete(coro)
+
+
+class _UncachedLookup(Exception):
+    """Carries an error result out of a cached lookup so it is not stored."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error"))
+        self.result = result
+
+
+@st.cache_data(ttl=AGENT_LOOKUP_TTL_SECONDS, show_spinner=False, max_entries=256)
+def _cached_deductible_oop(
+    member_id: str,
+    plan_type: Optional[str],
+    network: Optional[str],
+    _prefetched: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run the deductible/OOP agent, or store an already fetched result
+    (``_prefetched``, excluded from the cache key). Error results are
+    raised, not cached.
+    """
+    result = _prefetched
+    if result is None:
+        agent = get_agent("DeductibleOOPAgent")
+        result = run_async(agent.get_deductible_oop(
+            member_id=member_id,
+            plan_type=plan_type,
+            network=network
+        ))
+    if "error" in result:
+        raise _UncachedLookup(result)
+    return result
+
+
+@st.cache_data(ttl=AGENT_LOOKUP_TTL_SECONDS, show_spinner=False, max_entries=256)
+def _cached_benefit_accumulator(
+    member_id: str,
+    service: Optional[str],
+    _prefetched: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run the benefit accumulator agent, or store an already fetched result
+    (``_prefetched``, excluded from the cache key). Error results are
+    raised, not cached.
+    """
+    result = _prefetched
+    if result is None:
+        agent = get_agent("BenefitAccumulatorAgent")
+        result = run_async(agent.get_benefit_accumulator(
+            member_id=member_id,
+            service=service
+        ))
+    if "error" in result:
+        raise _UncachedLookup(result)
+    return result
+
+
+def lookup_deductible_oop(
+    member_id: str,
+    plan_type: Optional[str] = None,
+    network: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Deductible/OOP lookup with an exact-match result cache.
+    
+    Inputs are normalized (member ID trimmed and upper-cased, empty
+    filters treated as None) so trivially different submissions share a
+    cache entry. Successful results are reused for
+    AGENT_LOOKUP_TTL_SECONDS, skipping the Bedrock and RDS round trip;
+    error results are returned but never cached.
+    
+    Args:
+        member_id (str): Member identifier
+        plan_type (Optional[str]): "individual", "family" or None
+        network (Optional[str]): "ppo", "par", "oon" or None
+        
+    Returns:
+        Dict[str, Any]: Agent result, as from get_deductible_oop()
+    """
+    try:
+        return _cached_deductible_oop(
+            member_id.strip().upper(),
+            plan_type or None,
+            network or None
+        )
+    except _UncachedLookup as e:
+        return e.result
+
+
+def lookup_benefit_accumulator(
+    member_id: str,
+    service: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Benefit accumulator lookup with an exact-match result cache.
+    
+    Same caching rules as lookup_deductible_oop(). The service filter has
+    its surrounding and repeated whitespace collapsed; it is otherwise
+    kept as typed because it is matched against stored service names.
+    
+    Args:
+        member_id (str): Member identifier
+        service (Optional[str]): Service name filter, or None for all
+        
+    Returns:
+        Dict[str, Any]: Agent result, as from get_benefit_accumulator()
+    """
+    try:
+        return _cached_benefit_accumulator(
+            member_id.strip().upper(),
+            " ".join((service or "").split()) or None
+        )
+    except _UncachedLookup as e:
+        return e.result
+
+
+def lookup_member_snapshot(member_id: str) -> tuple:
+    """
+    Fetch a member's deductible/OOP figures and all benefit accumulators
+    together.
+    
+    Both agent calls run concurrently on the session's event loop, so the
+    snapshot costs about one round trip instead of two. Each result is
+    then stored in the same cache as the single lookups (unfiltered
+    entries), so a follow-up lookup in either tab is served from cache.
+    
+    Args:
+        member_id (str): Member identifier
+        
+    Returns:
+        tuple: (deductible/OOP result, benefit accumulator result)
+    """
+    member_id = member_id.strip().upper()
+    
+    async def _fetch_both():
+        return await asyncio.gather(
+            get_agent("DeductibleOOPAgent").get_deductible_oop(member_id=member_id),
+            get_agent("BenefitAccumulatorAgent").get_benefit_accumulator(member_id=member_id)
+        )
+    
+    deductible_result, benefit_result = run_async(_fetch_both())
+    try:
+        deductible_result = _cached_deductible_oop(
+            member_id, None, None, _prefetched=deductible_result
+        )
+    except _UncachedLookup as e:
+        deductible_result = e.result
+    try:
+        benefit_result = _cached_benefit_accumulator(
+            member_id, None, _prefetched=benefit_result
+        )
+    except _UncachedLookup as e:
+        benefit_result = e.result
+    return deductible_result, benefit_result
 
 
 def process_file_upload(
@@ -106,7 +389,9 @@ def process_file_upload(
     file_name: str,
     s3_client: S3Client,
     file_processor: FileProcessor,
-    duplicate_detector: DuplicateDetector
+    duplicate_detector: DuplicateDetector,
+    detect_near_duplicates: bool = False,
+    file_hash: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Process and upload a single file with duplicate detection.
@@ -117,46 +402,55 @@ def process_file_upload(
         s3_client: S3 client instance
         file_processor: File processor instance
         duplicate_detector: Duplicate detector instance
+        detect_near_duplicates (bool): When the file is not an exact
+            duplicate, also look for files with mostly the same content
+        file_hash (Optional[str]): Content hash already computed for this
+            file (e.g. kept in session state); skips re-hashing
         
     Returns:
         Dict[str, Any]: Upload result with status and metadata
     """
-    temp_file = None
     try:
-        suffix = Path(file_name).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(file_data.read())
-            temp_file = Path(tmp.name)
+        size = getattr(file_data, "size", None)
+        if size is None:
+            size = file_data.seek(0, 2)
+        file_data.seek(0)
         
-        if not file_processor.validate_file(temp_file):
+        if not file_processor.validate_upload(file_name, size):
             return {
                 "success": False,
                 "file_name": file_name,
                 "error": "File validation failed"
             }
         
+        # Uploads are already in memory: hash straight from the buffer
         is_dup, content_hash, duplicate_paths = duplicate_detector.is_duplicate(
-            temp_file,
-            compute_if_missing=True
+            file_data,
+            compute_if_missing=True,
+            name=file_name,
+            file_hash=file_hash
         )
         
-        # Get document type from original filename (not temp file)
-        original_path = Path(file_name)
-        doc_type = file_processor.get_document_type(original_path)
+        near_duplicates = []
+        if detect_near_duplicates and not is_dup:
+            near_duplicates = duplicate_detector.near_duplicates(file_data, name=file_name)
+        
+        # Get document type from the original filename
+        doc_type = file_processor.get_document_type(file_name)
         
         # Generate S3 key using original filename
         s3_key = f"{doc_type.value}/{file_name}"
         
-        s3_uri = s3_client.upload_file(
-            temp_file,
-            s3_key=s3_key,
-            metadata={
-                "original_filename": file_name,
-                "document_type": doc_type.value,
-                "content_hash": content_hash,
-                "is_duplicate": str(is_dup)
-            }
-        )
+        metadata = {
+            "original_filename": file_name,
+            "document_type": doc_type.value,
+            "content_hash": content_hash,
+            "is_duplicate": str(is_dup)
+        }
+        
+        # Straight from the in-memory buffer; files over 8 MiB go through
+        # the client's multipart transfer manager, so no temp file is needed
+        s3_uri = s3_client.upload_fileobj(file_data, s3_key, metadata=metadata)
         
         return {
             "success": True,
@@ -165,6 +459,7 @@ def process_file_upload(
             "document_type": doc_type.value,
             "is_duplicate": is_dup,
             "duplicate_of": duplicate_paths,
+            "near_duplicates": near_duplicates,
             "content_hash": content_hash[:16]
         }
         
@@ -182,11 +477,309 @@ def process_file_upload(
             "file_name": file_name,
             "error": str(e)
         }
-    finally:
-        if temp_file and temp_file.exists():
-            temp_file.unlink()
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def database_alive(_rds_client: RDSClient, host: str) -> bool:
+    """
+    Sidebar health check: ping the database at most every 30 seconds.
+    
+    ping() returns False rather than raising, so an unreachable database
+    is cached too and a down server costs one connect timeout per
+    interval instead of one per rerun.
+    
+    Args:
+        _rds_client: RDS client (excluded from the cache key)
+        host (str): Database host, used as the cache key
+        
+    Returns:
+        bool: True if the database answered a ping
+    """
+    return _rds_client.ping()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_tables(_rds_client: RDSClient, db_name: str) -> Dict[str, Dict[str, Any]]:
+    """
+    List tables in a schema with size statistics and column definitions
+    (cached for 30 seconds).
+    
+    information_schema queries are slow on MySQL and Streamlit reruns the
+    script on every widget interaction, so results are reused briefly.
+    Tables and their columns come from one joined query, so selecting a
+    different table in the view needs no further round trip.
+    
+    Args:
+        _rds_client: RDS client (excluded from the cache key)
+        db_name (str): Schema name
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Table rows keyed by table name, in
+            name order; each has a "columns" list of column metadata in
+            ordinal order
+    """
+    # Explicit aliases: MySQL 8 reports information_schema columns in
+    # upper case otherwise
+    tables_query = """
+        SELECT 
+            t.table_name AS table_name,
+            t.table_rows AS table_rows,
+            t.data_length AS data_length,
+            t.create_time AS create_time,
+            t.update_time AS update_time,
+            c.column_name AS column_name,
+            c.data_type AS data_type,
+            c.column_type AS column_type,
+            c.is_nullable AS is_nullable,
+            c.column_key AS column_key
+        FROM information_schema.tables t
+        JOIN information_schema.columns c
+            ON c.table_schema = t.table_schema
+            AND c.table_name = t.table_name
+        WHERE t.table_schema = %s
+        ORDER BY t.table_name, c.ordinal_position
+    """
+    tables: Dict[str, Dict[str, Any]] = {}
+    for row in _rds_client.execute_query(tables_query, params=(db_name,)):
+        table = tables.get(row["table_name"])
+        if table is None:
+            table = tables[row["table_name"]] = {
+                "table_name": row["table_name"],
+                "table_rows": row["table_rows"],
+                "data_length": row["data_length"],
+                "create_time": row["create_time"],
+                "update_time": row["update_time"],
+                "columns": []
+            }
+        table["columns"].append({
+            "column_name": row["column_name"],
+            "data_type": row["data_type"],
+            "column_type": row["column_type"],
+            "is_nullable": row["is_nullable"],
+            "column_key": row["column_key"]
+        })
+    return tables
+
+
+@lru_cache(maxsize=64)
+def preview_statement(table_name: str):
+    """
+    Build the Data Preview query for a table once and reuse it.
+    
+    The table name is quoted as a MySQL identifier (backticks doubled)
+    and the row limit is a bound parameter, so the same compiled
+    statement serves every preview of that table.
+    
+    Args:
+        table_name (str): Table to preview; must come from list_tables()
+        
+    Returns:
+        sqlalchemy.sql.elements.TextClause: Query taking a ``limit`` parameter
+    """
+    from sqlalchemy import text
+    
+    quoted = "`" + table_name.replace("`", "``") + "`"
+    return text(f"SELECT * FROM {quoted} LIMIT :limit")
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def list_duplicate_groups(
+    _duplicate_detector: DuplicateDetector,
+    generation: int,
+    duplicate_groups: int,
+    duplicate_files: int
+) -> List[tuple]:
+    """
+    Snapshot the detector's duplicate groups for the View Duplicates tab.
+    
+    Uploads only add paths, so between clears/imports (tracked by the
+    detector's generation) the O(1) group and file counts change exactly
+    when the duplicate groups do. Together they key the cache: reruns
+    reuse the snapshot instead of copying every group out of the
+    detector under its lock. Kept as a resource (not copied per rerun);
+    callers must not modify it.
+    
+    Args:
+        _duplicate_detector: Detector to read (excluded from the cache key)
+        generation (int): Detector generation, bumped on clear/import
+        duplicate_groups (int): Current duplicate group count
+        duplicate_files (int): Current duplicate file count
+        
+    Returns:
+        List[tuple]: (content hash, file paths) pairs, in insertion order
+    """
+    return list(_duplicate_detector.get_all_duplicates().items())
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_csv_files(csv_dir: str, dir_mtime: float = 0.0) -> List[str]:
+    """
+    List CSV file names in a directory (cached for 30 seconds).
+    
+    Streamlit reruns the script on every widget interaction; caching
+    avoids rescanning a large data directory each time. The directory's
+    mtime is part of the cache key, so adding or removing a file shows
+    up on the next rerun. The "Rescan" button in the CSV Ingestion tab
+    clears the cache for in-place edits the mtime does not reflect.
+    
+    Args:
+        csv_dir (str): Directory to scan
+        dir_mtime (float): Directory modification time (cache key only)
+        
+    Returns:
+        List[str]: Sorted CSV file names
+    """
+    return sorted(f.name for f in Path(csv_dir).glob("*.csv"))
+
+
+@st.cache_resource
+def get_ingest_executor() -> ThreadPoolExecutor:
+    """
+    Shared executor for background directory ingestion.
+    
+    Jobs outlive the script run that started them, so the page stays
+    responsive and a rerun does not interrupt a load. Each job already
+    ingests several files at once through the RDS pool, so at most two
+    jobs run together.
+    
+    Returns:
+        ThreadPoolExecutor: Process-wide ingestion executor
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="csv-ingest")
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def preview_csv(file_path: Path, mtime: float, nrows: int = 5) -> pd.DataFrame:
+    """
+    Read the first rows of a CSV file for display.
+    
+    Uses pyarrow's streaming CSV reader with a 64 KB block so only the
+    first block is read and parsed, however large the file is. Very wide
+    files whose header and first row do not fit are retried with larger
+    blocks (up to 4 MB). Falls back to pandas if pyarrow is not installed
+    or the file still cannot be parsed. (pandas' own ``engine="pyarrow"``
+    is not used: it reads the whole file, as it does not support nrows.)
+    
+    Cached per file version: ``mtime`` is part of the cache key, so the
+    preview is parsed once and re-read only after the file changes.
+    
+    Args:
+        file_path (Path): CSV file to preview
+        mtime (float): File modification time (cache key only)
+        nrows (int): Number of rows to return (default: 5)
+        
+    Returns:
+        pd.DataFrame: Up to ``nrows`` rows
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(file_path, nrows=nrows)
+    
+    block_size = CSV_PREVIEW_BLOCK_SIZE
+    while block_size <= CSV_PREVIEW_MAX_BLOCK_SIZE:
+        try:
+            reader = pa_csv.open_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(block_size=block_size)
+            )
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                return reader.schema.empty_table().to_pandas()
+            return batch.slice(0, nrows).to_pandas()
+        except pa.ArrowInvalid:
+            block_size *= 4
+    
+    return pd.read_csv(file_path, nrows=nrows)
+
+
+def summarize_verifications(results: List[Dict[str, Any]]) -> tuple:
+    """
+    Count batch verification outcomes in a single pass.
+    
+    Args:
+        results: Results from MemberVerificationAgent.verify_member_batch
+        
+    Returns:
+        tuple: (verified, not_found, errors) counts
+    """
+    counts = Counter(
+        "verified" if r.get("valid") else "error" if "error" in r else "not_found"
+        for r in results
+    )
+    return counts["verified"], counts["not_found"], counts["error"]
+
+
+def deductible_oop_table(plan_data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Lay out one plan type's deductible/OOP figures as a single table.
+    
+    Args:
+        plan_data: The "individual" or "family" section of a
+            get_deductible_oop() result, keyed by network
+        
+    Returns:
+        pd.DataFrame: One row per figure, one column per network (PPO,
+            PAR, OON); missing values shown as "N/A"
+    """
+    table = {}
+    for network in DEDUCTIBLE_OOP_NETWORKS:
+        figures = plan_data.get(network) or {}
+        # Values are rendered as text so numeric and "N/A" cells can
+        # share a column
+        table[network.upper()] = [
+            "N/A" if figures.get(field) is None else str(figures[field])
+            for _, field in DEDUCTIBLE_OOP_FIELDS
+        ]
+    return pd.DataFrame(table, index=[label for label, _ in DEDUCTIBLE_OOP_FIELDS])
+
+
+
+def upload_results_table(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Lay out a batch of upload results as a single table.
+    
+    One dataframe element replaces an expander (plus several child
+    elements) per file, which gets heavy for batches of hundreds.
+    
+    Args:
+        results: Results from process_file_upload(), one per file
+        
+    Returns:
+        pd.DataFrame: One row per file with status, document type,
+            duplicate matches and S3 URI (or the error for failures)
+    """
+    rows = []
+    for result in results:
+        if result["success"]:
+            if result["is_duplicate"]:
+                matches = ", ".join(os.path.basename(p) for p in result.get("duplicate_of") or [])
+            else:
+                matches = ", ".join(
+                    f"{os.path.basename(p)} ({similarity:.0%})"
+                    for p, similarity in result.get("near_duplicates") or []
+                )
+            rows.append({
+                "Status": "✅",
+                "File": result["file_name"],
+                "Document Type": result["document_type"],
+                "Duplicate": result["is_duplicate"],
+                "Matches": matches,
+                "S3 URI / Error": result["s3_uri"]
+            })
+        else:
+            rows.append({
+                "Status": "❌",
+                "File": result["file_name"],
+                "Document Type": "",
+                "Duplicate": False,
+                "Matches": "",
+                "S3 URI / Error": result["error"]
+            })
+    return pd.DataFrame(rows)
+
 def render_upload_result(result: Dict[str, Any]):
     """Render upload result in formatted display."""
     if result["success"]:
@@ -204,8 +797,20 @@ def render_upload_result(result: Dict[str, Any]):
                 st.warning("⚠️ Duplicate Detected")
                 if result.get("duplicate_of"):
                     st.write("**Duplicate of:**")
-                    for dup_path in result["duplicate_of"]:
-                        st.code(Path(dup_path).name, language=None)
+                    st.code(
+                        "\n".join(os.path.basename(p) for p in result["duplicate_of"]),
+                        language=None
+                    )
+            elif result.get("near_duplicates"):
+                st.info("🔍 Near-Duplicate Detected")
+                st.write("**Similar to:**")
+                st.code(
+                    "\n".join(
+                        f"{os.path.basename(p)} ({similarity:.0%} similar)"
+                        for p, similarity in result["near_duplicates"]
+                    ),
+                    language=None
+                )
             else:
                 st.success("✅ Unique File")
     else:
@@ -227,29 +832,240 @@ def render_ingestion_result(result: Dict[str, Any]):
         
         if load_results.get("errors"):
             with st.expander("⚠️ View Errors"):
-                for error in load_results["errors"][:10]:
-                    st.code(str(error), language="json")
+                st.code("\n".join(str(e) for e in load_results["errors"][:10]), language="json")
     else:
         st.error("❌ Ingestion failed")
         if result.get("load_results", {}).get("errors"):
             with st.expander("View Error Details"):
-                for error in result["load_results"]["errors"][:10]:
-                    st.code(str(error), language="json")
+                st.code(
+                    "\n".join(str(e) for e in result["load_results"]["errors"][:10]),
+                    language="json"
+                )
+
+
+def render_deductible_oop_result(result: Dict[str, Any]):
+    """Render a get_deductible_oop() result as per-plan-type tables."""
+    if result.get("found"):
+        st.success(f"✅ Found deductible/OOP data for {result['member_id']}")
+
+        # Individual Plans
+        st.subheader("👤 Individual Plans")
+        st.dataframe(
+            deductible_oop_table(result.get("individual", {})),
+            use_container_width=True
+        )
+
+        st.divider()
+
+        # Family Plans
+        st.subheader("👨‍👩‍👧‍👦 Family Plans")
+        st.dataframe(
+            deductible_oop_table(result.get("family", {})),
+            use_container_width=True
+        )
+
+        with st.expander("📋 View Full Response"):
+            st.json(result)
+
+    elif "error" in result:
+        st.error(f"❌ Lookup Error: {result['error']}")
+        with st.expander("📋 View Error Details"):
+            st.json(result)
+    else:
+        st.warning("⚠️ No data found")
+        st.info(result.get("message", "No deductible/OOP data found"))
+
+
+def render_benefit_accumulator_result(result: Dict[str, Any]):
+    """Render a get_benefit_accumulator() result as a benefits table."""
+    if result.get("found"):
+        benefits = result.get("benefits", [])
+        st.success(f"✅ Found {len(benefits)} benefit(s) for {result['member_id']}")
+
+        # Display benefits as table
+        if benefits:
+            df_benefits = pd.DataFrame(benefits)
+            st.dataframe(
+                df_benefits,
+                use_container_width=True,
+                column_config={
+                    "service": st.column_config.TextColumn("Service", width="medium"),
+                    "allowed_limit": st.column_config.TextColumn("Allowed Limit", width="medium"),
+                    "used": st.column_config.NumberColumn("Used", width="small"),
+                    "remaining": st.column_config.NumberColumn("Remaining", width="small")
+                }
+            )
+
+        with st.expander("📋 View Full Response"):
+            st.json(result)
+
+    elif "error" in result:
+        st.error(f"❌ Lookup Error: {result['error']}")
+        with st.expander("📋 View Error Details"):
+            st.json(result)
+    else:
+        st.warning("⚠️ No benefits found")
+        st.info(result.get("message", "No benefit accumulator data found"))
+
+
+def member_id_error(member_id: str) -> Optional[str]:
+    """Return why a lookup member ID is unusable, or None if it is fine."""
+    if not member_id:
+        return "❌ Member ID is required"
+    if not MEMBER_ID_PATTERN.fullmatch(member_id.strip().upper()):
+        return "❌ Invalid Member ID format (expected 3-20 letters, digits or dashes, e.g. M1001)"
+    return None
+
+
+@st.fragment
+def render_deductible_oop_tab():
+    """
+    Deductible/OOP Lookup tab.
+    
+    Runs as a fragment: submitting the lookup form reruns only this tab,
+    not the whole page. "Full Member Snapshot" fetches the member's
+    deductible/OOP figures and benefit accumulators concurrently.
+    """
+    st.header("💰 Deductible & Out-of-Pocket Lookup")
+    st.markdown("Query member deductible and OOP information using AWS Bedrock AI.")
+
+    st.info("""
+    **How it works:**
+    1. User Request → AWS Bedrock LLM → get_deductible_oop Tool
+    2. Tool queries RDS MySQL deductibles_oop table
+    3. Returns structured deductible/OOP data for all plan types and networks
+    """)
+
+    with st.form("deductible_oop_form"):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            member_id = st.text_input(
+                "Member ID *",
+                placeholder="e.g., M1001",
+                help="Required: Member identifier"
+            )
+
+        with col2:
+            plan_type = st.selectbox(
+                "Plan Type (Optional)",
+                options=["", "individual", "family"],
+                help="Filter by plan type"
+            )
+
+        with col3:
+            network = st.selectbox(
+                "Network (Optional)",
+                options=["", "ppo", "par", "oon"],
+                help="Filter by network level"
+            )
+
+        btn_col1, btn_col2 = st.columns(2)
+        submit = btn_col1.form_submit_button("🔍 Lookup", type="primary", use_container_width=True)
+        snapshot = btn_col2.form_submit_button(
+            "📋 Full Member Snapshot",
+            use_container_width=True,
+            help="Deductible/OOP and all benefit accumulators in one request (filters ignored)"
+        )
+
+    if submit or snapshot:
+        error = member_id_error(member_id)
+        if error:
+            st.error(error)
+        elif snapshot:
+            with st.spinner("Querying deductible/OOP and benefit accumulator data..."):
+                try:
+                    deductible_result, benefit_result = lookup_member_snapshot(member_id)
+
+                    st.divider()
+                    render_deductible_oop_result(deductible_result)
+
+                    st.divider()
+                    st.subheader("🏥 Benefit Accumulators")
+                    render_benefit_accumulator_result(benefit_result)
+
+                except Exception as e:
+                    st.error(f"❌ Snapshot failed: {str(e)}")
+                    logger.error(f"Member snapshot error: {str(e)}", exc_info=True)
+        else:
+            with st.spinner("Querying deductible/OOP data..."):
+                try:
+                    result = lookup_deductible_oop(member_id, plan_type, network)
+
+                    st.divider()
+                    render_deductible_oop_result(result)
+
+                except Exception as e:
+                    st.error(f"❌ Lookup failed: {str(e)}")
+                    logger.error(f"Deductible/OOP lookup error: {str(e)}", exc_info=True)
+
+
+@st.fragment
+def render_benefit_accumulator_tab():
+    """
+    Benefit Accumulator Lookup tab.
+    
+    Runs as a fragment: submitting the lookup form reruns only this tab,
+    not the whole page.
+    """
+    st.header("🏥 Benefit Accumulator Lookup")
+    st.markdown("Query member benefit usage information using AWS Bedrock AI.")
+
+    st.info("""
+    **How it works:**
+    1. User Request → AWS Bedrock LLM → get_benefit_accumulator Tool
+    2. Tool queries RDS MySQL benefit_accumulator table
+    3. Returns benefit usage data with limits, used amounts, and remaining balances
+    """)
+
+    with st.form("benefit_accumulator_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            member_id = st.text_input(
+                "Member ID *",
+                placeholder="e.g., M1001",
+                help="Required: Member identifier"
+            )
+
+        with col2:
+            service = st.text_input(
+                "Service (Optional)",
+                placeholder="e.g., Massage Therapy",
+                help="Filter by specific service name"
+            )
+
+        submit = st.form_submit_button("🔍 Lookup", type="primary", use_container_width=True)
+
+    if submit:
+        error = member_id_error(member_id)
+        if error:
+            st.error(error)
+        else:
+            with st.spinner("Querying benefit accumulator data..."):
+                try:
+                    result = lookup_benefit_accumulator(member_id, service)
+
+                    st.divider()
+                    render_benefit_accumulator_result(result)
+
+                except Exception as e:
+                    st.error(f"❌ Lookup failed: {str(e)}")
+                    logger.error(f"Benefit accumulator lookup error: {str(e)}", exc_info=True)
 
 
 def main():
     """Main Streamlit application entry point."""
 
-    # Initialize services
-    s3_client, file_processor, duplicate_detector, rds_client, csv_ingestor = initialize_services()
-    
-    # Lazy-load agents (only when tabs are accessed)
-    verification_agent = None
-    deductible_oop_agent = None
-    benefit_accumulator_agent = None
-    benefit_coverage_rag_agent = None
-    local_rag_agent = None
-    orchestration_agent = None
+    # Initialize services; a failed attempt is not cached, so retry reruns it
+    try:
+        s3_client, file_processor, duplicate_detector, rds_client, csv_ingestor = initialize_services()
+    except Exception as e:
+        logger.error(f"Failed to initialize services: {e}")
+        st.error(f"❌ Failed to initialize services: {str(e)}")
+        if st.button("🔄 Retry"):
+            st.rerun()
+        st.stop()
     
     # Header
     st.title("📤 MBA Upload & Ingestion Service")
@@ -265,6 +1081,13 @@ def main():
         st.subheader("S3 Storage")
         st.info(f"**Bucket:** `{s3_client.bucket}`")
         st.info(f"**Prefix:** `{s3_client.prefix}`")
+        upload_workers = st.slider(
+            "Parallel uploads",
+            min_value=1,
+            max_value=20,
+            value=10,
+            help="Files uploaded concurrently by Multi Upload"
+        )
         
         # RDS Info
         st.subheader("RDS Database")
@@ -272,10 +1095,9 @@ def main():
         st.info(f"**Database:** `{rds_client.database}`")
         
         # Test database connection
-        try:
-            rds_client.execute_query("SELECT 1", fetch=True)
+        if database_alive(rds_client, rds_client.host):
             st.success("✅ Database Connected")
-        except:
+        else:
             st.error("❌ Database Connection Failed")
         
         st.divider()
@@ -300,8 +1122,10 @@ def main():
         )
         st.caption(f"**Max file size:** {file_processor.max_file_size_mb} MB")
     
-    # Main content - Tabs
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11 = st.tabs([
+    # Main content - one section rendered per run. st.tabs executes every
+    # tab body on each rerun (CSV globs, previews, table listings), so a
+    # radio picks the section and only that branch runs.
+    sections = [
         "📄 Single Upload",
         "📁 Multi Upload",
         "💾 CSV Ingestion",
@@ -313,10 +1137,18 @@ def main():
         "📚 Benefit Coverage RAG",
         "📁 Local RAG",
         "🎯 AI Orchestration"
-    ])
+    ]
+    active_section = st.radio(
+        "Section",
+        sections,
+        horizontal=True,
+        key="active_page",
+        label_visibility="collapsed"
+    )
+    st.divider()
     
     # Tab 1: Single File Upload
-    with tab1:
+    if active_section == sections[0]:
         st.header("Upload Single File to S3")
         st.markdown("Upload and analyze a single file with duplicate detection.")
         
@@ -335,21 +1167,34 @@ def main():
                 st.write(f"**Type:** {uploaded_file.type}")
             
             with col2:
+                detect_near = st.checkbox("Detect near-duplicates", key="near_dup_single")
                 if st.button("🚀 Upload", type="primary", use_container_width=True):
                     with st.spinner("Uploading..."):
+                        # Hash once per selected file: repeat uploads of the
+                        # same file on later reruns reuse it from session state
+                        file_id = getattr(uploaded_file, "file_id", None) or (
+                            uploaded_file.name, uploaded_file.size
+                        )
+                        cached = st.session_state.get("single_upload_hash")
+                        if cached is None or cached[0] != file_id:
+                            cached = (file_id, duplicate_detector.compute_hash(uploaded_file))
+                            st.session_state["single_upload_hash"] = cached
+                        
                         result = process_file_upload(
                             uploaded_file,
                             uploaded_file.name,
                             s3_client,
                             file_processor,
-                            duplicate_detector
+                            duplicate_detector,
+                            detect_near_duplicates=detect_near,
+                            file_hash=cached[1]
                         )
                         
                         st.divider()
                         render_upload_result(result)
     
     # Tab 2: Multi-File Upload
-    with tab2:
+    if active_section == sections[1]:
         st.header("Upload Multiple Files to S3")
         st.markdown("Batch upload multiple files with individual status tracking.")
         
@@ -364,38 +1209,61 @@ def main():
             st.write(f"**Selected Files:** {len(uploaded_files)}")
             
             with st.expander("📋 View file list"):
-                for idx, file in enumerate(uploaded_files, 1):
-                    st.text(f"{idx}. {file.name} ({file.size / 1024:.2f} KB)")
+                # One text element for the whole list, not one per file
+                st.text("\n".join(
+                    f"{idx}. {file.name} ({file.size / 1024:.2f} KB)"
+                    for idx, file in enumerate(uploaded_files, 1)
+                ))
+            
+            detect_near = st.checkbox("Detect near-duplicates", key="near_dup_multi")
             
             if st.button("🚀 Upload All", type="primary", use_container_width=True):
-                progress_bar = st.progress(0, text="Starting upload...")
-                
-                results = []
-                for idx, file in enumerate(uploaded_files):
-                    progress_bar.progress(
-                        idx / len(uploaded_files),
-                        text=f"Uploading {idx + 1}/{len(uploaded_files)}: {file.name}"
-                    )
+                # Uploads are I/O-bound: run them concurrently on the shared
+                # S3 client and update progress from this (script) thread only
+                total = len(uploaded_files)
+                results = [None] * total
+                upload_status = st.status(f"Uploading {total} files...")
+                # At most ~50 label updates to the browser per batch
+                progress_step = max(1, total // 50)
+                with ThreadPoolExecutor(max_workers=min(upload_workers, total)) as executor:
+                    futures = {
+                        executor.submit(
+                            process_file_upload,
+                            file,
+                            file.name,
+                            s3_client,
+                            file_processor,
+                            duplicate_detector,
+                            detect_near
+                        ): idx
+                        for idx, file in enumerate(uploaded_files)
+                    }
                     
-                    result = process_file_upload(
-                        file,
-                        file.name,
-                        s3_client,
-                        file_processor,
-                        duplicate_detector
-                    )
-                    results.append(result)
+                    # Summary counts are tallied as results arrive
+                    successful = duplicates = 0
+                    for done, future in enumerate(as_completed(futures), 1):
+                        idx = futures[future]
+                        result = results[idx] = future.result()
+                        successful += result["success"]
+                        duplicates += result.get("is_duplicate", False)
+                        if not result["success"]:
+                            upload_status.write(f"❌ {result['file_name']}: {result['error']}")
+                        if done % progress_step == 0 or done == total:
+                            upload_status.update(
+                                label=f"Uploaded {done}/{total} ({done / total:.0%}): "
+                                      f"{uploaded_files[idx].name}"
+                            )
                 
-                progress_bar.progress(1.0, text="Upload complete!")
-                progress_bar.empty()
+                upload_status.update(
+                    label=f"Upload complete: {successful}/{total} succeeded",
+                    state="complete" if successful == total else "error"
+                )
                 
                 # Display summary
                 st.divider()
                 st.subheader("📊 Upload Summary")
                 
-                successful = sum(1 for r in results if r["success"])
                 failed = len(results) - successful
-                duplicates = sum(1 for r in results if r.get("is_duplicate", False))
                 
                 col1, col2, col3, col4 = st.columns(4)
                 col1.metric("Total", len(results))
@@ -406,23 +1274,24 @@ def main():
                 # Display results
                 st.divider()
                 st.subheader("📝 Detailed Results")
-                
-                for result in results:
-                    status_icon = "✅" if result["success"] else "❌"
-                    with st.expander(f"{status_icon} {result['file_name']}"):
-                        render_upload_result(result)
+                st.dataframe(upload_results_table(results), use_container_width=True, hide_index=True)
     
     # Tab 3: CSV Ingestion
-    with tab3:
+    if active_section == sections[2]:
         st.header("CSV Ingestion to RDS")
         st.markdown("Ingest CSV files into MySQL with automatic schema management.")
         
         # Mode selection
-        mode = st.radio(
-            "Ingestion Mode",
-            ["Single File", "Directory"],
-            horizontal=True
-        )
+        mode_col, rescan_col = st.columns([4, 1])
+        with mode_col:
+            mode = st.radio(
+                "Ingestion Mode",
+                ["Single File", "Directory"],
+                horizontal=True
+            )
+        with rescan_col:
+            if st.button("🔄 Rescan", use_container_width=True):
+                list_csv_files.clear()
         
         if mode == "Single File":
             st.subheader("Ingest Single CSV File")
@@ -430,12 +1299,12 @@ def main():
             # File selection
             csv_dir = Path(settings.csv_data_dir)
             if csv_dir.exists():
-                csv_files = list(csv_dir.glob("*.csv"))
+                csv_files = list_csv_files(str(csv_dir), csv_dir.stat().st_mtime)
                 
                 if csv_files:
                     selected_file = st.selectbox(
                         "Select CSV File",
-                        options=[f.name for f in csv_files],
+                        options=csv_files,
                         key="single_csv"
                     )
                     
@@ -445,7 +1314,7 @@ def main():
                         # Preview
                         with st.expander("📊 Preview Data"):
                             try:
-                                df_preview = pd.read_csv(file_path, nrows=5)
+                                df_preview = preview_csv(file_path, file_path.stat().st_mtime)
                                 st.dataframe(df_preview)
                                 st.caption(f"Showing first 5 rows of {len(df_preview.columns)} columns")
                             except Exception as e:
@@ -491,15 +1360,14 @@ def main():
             csv_dir = Path(settings.csv_data_dir)
             
             if csv_dir.exists():
-                csv_files = list(csv_dir.glob("*.csv"))
+                csv_files = list_csv_files(str(csv_dir), csv_dir.stat().st_mtime)
                 
                 st.info(f"📁 Directory: `{csv_dir}`")
                 st.info(f"📄 CSV files found: **{len(csv_files)}**")
                 
                 if csv_files:
                     with st.expander("📋 View files"):
-                        for f in csv_files:
-                            st.text(f"• {f.name}")
+                        st.text("\n".join(f"• {name}" for name in csv_files))
                     
                     # Options
                     continue_on_error = st.checkbox(
@@ -513,51 +1381,107 @@ def main():
                         value=False
                     )
                     
-                    # Ingest button
-                    if st.button("💾 Ingest All", type="primary", use_container_width=True):
-                        with st.spinner("Ingesting files..."):
-                            try:
-                                csv_ingestor.truncate_before_load = truncate
-                                
-                                results = csv_ingestor.ingest_directory(
-                                    directory=csv_dir,
-                                    continue_on_error=continue_on_error
+                    # Each file holds one pooled connection while it loads
+                    ingest_workers = st.slider(
+                        "Parallel files",
+                        min_value=1,
+                        max_value=settings.rds_pool_size + settings.rds_pool_max_overflow,
+                        value=min(4, settings.rds_pool_size),
+                        help="CSV files ingested concurrently; keep within your RDS capacity"
+                    )
+                    
+                    # Background job: survives reruns, polled below
+                    job = st.session_state.get("ingest_job")
+                    running = job is not None and not job["future"].done()
+                    
+                    if st.button(
+                        "💾 Ingest All",
+                        type="primary",
+                        use_container_width=True,
+                        disabled=running
+                    ):
+                        csv_ingestor.truncate_before_load = truncate
+                        
+                        # Written by the worker, read by this script thread
+                        progress = {"done": 0, "total": len(csv_files), "name": ""}
+                        
+                        def _on_file_done(done: int, total: int, name: str):
+                            progress.update(done=done, total=total, name=name)
+                        
+                        cancel_event = threading.Event()
+                        job = {
+                            "future": get_ingest_executor().submit(
+                                csv_ingestor.ingest_directory,
+                                directory=csv_dir,
+                                continue_on_error=continue_on_error,
+                                max_workers=ingest_workers,
+                                progress_callback=_on_file_done,
+                                cancel_event=cancel_event
+                            ),
+                            "progress": progress,
+                            "cancel": cancel_event
+                        }
+                        st.session_state["ingest_job"] = job
+                        running = True
+                    
+                    if running:
+                        if st.button("⏹️ Cancel remaining files"):
+                            job["cancel"].set()
+                        
+                        with st.status("Ingesting files...", expanded=True) as ingest_status:
+                            ingest_progress = st.progress(0, text="Starting ingestion...")
+                            while not job["future"].done():
+                                progress = job["progress"]
+                                ingest_progress.progress(
+                                    progress["done"] / max(1, progress["total"]),
+                                    text=f"Ingested {progress['done']}/{progress['total']}: {progress['name']}"
                                 )
-                                
+                                time.sleep(0.5)
+                            ingest_status.update(label="Ingestion finished", state="complete")
+                    
+                    if job is not None and job["future"].done():
+                        try:
+                            results = job["future"].result()
+                            
+                            st.divider()
+                            st.subheader("📊 Batch Ingestion Summary")
+                            
+                            col1, col2, col3, col4 = st.columns(4)
+                            col1.metric("Total Files", results["total_files"])
+                            col2.metric("Successful", results["successful"])
+                            col3.metric("Failed", results["failed"])
+                            col4.metric("Cancelled", results.get("cancelled", 0))
+                            
+                            # Individual results
+                            if results["results"]:
                                 st.divider()
-                                st.subheader("📊 Batch Ingestion Summary")
+                                st.subheader("📝 File Results")
                                 
-                                col1, col2, col3 = st.columns(3)
-                                col1.metric("Total Files", results["total_files"])
-                                col2.metric("Successful", results["successful"])
-                                col3.metric("Failed", results["failed"])
-                                
-                                # Individual results
-                                if results["results"]:
-                                    st.divider()
-                                    st.subheader("📝 File Results")
-                                    
-                                    for res in results["results"]:
-                                        status = "✅" if res.get("success") else "❌"
-                                        with st.expander(f"{status} {res['csv_file']}"):
-                                            render_ingestion_result(res)
-                                
-                                # Errors
-                                if results["errors"]:
-                                    st.divider()
-                                    st.subheader("⚠️ Errors")
-                                    for error in results["errors"]:
-                                        st.error(f"{error['file']}: {error['error']}")
-                                
-                            except Exception as e:
-                                st.error(f"❌ Batch ingestion failed: {str(e)}")
+                                for res in results["results"]:
+                                    status = "✅" if res.get("success") else "❌"
+                                    with st.expander(f"{status} {res['csv_file']}"):
+                                        render_ingestion_result(res)
+                            
+                            # Errors
+                            if results["errors"]:
+                                st.divider()
+                                st.subheader("⚠️ Errors")
+                                for error in results["errors"]:
+                                    st.error(f"{error['file']}: {error['error']}")
+                            
+                        except Exception as e:
+                            st.error(f"❌ Batch ingestion failed: {str(e)}")
+                        
+                        if st.button("🧹 Clear results"):
+                            del st.session_state["ingest_job"]
+                            st.rerun()
                 else:
                     st.warning("No CSV files found in directory")
             else:
                 st.error(f"Directory not found: {csv_dir}")
 
     # Tab 4: Member Verification
-    with tab4:
+    if active_section == sections[3]:
         st.header("👤 Member Verification")
         st.markdown("Verify member identity using AI-powered authentication with AWS Bedrock.")
 
@@ -613,9 +1537,7 @@ def main():
                 else:
                     with st.spinner("Verifying member..."):
                         try:
-                            # Lazy-load agent
-                            if verification_agent is None:
-                                verification_agent = MemberVerificationAgent()
+                            verification_agent = get_agent("MemberVerificationAgent")
                             # Build params
                             params = {}
                             if member_id:
@@ -626,8 +1548,7 @@ def main():
                                 params["name"] = name
 
                             # Call verification agent
-                            import asyncio
-                            result = asyncio.run(verification_agent.verify_member(**params))
+                            result = run_async(verification_agent.verify_member(**params))
 
                             st.divider()
 
@@ -680,7 +1601,7 @@ def main():
                 manual_input = st.text_area(
                     "Member Data",
                     placeholder="M1001, 2005-05-23, Brandi Kim\nM1002, 1987-12-14, Anthony Brown",
-                    help="Format: member_id, dob, name (one member per line)",
+                    help="Format: member_id, dob, name (one member per line; quote names containing commas)",
                     height=150
                 )
 
@@ -688,12 +1609,16 @@ def main():
                     if not manual_input.strip():
                         st.error("❌ Please enter member data")
                     else:
-                        # Parse manual input
+                        # Parse manual input as CSV so quoted names may
+                        # contain commas, e.g. M1001, 1990-01-01, "Kim, Brandi"
                         members = []
-                        lines = manual_input.strip().split("\n")
+                        reader = csv.reader(
+                            io.StringIO(manual_input.strip()),
+                            skipinitialspace=True
+                        )
 
-                        for idx, line in enumerate(lines, 1):
-                            parts = [p.strip() for p in line.split(",")]
+                        for row in reader:
+                            parts = [p.strip() for p in row]
                             if len(parts) >= 2:
                                 member = {"member_id": parts[0], "dob": parts[1]}
                                 if len(parts) >= 3:
@@ -705,19 +1630,14 @@ def main():
                         else:
                             with st.spinner(f"Verifying {len(members)} members..."):
                                 try:
-                                    # Lazy-load agent
-                                    if verification_agent is None:
-                                        verification_agent = MemberVerificationAgent()
-                                    import asyncio
-                                    results = asyncio.run(verification_agent.verify_member_batch(members))
+                                    verification_agent = get_agent("MemberVerificationAgent")
+                                    results = run_async(verification_agent.verify_member_batch(members))
 
                                     st.divider()
                                     st.subheader("📊 Batch Verification Results")
 
                                     # Summary metrics
-                                    verified = sum(1 for r in results if r.get("valid"))
-                                    failed = sum(1 for r in results if not r.get("valid") and "error" not in r)
-                                    errors = sum(1 for r in results if "error" in r)
+                                    verified, failed, errors = summarize_verifications(results)
 
                                     col1, col2, col3, col4 = st.columns(4)
                                     col1.metric("Total", len(results))
@@ -760,364 +1680,146 @@ def main():
 
                 if csv_file:
                     try:
-                        df = pd.read_csv(csv_file)
+                        # Only the preview rows are parsed up front; the full
+                        # file is streamed in chunks when verification runs
+                        df_preview = pd.read_csv(csv_file, nrows=10)
 
-                        st.write(f"**Loaded:** {len(df)} members")
+                        st.write(f"**Columns:** {', '.join(map(str, df_preview.columns))}")
 
                         with st.expander("📊 Preview Data"):
-                            st.dataframe(df.head(10))
+                            st.dataframe(df_preview)
 
                         if st.button("🔍 Verify All", type="primary", use_container_width=True):
-                            with st.spinner(f"Verifying {len(df)} members..."):
-                                try:
-                                    # Lazy-load agent
-                                    if verification_agent is None:
-                                        verification_agent = MemberVerificationAgent()
-                                    
-                                    # Convert DataFrame to list of dicts
-                                    members = df.to_dict('records')
-
-                                    # Clean up the data
-                                    for member in members:
-                                        # Convert any NaN to None
-                                        member = {k: (None if pd.isna(v) else v) for k, v in member.items()}
-
-                                    import asyncio
-                                    results = asyncio.run(verification_agent.verify_member_batch(members))
+                            progress = st.progress(0.0, text="Verifying members...")
+                            try:
+                                verification_agent = get_agent("MemberVerificationAgent")
+                                results = []
+
+                                csv_file.seek(0)
+                                for chunk in pd.read_csv(csv_file, chunksize=BATCH_VERIFY_CHUNK_ROWS):
+                                    # Empty cells (NaN) become None in one pass
+                                    members = chunk.astype(object).where(chunk.notna(), None).to_dict('records')
+                                    results.extend(run_async(verification_agent.verify_member_batch(members)))
+
+                                    # The parser reads ahead in blocks, so its
+                                    # position in the upload approximates
+                                    # progress without counting rows first
+                                    progress.progress(
+                                        min(csv_file.tell() / max(csv_file.size, 1), 1.0),
+                                        text=f"Verified {len(results)} members..."
+                                    )
+                                progress.empty()
 
-                                    st.divider()
-                                    st.subheader("📊 Batch Verification Results")
+                                st.divider()
+                                st.subheader("📊 Batch Verification Results")
 
-                                    # Summary metrics
-                                    verified = sum(1 for r in results if r.get("valid"))
-                                    failed = sum(1 for r in results if not r.get("valid") and "error" not in r)
-                                    errors = sum(1 for r in results if "error" in r)
+                                # Summary metrics
+                                verified, failed, errors = summarize_verifications(results)
 
-                                    col1, col2, col3, col4 = st.columns(4)
-                                    col1.metric("Total", len(results))
-                                    col2.metric("Verified", verified)
-                                    col3.metric("Not Found", failed)
-                                    col4.metric("Errors", errors)
+                                col1, col2, col3, col4 = st.columns(4)
+                                col1.metric("Total", len(results))
+                                col2.metric("Verified", verified)
+                                col3.metric("Not Found", failed)
+                                col4.metric("Errors", errors)
 
-                                    st.divider()
+                                st.divider()
 
-                                    # Create results DataFrame
-                                    results_df = pd.DataFrame(results)
-                                    st.subheader("📝 Results Table")
-                                    st.dataframe(results_df, use_container_width=True)
-
-                                    # Download results
-                                    csv_results = results_df.to_csv(index=False)
-                                    st.download_button(
-                                        label="📥 Download Results CSV",
-                                        data=csv_results,
-                                        file_name=f"verification_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                        mime="text/csv"
-                                    )
+                                # Create results DataFrame
+                                results_df = pd.DataFrame(results)
+                                st.subheader("📝 Results Table")
+                                st.dataframe(results_df, use_container_width=True)
+
+                                # Download results
+                                csv_results = results_df.to_csv(index=False)
+                                st.download_button(
+                                    label="📥 Download Results CSV",
+                                    data=csv_results,
+                                    file_name=f"verification_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                    mime="text/csv",
+                                    # Serve the file without rerunning the script, which would
+                                    # discard the results shown above
+                                    on_click="ignore"
+                                )
 
-                                except Exception as e:
-                                    st.error(f"❌ Batch verification failed: {str(e)}")
-                                    logger.error(f"CSV batch verification error: {str(e)}", exc_info=True)
+                            except Exception as e:
+                                progress.empty()
+                                st.error(f"❌ Batch verification failed: {str(e)}")
+                                logger.error(f"CSV batch verification error: {str(e)}", exc_info=True)
 
                     except Exception as e:
                         st.error(f"❌ Failed to load CSV: {str(e)}")
 
     # Tab 5: Deductible/OOP Lookup
-    with tab5:
-        st.header("💰 Deductible & Out-of-Pocket Lookup")
-        st.markdown("Query member deductible and OOP information using AWS Bedrock AI.")
-
-        st.info("""
-        **How it works:**
-        1. User Request → AWS Bedrock LLM → get_deductible_oop Tool
-        2. Tool queries RDS MySQL deductibles_oop table
-        3. Returns structured deductible/OOP data for all plan types and networks
-        """)
-
-        with st.form("deductible_oop_form"):
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                member_id = st.text_input(
-                    "Member ID *",
-                    placeholder="e.g., M1001",
-                    help="Required: Member identifier"
-                )
-
-            with col2:
-                plan_type = st.selectbox(
-                    "Plan Type (Optional)",
-                    options=["", "individual", "family"],
-                    help="Filter by plan type"
-                )
-
-            with col3:
-                network = st.selectbox(
-                    "Network (Optional)",
-                    options=["", "ppo", "par", "oon"],
-                    help="Filter by network level"
-                )
-
-            submit = st.form_submit_button("🔍 Lookup", type="primary", use_container_width=True)
-
-        if submit:
-            if not member_id:
-                st.error("❌ Member ID is required")
-            else:
-                with st.spinner("Querying deductible/OOP data..."):
-                    try:
-                        # Lazy-load agent
-                        if deductible_oop_agent is None:
-                            deductible_oop_agent = DeductibleOOPAgent()
-                        import asyncio
-                        result = asyncio.run(deductible_oop_agent.get_deductible_oop(
-                            member_id=member_id,
-                            plan_type=plan_type if plan_type else None,
-                            network=network if network else None
-                        ))
-
-                        st.divider()
-
-                        if result.get("found"):
-                            st.success(f"✅ Found deductible/OOP data for {result['member_id']}")
-
-                            # Individual Plans
-                            st.subheader("👤 Individual Plans")
-                            ind_data = result.get("individual", {})
-
-                            col1, col2, col3 = st.columns(3)
-
-                            with col1:
-                                st.markdown("**PPO**")
-                                ppo = ind_data.get("ppo", {})
-                                st.metric("Deductible", ppo.get("deductible", "N/A"))
-                                st.metric("Met", ppo.get("deductible_met", "N/A"))
-                                st.metric("Remaining", ppo.get("deductible_remaining", "N/A"))
-                                st.metric("OOP Limit", ppo.get("oop", "N/A"))
-                                st.metric("OOP Met", ppo.get("oop_met", "N/A"))
-                                st.metric("OOP Remaining", ppo.get("oop_remaining", "N/A"))
-
-                            with col2:
-                                st.markdown("**PAR**")
-                                par = ind_data.get("par", {})
-                                st.metric("Deductible", par.get("deductible", "N/A"))
-                                st.metric("Met", par.get("deductible_met", "N/A"))
-                                st.metric("Remaining", par.get("deductible_remaining", "N/A"))
-                                st.metric("OOP Limit", par.get("oop", "N/A"))
-                                st.metric("OOP Met", par.get("oop_met", "N/A"))
-                                st.metric("OOP Remaining", par.get("oop_remaining", "N/A"))
-
-                            with col3:
-                                st.markdown("**OON**")
-                                oon = ind_data.get("oon", {})
-                                st.metric("Deductible", oon.get("deductible", "N/A"))
-                                st.metric("Met", oon.get("deductible_met", "N/A"))
-                                st.metric("Remaining", oon.get("deductible_remaining", "N/A"))
-                                st.metric("OOP Limit", oon.get("oop", "N/A"))
-                                st.metric("OOP Met", oon.get("oop_met", "N/A"))
-                                st.metric("OOP Remaining", oon.get("oop_remaining", "N/A"))
-
-                            st.divider()
-
-                            # Family Plans
-                            st.subheader("👨‍👩‍👧‍👦 Family Plans")
-                            fam_data = result.get("family", {})
-
-                            col1, col2, col3 = st.columns(3)
-
-                            with col1:
-                                st.markdown("**PPO**")
-                                ppo = fam_data.get("ppo", {})
-                                st.metric("Deductible", ppo.get("deductible", "N/A"))
-                                st.metric("Met", ppo.get("deductible_met", "N/A"))
-                                st.metric("Remaining", ppo.get("deductible_remaining", "N/A"))
-                                st.metric("OOP Limit", ppo.get("oop", "N/A"))
-                                st.metric("OOP Met", ppo.get("oop_met", "N/A"))
-                                st.metric("OOP Remaining", ppo.get("oop_remaining", "N/A"))
-
-                            with col2:
-                                st.markdown("**PAR**")
-                                par = fam_data.get("par", {})
-                                st.metric("Deductible", par.get("deductible", "N/A"))
-                                st.metric("Met", par.get("deductible_met", "N/A"))
-                                st.metric("Remaining", par.get("deductible_remaining", "N/A"))
-                                st.metric("OOP Limit", par.get("oop", "N/A"))
-                                st.metric("OOP Met", par.get("oop_met", "N/A"))
-                                st.metric("OOP Remaining", par.get("oop_remaining", "N/A"))
-
-                            with col3:
-                                st.markdown("**OON**")
-                                oon = fam_data.get("oon", {})
-                                st.metric("Deductible", oon.get("deductible", "N/A"))
-                                st.metric("Met", oon.get("deductible_met", "N/A"))
-                                st.metric("Remaining", oon.get("deductible_remaining", "N/A"))
-                                st.metric("OOP Limit", oon.get("oop", "N/A"))
-                                st.metric("OOP Met", oon.get("oop_met", "N/A"))
-                                st.metric("OOP Remaining", oon.get("oop_remaining", "N/A"))
-
-                            with st.expander("📋 View Full Response"):
-                                st.json(result)
-
-                        elif "error" in result:
-                            st.error(f"❌ Lookup Error: {result['error']}")
-                            with st.expander("📋 View Error Details"):
-                                st.json(result)
-                        else:
-                            st.warning("⚠️ No data found")
-                            st.info(result.get("message", "No deductible/OOP data found"))
-
-                    except Exception as e:
-                        st.error(f"❌ Lookup failed: {str(e)}")
-                        logger.error(f"Deductible/OOP lookup error: {str(e)}", exc_info=True)
+    if active_section == sections[4]:
+        render_deductible_oop_tab()
 
     # Tab 6: Benefit Accumulator Lookup
-    with tab6:
-        st.header("🏥 Benefit Accumulator Lookup")
-        st.markdown("Query member benefit usage information using AWS Bedrock AI.")
-
-        st.info("""
-        **How it works:**
-        1. User Request → AWS Bedrock LLM → get_benefit_accumulator Tool
-        2. Tool queries RDS MySQL benefit_accumulator table
-        3. Returns benefit usage data with limits, used amounts, and remaining balances
-        """)
-
-        with st.form("benefit_accumulator_form"):
-            col1, col2 = st.columns(2)
-
-            with col1:
-                member_id = st.text_input(
-                    "Member ID *",
-                    placeholder="e.g., M1001",
-                    help="Required: Member identifier"
-                )
-
-            with col2:
-                service = st.text_input(
-                    "Service (Optional)",
-                    placeholder="e.g., Massage Therapy",
-                    help="Filter by specific service name"
-                )
-
-            submit = st.form_submit_button("🔍 Lookup", type="primary", use_container_width=True)
-
-        if submit:
-            if not member_id:
-                st.error("❌ Member ID is required")
-            else:
-                with st.spinner("Querying benefit accumulator data..."):
-                    try:
-                        # Lazy-load agent
-                        if benefit_accumulator_agent is None:
-                            benefit_accumulator_agent = BenefitAccumulatorAgent()
-                        import asyncio
-                        result = asyncio.run(benefit_accumulator_agent.get_benefit_accumulator(
-                            member_id=member_id,
-                            service=service if service else None
-                        ))
-
-                        st.divider()
-
-                        if result.get("found"):
-                            benefits = result.get("benefits", [])
-                            st.success(f"✅ Found {len(benefits)} benefit(s) for {result['member_id']}")
-
-                            # Display benefits as table
-                            if benefits:
-                                df_benefits = pd.DataFrame(benefits)
-                                st.dataframe(
-                                    df_benefits,
-                                    use_container_width=True,
-                                    column_config={
-                                        "service": st.column_config.TextColumn("Service", width="medium"),
-                                        "allowed_limit": st.column_config.TextColumn("Allowed Limit", width="medium"),
-                                        "used": st.column_config.NumberColumn("Used", width="small"),
-                                        "remaining": st.column_config.NumberColumn("Remaining", width="small")
-                                    }
-                                )
-
-                                st.divider()
-
-                                # Individual benefit cards
-                                st.subheader("📊 Benefit Details")
-                                for benefit in benefits:
-                                    with st.expander(f"🏥 {benefit['service']}"):
-                                        col1, col2, col3 = st.columns(3)
-                                        col1.metric("Allowed Limit", benefit['allowed_limit'])
-                                        col2.metric("Used", benefit['used'])
-                                        col3.metric("Remaining", benefit['remaining'])
-
-                            with st.expander("📋 View Full Response"):
-                                st.json(result)
-
-                        elif "error" in result:
-                            st.error(f"❌ Lookup Error: {result['error']}")
-                            with st.expander("📋 View Error Details"):
-                                st.json(result)
-                        else:
-                            st.warning("⚠️ No benefits found")
-                            st.info(result.get("message", "No benefit accumulator data found"))
-
-                    except Exception as e:
-                        st.error(f"❌ Lookup failed: {str(e)}")
-                        logger.error(f"Benefit accumulator lookup error: {str(e)}", exc_info=True)
+    if active_section == sections[5]:
+        render_benefit_accumulator_tab()
 
     # Tab 7: View Duplicates
-    with tab7:
+    if active_section == sections[6]:
         st.header("Duplicate Detection Cache")
         st.markdown("Browse all detected duplicate file groups.")
         
-        duplicates = duplicate_detector.get_all_duplicates()
+        dup_stats = duplicate_detector.get_cache_stats()
+        duplicates = list_duplicate_groups(
+            duplicate_detector,
+            duplicate_detector.generation,
+            dup_stats["duplicate_groups"],
+            dup_stats["duplicate_files"]
+        )
         
         if not duplicates:
             st.info("ℹ️ No duplicates detected yet. Upload some files to see duplicates.")
         else:
             st.success(f"Found **{len(duplicates)}** duplicate group(s)")
             
-            for idx, (hash_val, paths) in enumerate(duplicates.items(), 1):
+            # Render one page of groups; one expander per group for
+            # thousands of groups makes every rerun slow
+            total_pages = -(-len(duplicates) // DUPLICATE_GROUPS_PER_PAGE)
+            if st.session_state.get("dup_page", 1) > total_pages:
+                st.session_state["dup_page"] = total_pages
+            
+            page = 1
+            if total_pages > 1:
+                page = st.number_input(
+                    f"Page (of {total_pages})",
+                    min_value=1,
+                    max_value=total_pages,
+                    step=1,
+                    key="dup_page"
+                )
+            start = (page - 1) * DUPLICATE_GROUPS_PER_PAGE
+            page_groups = duplicates[start:start + DUPLICATE_GROUPS_PER_PAGE]
+            
+            for idx, (hash_val, paths) in enumerate(page_groups, start + 1):
                 with st.expander(
                     f"**Group {idx}:** {len(paths)} files (Hash: `{hash_val[:16]}...`)"
                 ):
                     st.write("**Files in this group:**")
-                    for path in paths:
-                        st.code(Path(path).name, language=None)
+                    st.code("\n".join(os.path.basename(p) for p in paths), language=None)
                     
                     st.caption(f"Full hash: `{hash_val}`")
 
     # Tab 8: Database Tables
-    with tab8:
+    if active_section == sections[7]:
         st.header("RDS Database Tables")
         st.markdown("View table schemas and statistics.")
         
         try:
-            # Get list of tables
-            tables_query = """
-                SELECT 
-                    table_name,
-                    table_rows,
-                    data_length,
-                    create_time,
-                    update_time
-                FROM information_schema.tables
-                WHERE table_schema = %s
-                ORDER BY table_name
-            """
-            
-            tables = rds_client.execute_query(
-                tables_query,
-                params=(rds_client.database,)
-            )
+            # Get list of tables (cached briefly across reruns)
+            tables = list_tables(rds_client, rds_client.database)
             
             if tables:
                 st.success(f"Found **{len(tables)}** tables")
                 
                 # Table selector
-                table_names = [t["table_name"] for t in tables]
-                selected_table = st.selectbox("Select Table", options=table_names)
+                selected_table = st.selectbox("Select Table", options=list(tables))
                 
                 if selected_table:
                     # Table info
-                    table_info = next(t for t in tables if t["table_name"] == selected_table)
+                    table_info = tables[selected_table]
                     
                     col1, col2, col3 = st.columns(3)
                     col1.metric("Rows", f"{table_info['table_rows']:,}")
@@ -1127,7 +1829,7 @@ def main():
                     st.divider()
                     
                     # Get columns
-                    columns = rds_client.get_table_columns(selected_table)
+                    columns = table_info["columns"]
                     
                     st.subheader("📋 Schema")
                     
@@ -1147,14 +1849,15 @@ def main():
                     
                     if st.button("Load Preview"):
                         try:
-                            preview_query = f"SELECT * FROM `{selected_table}` LIMIT %s"
-                            preview_data = rds_client.execute_query(
-                                preview_query,
-                                params=(preview_limit,)
+                            # Read straight into columns, no per-row dicts
+                            df_preview = pd.read_sql_query(
+                                preview_statement(selected_table),
+                                rds_client.get_engine(),
+                                params={"limit": preview_limit},
+                                dtype_backend=SQL_DTYPE_BACKEND
                             )
                             
-                            if preview_data:
-                                df_preview = pd.DataFrame(preview_data)
+                            if not df_preview.empty:
                                 st.dataframe(df_preview, use_container_width=True)
                             else:
                                 st.info("Table is empty")
@@ -1168,7 +1871,7 @@ def main():
             st.error(f"Failed to retrieve table information: {str(e)}")
 
     # Tab 9: Benefit Coverage RAG
-    with tab9:
+    if active_section == sections[8]:
         st.header("📚 Benefit Coverage RAG Agent")
         st.markdown("Query benefit coverage documents using cloud-based RAG with AWS Textract and Bedrock.")
 
@@ -1237,29 +1940,21 @@ def main():
                 if st.button("🚀 Upload & Prepare RAG Pipeline", type="primary", use_container_width=True):
                     with st.spinner("📤 Step 1/4: Uploading PDF to S3..."):
                         try:
-                            # Save uploaded file to temp location
-                            import tempfile
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                                tmp.write(uploaded_pdf.read())
-                                temp_pdf_path = tmp.name
-
-                            # Upload to S3
+                            # Upload to S3 straight from the uploaded buffer
                             s3_key = f"pdf/{uploaded_pdf.name}"
-                            s3_uri = s3_client.upload_file(
-                                Path(temp_pdf_path),
+                            s3_uri = s3_client.upload_fileobj(
+                                uploaded_pdf,
                                 s3_key=s3_key,
                                 metadata={
                                     "original_filename": uploaded_pdf.name,
                                     "document_type": "pdf",
                                     "workflow": "dynamic_rag"
-                                }
+                                },
+                                content_type="application/pdf"
                             )
 
                             st.success(f"✅ Uploaded to S3: `{s3_uri}`")
 
-                            # Clean up temp file
-                            Path(temp_pdf_path).unlink(missing_ok=True)
-
                             # Construct Textract output prefix
                             # S3 client adds 'mba/' prefix, so full key is: mba/pdf/filename.pdf
                             # Textract Lambda outputs to: mba/textract-output/mba/pdf/filename/{job_id}/
@@ -1282,9 +1977,6 @@ def main():
                             st.caption(f"💡 Note: Textract creates job-specific subfolders automatically")
 
                             # Wait for Textract to process - with progress updates
-                            import time
-                            import boto3
-
                             max_wait_time = 60  # Wait up to 60 seconds
                             check_interval = 5  # Check every 5 seconds
 
@@ -1351,17 +2043,14 @@ def main():
 
                             # Step 3: Prepare RAG pipeline
                             with st.spinner("🔄 Step 3/4: Preparing RAG pipeline from Textract output..."):
-                                # Lazy-load agent
-                                if benefit_coverage_rag_agent is None:
-                                    benefit_coverage_rag_agent = BenefitCoverageRAGAgent()
+                                benefit_coverage_rag_agent = get_agent("BenefitCoverageRAGAgent")
 
-                                import asyncio
 
                                 # Show detailed progress
                                 progress_placeholder = st.empty()
                                 progress_placeholder.info("📊 Extracting text from Textract JSON files...")
 
-                                result = asyncio.run(benefit_coverage_rag_agent.prepare_pipeline(
+                                result = run_async(benefit_coverage_rag_agent.prepare_pipeline(
                                     s3_bucket=s3_client.bucket,
                                     textract_prefix=textract_prefix,
                                     index_name=index_name if index_name else "benefit_coverage_rag_index",
@@ -1493,12 +2182,9 @@ def main():
                 else:
                     with st.spinner("Preparing RAG pipeline..."):
                         try:
-                            # Lazy-load agent
-                            if benefit_coverage_rag_agent is None:
-                                benefit_coverage_rag_agent = BenefitCoverageRAGAgent()
+                            benefit_coverage_rag_agent = get_agent("BenefitCoverageRAGAgent")
 
-                            import asyncio
-                            result = asyncio.run(benefit_coverage_rag_agent.prepare_pipeline(
+                            result = run_async(benefit_coverage_rag_agent.prepare_pipeline(
                                 s3_bucket=s3_bucket,
                                 textract_prefix=textract_prefix,
                                 index_name=f"{vector_store}_benefit_coverage"
@@ -1569,12 +2255,9 @@ def main():
                 else:
                     with st.spinner("Querying documents..."):
                         try:
-                            # Lazy-load agent
-                            if benefit_coverage_rag_agent is None:
-                                benefit_coverage_rag_agent = BenefitCoverageRAGAgent()
+                            benefit_coverage_rag_agent = get_agent("BenefitCoverageRAGAgent")
 
-                            import asyncio
-                            result = asyncio.run(benefit_coverage_rag_agent.query(
+                            result = run_async(benefit_coverage_rag_agent.query(
                                 question=question,
                                 k=rerank_top_n  # Use rerank_top_n as the final number of docs
                             ))
@@ -1620,7 +2303,7 @@ def main():
                             logger.error(f"Benefit Coverage RAG query error: {str(e)}", exc_info=True)
 
     # Tab 10: Local RAG
-    with tab10:
+    if active_section == sections[9]:
         st.header("📁 Local RAG Agent")
         st.markdown("Upload PDFs and query them using local open-source RAG (PyMuPDF, Tabula, ChromaDB).")
 
@@ -1657,18 +2340,16 @@ def main():
                 if st.button("🚀 Extract Content", type="primary", use_container_width=True):
                     with st.spinner("Extracting text and tables from PDF..."):
                         try:
-                            # Save uploaded file to temp location
-                            import tempfile
+                            # Save uploaded file to temp location, 1 MiB at
+                            # a time rather than as one bytes copy
+                            uploaded_pdf.seek(0)
                             with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                                tmp.write(uploaded_pdf.read())
+                                shutil.copyfileobj(uploaded_pdf, tmp, length=1 << 20)
                                 temp_pdf_path = tmp.name
 
-                            # Lazy-load agent
-                            if local_rag_agent is None:
-                                local_rag_agent = LocalRAGAgent()
+                            local_rag_agent = get_agent("LocalRAGAgent")
 
-                            import asyncio
-                            result = asyncio.run(local_rag_agent.upload_pdf(
+                            result = run_async(local_rag_agent.upload_pdf(
                                 file_path=temp_pdf_path,
                                 filename=uploaded_pdf.name,  # Pass original filename
                                 extract_now=True
@@ -1729,7 +2410,6 @@ def main():
                         # Preview JSON metadata
                         with st.expander("📊 Preview Extraction Metadata"):
                             try:
-                                import json
                                 with open(json_path, "r", encoding="utf-8") as f:
                                     data = json.load(f)
 
@@ -1744,12 +2424,9 @@ def main():
                         if st.button("🚀 Prepare Pipeline", type="primary", use_container_width=True):
                             with st.spinner("Preparing local RAG pipeline..."):
                                 try:
-                                    # Lazy-load agent
-                                    if local_rag_agent is None:
-                                        local_rag_agent = LocalRAGAgent()
+                                    local_rag_agent = get_agent("LocalRAGAgent")
 
-                                    import asyncio
-                                    result = asyncio.run(local_rag_agent.prepare_pipeline(
+                                    result = run_async(local_rag_agent.prepare_pipeline(
                                         json_path=str(json_path)
                                     ))
 
@@ -1832,12 +2509,9 @@ def main():
                 else:
                     with st.spinner("Querying local documents..."):
                         try:
-                            # Lazy-load agent
-                            if local_rag_agent is None:
-                                local_rag_agent = LocalRAGAgent()
+                            local_rag_agent = get_agent("LocalRAGAgent")
 
-                            import asyncio
-                            result = asyncio.run(local_rag_agent.query(
+                            result = run_async(local_rag_agent.query(
                                 question=question,
                                 collection_name=collection_name if collection_name else "local_benefit_coverage",
                                 k=rerank_top_n,  # Use rerank_top_n as final number of docs
@@ -1885,7 +2559,7 @@ def main():
                             logger.error(f"Local RAG query error: {str(e)}", exc_info=True)
 
     # Tab 11: AI Orchestration
-    with tab11:
+    if active_section == sections[10]:
         st.header("🎯 AI-Powered Orchestration Agent")
         st.markdown("Intelligent multi-agent routing powered by AWS Bedrock Claude Sonnet 4.5")
 
@@ -1951,12 +2625,9 @@ def main():
                 else:
                     with st.spinner("🤖 AI is analyzing your query and routing to appropriate agent..."):
                         try:
-                            # Lazy-load orchestration agent
-                            if orchestration_agent is None:
-                                orchestration_agent = OrchestrationAgent()
+                            orchestration_agent = get_orchestration_agent()
 
-                            import asyncio
-                            result = asyncio.run(orchestration_agent.process_query(
+                            result = run_async(orchestration_agent.process_query(
                                 query=query,
                                 context={},
                                 preserve_history=preserve_history
@@ -2119,12 +2790,9 @@ def main():
                     else:
                         with st.spinner(f"🤖 Processing {len(queries)} queries..."):
                             try:
-                                # Lazy-load orchestration agent
-                                if orchestration_agent is None:
-                                    orchestration_agent = OrchestrationAgent()
+                                orchestration_agent = get_orchestration_agent()
 
-                                import asyncio
-                                results = asyncio.run(orchestration_agent.process_batch(
+                                results = run_async(orchestration_agent.process_batch(
                                     queries=queries,
                                     context={}
                                 ))
@@ -2132,15 +2800,13 @@ def main():
                                 st.divider()
                                 st.subheader("📊 Batch Processing Results")
 
-                                # Summary metrics
-                                successful = sum(1 for r in results if r.get("success"))
-                                failed = len(results) - successful
-
-                                # Intent distribution
-                                intent_counts = {}
+                                # Summary metrics and intent distribution in one pass
+                                successful = 0
+                                intent_counts = Counter()
                                 for r in results:
-                                    intent = r.get("intent", "unknown")
-                                    intent_counts[intent] = intent_counts.get(intent, 0) + 1
+                                    successful += bool(r.get("success"))
+                                    intent_counts[r.get("intent", "unknown")] += 1
+                                failed = len(results) - successful
 
                                 col1, col2, col3 = st.columns(3)
                                 col1.metric("Total Queries", len(results))
@@ -2185,7 +2851,7 @@ def main():
 
                 if csv_file:
                     try:
-                        df = pd.read_csv(csv_file)
+                        df = pd.read_csv(csv_file, **CSV_READ_OPTIONS)
 
                         if "query" not in df.columns:
                             st.error("❌ CSV must have a 'query' column")
@@ -2200,12 +2866,9 @@ def main():
 
                                 with st.spinner(f"🤖 Processing {len(queries)} queries..."):
                                     try:
-                                        # Lazy-load orchestration agent
-                                        if orchestration_agent is None:
-                                            orchestration_agent = OrchestrationAgent()
+                                        orchestration_agent = get_orchestration_agent()
 
-                                        import asyncio
-                                        results = asyncio.run(orchestration_agent.process_batch(
+                                        results = run_async(orchestration_agent.process_batch(
                                             queries=queries,
                                             context={}
                                         ))
@@ -2235,7 +2898,8 @@ def main():
                                             label="📥 Download Results CSV",
                                             data=csv_results,
                                             file_name=f"orchestration_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                            mime="text/csv"
+                                            mime="text/csv",
+                                            on_click="ignore"
                                         )
 
                                     except Exception as e:
@@ -2252,9 +2916,7 @@ def main():
             # Get history button
             if st.button("🔍 View History", type="primary"):
                 try:
-                    # Lazy-load orchestration agent
-                    if orchestration_agent is None:
-                        orchestration_agent = OrchestrationAgent()
+                    orchestration_agent = get_orchestration_agent()
 
                     history = orchestration_agent.get_conversation_history()
 
@@ -2287,8 +2949,7 @@ def main():
             st.divider()
             if st.button("🗑️ Clear History", type="secondary"):
                 try:
-                    if orchestration_agent is None:
-                        orchestration_agent = OrchestrationAgent()
+                    orchestration_agent = get_orchestration_agent()
 
                     orchestration_agent.clear_conversation_history()
                     st.success("✅ Conversation history cleared!")
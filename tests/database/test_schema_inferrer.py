@@ -0,0 +1,114 @@
+"""
+Tests for SchemaInferrer's pandas and Arrow inference paths.
+
+Both paths run on the same small CSVs and must pick the same MySQL types,
+so a table's schema does not depend on whether pyarrow is installed.
+
+Run with: python -m pytest tests/database/test_schema_inferrer.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+pytest.importorskip("pyarrow")
+
+from MBA.services.database.schema_inferrer import SchemaInferrer
+
+
+# (csv text, expected (type, nullable) per column)
+CASES = {
+    "integer_widths": (
+        "small,neg,wide,signed,big\n"
+        "1,-5,70000,-40000,5000000000\n"
+        "200,100,3,40000,1\n",
+        [
+            ("TINYINT UNSIGNED", False),
+            ("TINYINT", False),
+            ("INT UNSIGNED", False),
+            ("INT", False),
+            ("BIGINT", False),
+        ],
+    ),
+    "integers_with_gaps": (
+        "count,tag\n3,a\n,b\n300,c\n",
+        [("SMALLINT UNSIGNED", True), ("VARCHAR(50)", False)],
+    ),
+    "flags": (
+        "flag,active\n0,true\n1,false\n,\n",
+        [("BOOLEAN", True), ("BOOLEAN", True)],
+    ),
+    "floats": (
+        "price,ratio\n1.5,0.25\n2.25,\n",
+        [("DOUBLE", False), ("DOUBLE", True)],
+    ),
+    "iso_dates": (
+        "visit,seen_at\n2024-01-02,2024-01-02T08:30:00\n2024-02-03,\n",
+        [("DATETIME", False), ("DATETIME", True)],
+    ),
+    "all_null": (
+        "empty,blank\n,\n,\n",
+        [("TEXT", True), ("TEXT", True)],
+    ),
+    "strings": (
+        "label,note\nalpha,\nbeta,"
+        + "x" * 120
+        + "\n",
+        [("VARCHAR(50)", False), ("VARCHAR(255)", True)],
+    ),
+}
+
+
+@pytest.fixture
+def inferrer():
+    return SchemaInferrer()
+
+
+def infer_pandas(inferrer, csv_path):
+    # No Arrow table: infer_schema reads the sample with pandas
+    inferrer._read_sample_arrow = lambda path: None
+    return inferrer.infer_schema(csv_path, add_metadata_columns=False)["columns"]
+
+
+def infer_arrow(inferrer, csv_path):
+    assert inferrer._read_sample_arrow(csv_path) is not None
+    return inferrer.infer_schema(csv_path, add_metadata_columns=False)["columns"]
+
+
+@pytest.mark.parametrize("infer", [infer_pandas, infer_arrow], ids=["pandas", "arrow"])
+@pytest.mark.parametrize("case", list(CASES))
+def test_inference_paths_agree(tmp_path, inferrer, infer, case):
+    text, expected = CASES[case]
+    csv_path = tmp_path / f"{case}.csv"
+    csv_path.write_text(text)
+
+    columns = infer(inferrer, csv_path)
+
+    assert [(c["type"], bool(c["nullable"])) for c in columns] == expected
+
+
+def test_duplicate_headers_fall_back_to_pandas(tmp_path, inferrer):
+    csv_path = tmp_path / "dup.csv"
+    csv_path.write_text("id,id\n1,2\n")
+
+    assert inferrer._read_sample_arrow(csv_path) is None
+    schema = inferrer.infer_schema(csv_path, add_metadata_columns=False)
+    assert [c["name"] for c in schema["columns"]] == ["id", "id_1"]
+
+
+def test_arrow_invalid_falls_back_to_pandas(tmp_path, inferrer):
+    # Arrow rejects the short row; pandas pads it with NULL
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text("a,b\n1,2\n3\n")
+
+    assert inferrer._read_sample_arrow(csv_path) is None
+    schema = inferrer.infer_schema(csv_path, add_metadata_columns=False)
+    assert [(c["name"], c["type"], bool(c["nullable"])) for c in schema["columns"]] == [
+        ("a", "TINYINT UNSIGNED", False),
+        ("b", "TINYINT UNSIGNED", True),
+    ]
+    assert schema["row_count"] == 2
@@ -0,0 +1,145 @@
+"""
+Tests for BatchProcessor.ingest_directory ordering and cancellation.
+
+Uses a stub ingestor whose files finish in a controlled order, so no
+database is needed.
+
+Run with: python -m pytest tests/ingestion/test_batch_processor.py
+"""
+
+import sys
+from pathlib import Path
+from threading import Condition, Event
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from MBA.services.ingestion.batch_processor import BatchProcessor
+
+
+class StubIngestor:
+    """Runs per-file behaviours keyed by file index and records starts."""
+
+    def __init__(self, files, behaviours):
+        self._index = {path: idx for idx, path in enumerate(files)}
+        self._behaviours = behaviours
+        self.started = []
+
+    def ingest_csv(self, csv_file):
+        idx = self._index[csv_file]
+        self.started.append(idx)
+        behaviour = self._behaviours.get(idx)
+        if behaviour is not None:
+            behaviour()
+        return {"success": True, "file": csv_file.name}
+
+
+class ProgressGate:
+    """Progress callback that lets stub files wait for N finished files."""
+
+    def __init__(self):
+        self.calls = []
+        self._cond = Condition()
+
+    def __call__(self, done, total, file_name):
+        with self._cond:
+            self.calls.append((done, total, file_name))
+            self._cond.notify_all()
+
+    def wait_for(self, count):
+        with self._cond:
+            assert self._cond.wait_for(lambda: len(self.calls) >= count, timeout=5)
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    for name in ("a", "b", "c", "d"):
+        (tmp_path / f"{name}.csv").write_text("id\n1\n")
+    return tmp_path
+
+
+def listed(directory):
+    # Same order ingest_directory submits files in
+    return list(directory.glob("*.csv"))
+
+
+def test_results_in_file_order_when_finished_out_of_order(csv_dir):
+    files = listed(csv_dir)
+    finished = [Event() for _ in files]
+
+    def after(idx, wait_for=None):
+        def run():
+            if wait_for is not None:
+                assert finished[wait_for].wait(timeout=5)
+            finished[idx].set()
+        return run
+
+    # Completion order: 3, 2, 1, 0
+    last = len(files) - 1
+    behaviours = {idx: after(idx, idx + 1 if idx < last else None) for idx in range(len(files))}
+    ingestor = StubIngestor(files, behaviours)
+    gate = ProgressGate()
+
+    summary = BatchProcessor(ingestor).ingest_directory(
+        csv_dir, max_workers=len(files), progress_callback=gate
+    )
+
+    assert [r["file"] for r in summary["results"]] == [f.name for f in files]
+    assert summary["successful"] == len(files)
+    assert summary["cancelled"] == 0
+    # One callback per finished file, counting up to the total
+    assert [call[0] for call in gate.calls] == [1, 2, 3, 4]
+    assert {call[1] for call in gate.calls} == {len(files)}
+    assert sorted(call[2] for call in gate.calls) == sorted(f.name for f in files)
+
+
+def gated(gate, files, first):
+    # File k > 0 cannot finish before k files have been reported, so the
+    # single worker never outruns the cancellation by more than two files
+    behaviours = {idx: (lambda k=idx: gate.wait_for(k)) for idx in range(1, len(files))}
+    behaviours[0] = first
+    return behaviours
+
+
+def test_failure_cancels_pending_files_when_not_continuing(csv_dir):
+    files = listed(csv_dir)
+    gate = ProgressGate()
+
+    def fail():
+        raise RuntimeError("bad file")
+
+    ingestor = StubIngestor(files, gated(gate, files, fail))
+
+    summary = BatchProcessor(ingestor).ingest_directory(
+        csv_dir, continue_on_error=False, max_workers=1, progress_callback=gate
+    )
+
+    assert summary["errors"] == [
+        {"file": files[0].name, "error": "bad file", "type": "RuntimeError"}
+    ]
+    assert summary["failed"] == 1
+    assert len(files) - 1 not in ingestor.started
+    assert summary["cancelled"] == len(files) - len(ingestor.started) >= 1
+    assert len(gate.calls) == len(ingestor.started)
+
+
+def test_cancel_event_stops_files_not_started(csv_dir):
+    files = listed(csv_dir)
+    gate = ProgressGate()
+    cancel = Event()
+
+    ingestor = StubIngestor(files, gated(gate, files, cancel.set))
+
+    summary = BatchProcessor(ingestor).ingest_directory(
+        csv_dir, max_workers=1, progress_callback=gate, cancel_event=cancel
+    )
+
+    assert len(files) - 1 not in ingestor.started
+    assert summary["cancelled"] == len(files) - len(ingestor.started) >= 1
+    assert summary["successful"] == len(ingestor.started)
+    assert [r["file"] for r in summary["results"]] == [
+        files[idx].name for idx in sorted(ingestor.started)
+    ]
+    assert len(gate.calls) == len(ingestor.started)
@@ -0,0 +1,106 @@
+"""
+Tests for the CSV loader's LOAD DATA LOCAL INFILE path.
+
+Checks that the generated statement converts raw CSV text the same way
+the pandas insert path does, without needing a database.
+
+Run with: python -m pytest tests/ingestion/test_csv_loader.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from MBA.services.ingestion.loader import CSVLoader
+
+
+class FakeRDSClient:
+    """Records LOAD DATA calls and returns canned warnings."""
+
+    local_infile = True
+
+    def __init__(self, columns, warnings=()):
+        self._columns = columns
+        self._warnings = list(warnings)
+        self.queries = []
+
+    def get_table_columns(self, table_name):
+        return self._columns
+
+    def load_local_infile(self, query, params=None):
+        self.queries.append((query, params))
+        return 3, self._warnings
+
+
+COLUMNS = [
+    # MySQL 8 returns upper-case information_schema names
+    {"COLUMN_NAME": "member_id", "COLUMN_TYPE": "varchar(50)"},
+    {"COLUMN_NAME": "active", "COLUMN_TYPE": "tinyint(1)"},
+    {"COLUMN_NAME": "copay", "COLUMN_TYPE": "double"},
+]
+
+MAPPING = {"Member ID": "member_id", "Active": "active", "Copay": "copay"}
+
+
+def write_csv(tmp_path):
+    csv_path = tmp_path / "members.csv"
+    csv_path.write_text(
+        "Member ID,Active,Ignored,Copay\n"
+        "M1001,True,x,20.5\n"
+        "M1002,false,y,NA\n"
+        "M1003,,z,null\n"
+    )
+    return csv_path
+
+
+def test_load_data_query_is_type_aware(tmp_path):
+    client = FakeRDSClient(COLUMNS)
+    loader = CSVLoader(rds_client=client)
+
+    loader._load_via_local_infile(write_csv(tmp_path), "members", MAPPING)
+    query, params = client.queries[0]
+
+    # Header fields bound in file order; unmapped column discarded
+    assert "(@c0, @c1, @skip, @c3)" in query
+    # BOOLEAN text mapped to 1/0 like pandas' bool parsing
+    assert "`active` = IF(CAST(@c1 AS BINARY) IN (" in query
+    assert "CASE LOWER(@c1) WHEN 'true' THEN 1 WHEN 'false' THEN 0 ELSE @c1 END" in query
+    # pandas' NA tokens become NULL for every mapped column
+    for token in ("''", "'NA'", "'null'", "'NaN'", "'N/A'", "'#N/A'"):
+        assert token in query
+    assert "`copay` = IF(CAST(@c3 AS BINARY) IN (" in query
+    assert "NULL, @c3)" in query
+    assert "CASE LOWER(@c0)" not in query
+    assert "CASE LOWER(@c3)" not in query
+    # pymysql %-formats the statement: only the four placeholders may use %
+    assert query.count("%") == 4
+    assert params[0].endswith("members.csv")
+
+
+def test_load_data_warnings_fail_the_load(tmp_path):
+    client = FakeRDSClient(
+        COLUMNS,
+        warnings=[
+            ("Note", 1265, "informational"),
+            ("Warning", 1366, "Incorrect integer value: 'yes' for column 'active' at row 2"),
+        ],
+    )
+    loader = CSVLoader(rds_client=client)
+
+    result = loader._load_via_local_infile(write_csv(tmp_path), "members", MAPPING)
+
+    assert result["rows_failed"] == 1
+    assert result["success"] is False
+    assert len(result["errors"]) == 2
+
+
+def test_load_data_without_warnings_succeeds(tmp_path):
+    client = FakeRDSClient(COLUMNS, warnings=[("Note", 1265, "informational")])
+    loader = CSVLoader(rds_client=client)
+
+    result = loader._load_via_local_infile(write_csv(tmp_path), "members", MAPPING)
+
+    assert result["rows_failed"] == 0
+    assert result["success"] is True
@@ -0,0 +1,131 @@
+"""
+Tests for DuplicateDetector's deferred hashing.
+
+Checks that files deferred by the size and sample shortcuts are read
+outside the detector lock and still match later duplicates.
+
+Run with: python -m pytest tests/storage/test_duplicate_detector.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from MBA.services.storage.duplicate_detector import DuplicateDetector
+
+
+MIB = 1 << 20
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return path
+
+
+def test_path_always_hashed_by_default(tmp_path):
+    detector = DuplicateDetector()
+    path = write(tmp_path / "a.bin", b"x" * 100)
+
+    is_dup, file_hash, dups = detector.is_duplicate(path)
+
+    assert (is_dup, dups) == (False, None)
+    assert file_hash == detector.compute_hash(path)
+
+
+def test_unique_size_skips_hashing(tmp_path):
+    detector = DuplicateDetector()
+    detector.is_duplicate(write(tmp_path / "a.bin", b"x" * 100), allow_deferred=True)
+
+    calls = []
+    detector.compute_hash = lambda source: calls.append(source)
+    result = detector.is_duplicate(
+        write(tmp_path / "b.bin", b"x" * 101), allow_deferred=True
+    )
+
+    assert result == (False, None, None)
+    assert calls == []
+    assert detector.get_cache_stats()["unhashed_files"] == 2
+
+
+def test_unique_sample_skips_full_hash(tmp_path):
+    detector = DuplicateDetector()
+    base = bytearray(2 * MIB)
+    first = write(tmp_path / "a.bin", bytes(base))
+    detector.is_duplicate(first, allow_deferred=True)
+
+    calls = []
+    detector.compute_hash = lambda source: calls.append(source)
+    # Same size; first, middle and last bytes each differ in turn
+    for i, offset in enumerate((0, MIB, 2 * MIB - 1)):
+        changed = bytearray(base)
+        changed[offset] = i + 1
+        path = write(tmp_path / f"{i}.bin", bytes(changed))
+        assert detector.is_duplicate(path, allow_deferred=True) == (False, None, None)
+
+    assert calls == []
+
+
+def test_full_hash_match(tmp_path):
+    detector = DuplicateDetector()
+    content = bytes(range(256)) * (2 * MIB // 256)
+    first = write(tmp_path / "a.bin", content)
+    # Same size and sample, differing only outside the sampled regions
+    changed = bytearray(content)
+    changed[MIB // 2] ^= 0xFF
+    near = write(tmp_path / "b.bin", bytes(changed))
+    copy = write(tmp_path / "c.bin", content)
+
+    assert detector.is_duplicate(first, allow_deferred=True) == (False, None, None)
+    is_dup, near_hash, _ = detector.is_duplicate(near, allow_deferred=True)
+    assert not is_dup and near_hash == detector.compute_hash(near)
+
+    is_dup, file_hash, dups = detector.is_duplicate(copy, allow_deferred=True)
+
+    assert is_dup and dups == [str(first)]
+    assert file_hash == detector.compute_hash(first)
+    assert detector.get_cache_stats()["unhashed_files"] == 0
+
+
+def test_deferred_file_hashed_outside_lock(tmp_path):
+    detector = DuplicateDetector()
+    first = write(tmp_path / "a.bin", b"x" * 100)
+    second = write(tmp_path / "b.bin", b"x" * 100)
+
+    # Unique size: first file is deferred without hashing
+    assert detector.is_duplicate(first, allow_deferred=True) == (False, None, None)
+
+    held = []
+    compute_hash = detector.compute_hash
+
+    def spy(source):
+        held.append(detector._lock.locked())
+        return compute_hash(source)
+
+    detector.compute_hash = spy
+    is_dup, file_hash, dups = detector.is_duplicate(second, allow_deferred=True)
+
+    assert is_dup and dups == [str(first)]
+    assert file_hash == compute_hash(first)
+    # Both the deferred file and the new one were hashed
+    assert held == [False, False]
+
+
+def test_deferred_file_sampled_outside_lock(tmp_path):
+    detector = DuplicateDetector()
+    first = write(tmp_path / "a.bin", b"\0" * (2 * MIB))
+    second = write(tmp_path / "b.bin", b"\1" * (2 * MIB))
+
+    detector.is_duplicate(first, allow_deferred=True)
+
+    held = []
+    sample_fingerprint = detector._sample_fingerprint
+
+    def spy(source, size):
+        held.append(detector._lock.locked())
+        return sample_fingerprint(source, size)
+
+    detector._sample_fingerprint = spy
+    assert detector.is_duplicate(second, allow_deferred=True) == (False, None, None)
+    assert held == [False, False]
@@ -0,0 +1,90 @@
+"""
+Tests for MemberVerificationAgent.verify_member_batch.
+
+Stubs verify_member on the instance, so neither Bedrock nor the member
+database is needed. Checks duplicate collapsing, per-input result copies
+and the concurrency bound.
+
+Run with: python -m pytest tests/verification_agent/test_verify_member_batch.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+# The agent package imports the Strands SDK at import time
+pytest.importorskip("strands")
+
+from MBA.agents.member_verification_agent.wrapper import MemberVerificationAgent
+
+
+class StubVerifier:
+    """Records calls and in-flight count; answers after yielding to the loop."""
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, member_id=None, dob=None, name=None):
+        self.calls.append({"member_id": member_id, "dob": dob, "name": name})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        return {"valid": True, "member_id": member_id, "name": name}
+
+
+def run_batch(members, **kwargs):
+    agent = MemberVerificationAgent()
+    stub = StubVerifier()
+    agent.verify_member = stub
+    results = asyncio.run(agent.verify_member_batch(members, **kwargs))
+    return results, stub
+
+
+def test_duplicates_verified_once_with_own_copies():
+    members = [
+        {"member_id": "M001", "dob": "1990-01-01"},
+        {"member_id": "M002", "dob": "1985-06-15"},
+        {"dob": "1990-01-01", "member_id": "M001"},
+        {"member_id": "M002", "dob": "1985-06-15"},
+    ]
+
+    results, stub = run_batch(members)
+
+    assert len(stub.calls) == 2
+    assert [r["member_id"] for r in results] == ["M001", "M002", "M001", "M002"]
+    # Each input owns its result: mutating one copy leaves the others alone
+    assert results[0] == results[2] and results[0] is not results[2]
+    results[0]["valid"] = False
+    assert results[2]["valid"] is True
+
+
+def test_unhashable_params_verified_separately():
+    members = [
+        {"member_id": "M001", "name": ["John", "Doe"]},
+        {"member_id": "M001", "name": ["John", "Doe"]},
+        {"member_id": "M001"},
+    ]
+
+    results, stub = run_batch(members)
+
+    assert len(stub.calls) == 3
+    assert [r["name"] for r in results] == [["John", "Doe"], ["John", "Doe"], None]
+
+
+def test_concurrency_bounded_by_semaphore():
+    members = [{"member_id": f"M{idx:03d}"} for idx in range(10)]
+
+    results, stub = run_batch(members, max_concurrency=3)
+
+    assert [r["member_id"] for r in results] == [m["member_id"] for m in members]
+    assert stub.max_in_flight == 3